@@ -0,0 +1,140 @@
+"""
+Columnar Membership Analytics
+
+Extended `ledger.py stats` works on columns instead of walking entry
+dicts: NumPy arrays of registration/activation timestamps, status and
+phase codes and voucher counts. For the current state the columns are a
+zero-copy view of the records in members.idx (see memberindex.py), so
+the cache is the member index itself and is rebuilt with it. For
+--as-of queries they are built from the materialized entries.
+
+Reports:
+  registration rate   — registrations per day/week/month bucket
+  activation latency  — registered → activated, for activated members
+  cohort retention    — per registration month: size, still active
+  phase projection    — days until the active count crosses the next
+                        phase threshold at the recent registration rate
+
+Requires NumPy (pip install numpy); plain `stats` does not.
+
+Axiom Alignment:
+  III - Understand growth without rescanning history
+"""
+
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: NumPy not installed. Run: pip install numpy")
+    sys.exit(1)
+
+from memberindex import HEADER, PHASE_CODES, STATUS_CODES, UNKNOWN
+
+
+# Matches memberindex.RECORD ("<32sBBHqqQII", no padding)
+RECORD_DTYPE = np.dtype([
+    ("cid", "S32"), ("status", "u1"), ("phase", "u1"), ("vouchers", "<u2"),
+    ("registered", "<i8"), ("activated", "<i8"), ("offset", "<u8"), ("length", "<u4"), ("ordinal", "<u4"),
+])
+
+DAY = 86400
+BUCKETS = {"day": "datetime64[D]", "week": "datetime64[W]", "month": "datetime64[M]"}
+RATE_WINDOW_DAYS = 90
+
+
+class Columns:
+    """Member attributes as parallel arrays, in ledger order."""
+
+    def __init__(self, registered, activated, status, phase, vouchers):
+        self.registered = registered
+        self.activated = activated          # -1 = never activated
+        self.status = status
+        self.phase = phase
+        self.vouchers = vouchers
+
+    def __len__(self) -> int:
+        return len(self.registered)
+
+    @classmethod
+    def from_index(cls, index) -> "Columns":
+        """Zero-copy view of an open MemberIndex's records."""
+        records = np.frombuffer(index._map, dtype=RECORD_DTYPE, count=index.count, offset=HEADER.size)
+        order = np.frombuffer(index._map, dtype="<u4", count=index.count, offset=index._order_at)
+        records = records[order]
+        return cls(records["registered"], records["activated"], records["status"],
+                   records["phase"], records["vouchers"])
+
+    @classmethod
+    def from_entries(cls, entries: list) -> "Columns":
+        return cls(
+            np.fromiter((e["registered"] for e in entries), dtype=np.int64, count=len(entries)),
+            np.fromiter((-1 if e.get("activated") is None else e["activated"] for e in entries),
+                        dtype=np.int64, count=len(entries)),
+            np.fromiter((STATUS_CODES.get(e.get("status"), UNKNOWN) for e in entries), dtype=np.uint8, count=len(entries)),
+            np.fromiter((PHASE_CODES.get(e.get("registration_phase"), UNKNOWN) for e in entries),
+                        dtype=np.uint8, count=len(entries)),
+            np.fromiter((len(e.get("vouchers") or []) for e in entries), dtype=np.uint16, count=len(entries)),
+        )
+
+
+def registration_histogram(cols: Columns, bucket: str = "month") -> list:
+    """[(bucket label, registrations)] in time order."""
+    if not len(cols):
+        return []
+    buckets = cols.registered.astype("datetime64[s]").astype(BUCKETS[bucket])
+    labels, counts = np.unique(buckets, return_counts=True)
+    return [(str(label), int(count)) for label, count in zip(labels, counts)]
+
+
+def activation_latency(cols: Columns) -> dict:
+    """Summary of activated − registered (seconds) over activated members."""
+    mask = cols.activated >= 0
+    latency = (cols.activated[mask] - cols.registered[mask]).astype(np.float64)
+    if not latency.size:
+        return {"count": 0}
+    p50, p90 = np.percentile(latency, [50, 90])
+    return {
+        "count": int(latency.size),
+        "pending": int((cols.status == STATUS_CODES["provisional"]).sum()),
+        "mean": float(latency.mean()),
+        "median": float(p50),
+        "p90": float(p90),
+        "max": float(latency.max()),
+    }
+
+
+def cohort_retention(cols: Columns) -> list:
+    """[(registration month, cohort size, still active, retention)]."""
+    if not len(cols):
+        return []
+    months = cols.registered.astype("datetime64[s]").astype("datetime64[M]")
+    labels, inverse = np.unique(months, return_inverse=True)
+    size = np.bincount(inverse, minlength=len(labels))
+    active = np.bincount(inverse, weights=(cols.status == STATUS_CODES["active"]), minlength=len(labels))
+    return [(str(label), int(n), int(a), float(a / n)) for label, n, a in zip(labels, size, active)]
+
+
+def phase_projection(cols: Columns, thresholds: dict, now: int = None) -> dict:
+    """Days until the active count crosses each remaining phase threshold.
+
+    The rate is registrations per day over the last RATE_WINDOW_DAYS; this
+    assumes recent registrants become active at the same pace.
+    """
+    now = int(time.time()) if now is None else now
+    active = int((cols.status == STATUS_CODES["active"]).sum())
+    recent = int((cols.registered >= now - RATE_WINDOW_DAYS * DAY).sum())
+    rate = recent / RATE_WINDOW_DAYS
+    projections = {}
+    for phase, threshold in sorted(thresholds.items(), key=lambda kv: kv[1]):
+        if active >= threshold:
+            continue
+        days = (threshold - active) / rate if rate else None
+        projections[phase] = {
+            "threshold": threshold,
+            "needed": threshold - active,
+            "days": days,
+            "date": time.strftime("%Y-%m-%d", time.gmtime(now + days * DAY)) if days is not None else None,
+        }
+    return {"active": active, "rate_per_day": rate, "window_days": RATE_WINDOW_DAYS, "phases": projections}
@@ -0,0 +1,207 @@
+"""
+Secret Ballots
+
+Vote files carry an `encrypted_vote` field for secret ballots. A sealed
+ballot leaves `vote_content` null and instead holds:
+
+  "encrypted_vote": {
+    "scheme": "x25519-sealedbox",
+    "election_key": "<SHA-256 of the election public key, hex>",
+    "ciphertext": "<base64 crypto_box_seal(canonical {"nonce", "vote_content"})>"
+  },
+  "commitment": {"vote_hash": "<SHA-256(nonce || canonical vote_content)>"}
+
+The nonce travels inside the sealed box, never in the public commitment:
+with only three choices, a public nonce would let anyone recover a
+ballot by hashing each candidate content. A decrypted ballot is bound to
+the content the voter committed to (and signed, since the signatures
+cover the ciphertext and commitment). The election key pair is created once per election with
+`ledger.py election-key` and its public half published with the
+proposal; the secret half stays with the talliers until votes close.
+
+`ledger.py decrypt-tally` first checks a proposal's vote files (flat or
+sharded) exactly as `ledger.py tally` does (tally.check_proposal_votes:
+proposal, eligibility, ledger keys, voting window, signatures, one vote
+per voter). Only the ballots tally accepts are streamed to worker
+processes in chunks; the rest are reported with tally's reasons. Each
+worker opens the election key once, decrypts and checks its chunk, and
+returns only counts and rejection reasons, so no plaintext ballot
+outlives its chunk.
+
+Axiom Alignment:
+  II  - Ballot secrecy until the count
+  V   - Every decrypted ballot must match its public commitment
+"""
+
+import base64
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from tally import VOTE_CHOICES, check_proposal_votes, commitment_hash, decide, thresholds_for
+
+
+BALLOT_SCHEME = "x25519-sealedbox"
+POOL_CHUNK = 256
+SECRET_FILE_PERMISSIONS = 0o600
+
+
+# ─── Election Keys ───────────────────────────────────────────────────────────
+
+def key_fingerprint(public_key: bytes) -> str:
+    return hashlib.sha256(public_key).hexdigest()
+
+
+def generate_election_key(output: Path) -> dict:
+    """Write a new election key pair to `output` (mode 0600). Returns its public part."""
+    from nacl.public import PrivateKey
+    secret = PrivateKey.generate()
+    public = bytes(secret.public_key)
+    record = {
+        "scheme": BALLOT_SCHEME,
+        "fingerprint": key_fingerprint(public),
+        "public_key": base64.b64encode(public).decode("ascii"),
+        "secret_key": base64.b64encode(bytes(secret)).decode("ascii"),
+    }
+    fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_EXCL, SECRET_FILE_PERMISSIONS)
+    with os.fdopen(fd, "w") as f:
+        f.write(json.dumps(record, indent=2) + "\n")
+    return {k: record[k] for k in ("scheme", "fingerprint", "public_key")}
+
+
+def load_election_key(path: Path) -> dict:
+    record = json.loads(Path(path).read_text())
+    if record.get("scheme") != BALLOT_SCHEME or not record.get("secret_key"):
+        raise ValueError(f"Not a {BALLOT_SCHEME} election secret key file")
+    return record
+
+
+def seal_ballot(vote_content: dict, nonce: str, public_key_b64: str) -> dict:
+    """The encrypted_vote object for `vote_content` and its commitment nonce (what a voting client produces).
+
+    The vote's public commitment then carries only vote_hash.
+    """
+    from nacl.public import PublicKey, SealedBox
+    from ledger import canonical_json
+    public = base64.b64decode(public_key_b64)
+    plaintext = canonical_json({"nonce": nonce, "vote_content": vote_content})
+    return {
+        "scheme": BALLOT_SCHEME,
+        "election_key": key_fingerprint(public),
+        "ciphertext": base64.b64encode(SealedBox(PublicKey(public)).encrypt(plaintext)).decode("ascii"),
+    }
+
+
+# ─── Worker ──────────────────────────────────────────────────────────────────
+
+_box = None
+_fingerprint = None
+
+
+def _init_worker(secret_key_b64: str):
+    """Open the election key once per worker process."""
+    global _box, _fingerprint
+    from nacl.public import PrivateKey, SealedBox
+    secret = PrivateKey(base64.b64decode(secret_key_b64))
+    _box = SealedBox(secret)
+    _fingerprint = key_fingerprint(bytes(secret.public_key))
+
+
+def open_ballot(vote: dict) -> tuple:
+    """(choice, sealed, reason) for one vote; reason is None when it counts."""
+    commitment = vote.get("commitment") or {}
+    sealed = vote.get("encrypted_vote")
+    if sealed is None:
+        content, nonce = vote.get("vote_content"), commitment.get("nonce")
+    else:
+        if not isinstance(sealed, dict) or sealed.get("scheme") != BALLOT_SCHEME:
+            return None, True, f"Unsupported ballot scheme: {(sealed or {}).get('scheme')!r}"
+        if sealed.get("election_key") != _fingerprint:
+            return None, True, "Sealed to a different election key"
+        if "nonce" in commitment:
+            return None, True, "Sealed ballot publishes its commitment nonce"
+        try:
+            opened = json.loads(_box.decrypt(base64.b64decode(sealed["ciphertext"])))
+            content, nonce = opened["vote_content"], opened["nonce"]
+        except Exception:
+            return None, True, "Ballot does not decrypt with the election key"
+    if not isinstance(content, dict) or content.get("choice") not in VOTE_CHOICES:
+        return None, sealed is not None, f"Unknown choice: {(content or {}).get('choice')!r}"
+    if not isinstance(nonce, str) or not nonce or not nonce.isascii() or \
+            commitment_hash(nonce, content) != commitment.get("vote_hash"):
+        return None, sealed is not None, "Ballot does not match its commitment"
+    return content["choice"], sealed is not None, None
+
+
+def process_chunk(paths: list) -> dict:
+    """Decrypt and check a chunk of vote files. Returns counts only, never plaintext."""
+    counts = {choice: 0 for choice in VOTE_CHOICES}
+    result = {"counts": counts, "sealed": 0, "open": 0, "rejected": []}
+    for path in paths:
+        try:
+            vote = json.loads(Path(path).read_bytes())
+        except (OSError, ValueError) as e:
+            result["rejected"].append((Path(path).name, f"Unreadable vote: {e}"))
+            continue
+        choice, sealed, reason = open_ballot(vote)
+        if reason:
+            result["rejected"].append((Path(path).name, reason))
+            continue
+        counts[choice] += 1
+        result["sealed" if sealed else "open"] += 1
+    return result
+
+
+# ─── Stage ───────────────────────────────────────────────────────────────────
+
+def decrypt_tally(ledger_dir: Path, proposals_dir: Path, votes_dir: Path, proposal_id: str,
+                  election_key: dict, workers: int = None) -> dict:
+    """Check a proposal's votes as tally does, then decrypt and count the accepted ballots in worker processes."""
+    job, records = check_proposal_votes(ledger_dir, proposals_dir, votes_dir, proposal_id, workers=workers)
+    if job is None:
+        raise ValueError(f"{proposal_id} is not in the proposal registry")
+    workers = workers or os.cpu_count() or 1
+    totals = {"tally": {choice: 0 for choice in VOTE_CHOICES}, "sealed": 0, "open": 0,
+              "rejected": [(r["file"], "; ".join(r["reasons"])) for r in records if r["reasons"]],
+              "eligible_voters": len(job["eligible"])}
+
+    def merge(partial):
+        for choice, n in partial["counts"].items():
+            totals["tally"][choice] += n
+        totals["sealed"] += partial["sealed"]
+        totals["open"] += partial["open"]
+        totals["rejected"].extend(partial["rejected"])
+
+    paths = [str(job["dir"] / r["file"]) for r in records if not r["reasons"]]
+    if workers == 1:
+        _init_worker(election_key["secret_key"])
+        chunk = []
+        for path in paths:
+            chunk.append(path)
+            if len(chunk) == POOL_CHUNK:
+                merge(process_chunk(chunk))
+                chunk = []
+        merge(process_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(election_key["secret_key"],)) as pool:
+            in_flight, chunk = [], []
+            for path in paths:
+                chunk.append(path)
+                if len(chunk) == POOL_CHUNK:
+                    in_flight.append(pool.submit(process_chunk, chunk))
+                    chunk = []
+                    if len(in_flight) >= 2 * workers:
+                        merge(in_flight.pop(0).result())
+            if chunk:
+                in_flight.append(pool.submit(process_chunk, chunk))
+            for future in in_flight:
+                merge(future.result())
+
+    totals["tally"]["total_cast"] = sum(totals["tally"][c] for c in VOTE_CHOICES)
+    totals["rejected"].sort()
+    if totals["eligible_voters"]:
+        totals.update(decide(totals["tally"], totals["eligible_voters"], thresholds_for(job["proposal"])))
+    return totals
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Canonical JSON Throughput Benchmark
+
+Measures canonicalization and SHA-256 hashing throughput (MB/s) and peak
+Python memory for governance-shaped documents of increasing size:
+
+  ledger    — a ledger entries array (each entry carries a ~2.6 KB base64
+              ML-DSA-65 public key), hashed as compute_ledger_hash() does
+  votes     — an array of vote files (public keys + ~4.4 KB ML-DSA signature)
+  proposal  — a single proposal whose full_text grows
+
+For each document it compares the one-shot path (canonical_json() then
+sha256) with the chunked iter_canonical() path, which never materializes
+the full serialized string.
+
+Usage:
+  python bench_canonical.py                          # default size ladder
+  python bench_canonical.py --shape ledger --sizes 1000,10000,100000
+  python bench_canonical.py --repeat 5
+
+Axiom Alignment:
+  V - Adversarial Resilience: know the cost of integrity at scale
+"""
+
+import argparse
+import base64
+import gc
+import hashlib
+import os
+import random
+import time
+import tracemalloc
+
+from ledger import canonical_json, iter_canonical
+
+
+# ─── Synthetic Documents ──────────────────────────────────────────────────────
+
+ML_DSA_65_PUBLIC_BYTES = 1952
+ML_DSA_65_SIGNATURE_BYTES = 3309
+
+
+def _b64(n: int) -> str:
+    return base64.b64encode(os.urandom(n)).decode("ascii")
+
+
+def ledger_entry(i: int) -> dict:
+    cid = hashlib.sha256(i.to_bytes(8, "big")).hexdigest()
+    return {
+        "cid_hash": cid,
+        "cid_version": 1,
+        "registered": 1770060729 + i * 60,
+        "activated": 1770060729 + i * 60,
+        "registration_phase": "stable",
+        "public_keys": {"ml_dsa_65": _b64(ML_DSA_65_PUBLIC_BYTES), "ed25519": _b64(32)},
+        "algorithms": {"post_quantum": "ML-DSA-65", "classical": "Ed25519"},
+        "vouchers": [hashlib.sha256(bytes([j])).hexdigest() for j in range(3)],
+        "status": "active",
+        "last_governance_action": None,
+        "registration_block": None,
+        "previous_ledger_hash": cid,
+        "entry_hash": cid,
+    }
+
+
+def vote_file(i: int) -> dict:
+    cid = hashlib.sha256(i.to_bytes(8, "big")).hexdigest()
+    return {
+        "commitment": {"nonce": os.urandom(32).hex(), "vote_hash": os.urandom(32).hex()},
+        "encrypted_vote": None,
+        "proposal_id": "BENCH-001",
+        "public_keys": {"ml_dsa_65": _b64(ML_DSA_65_PUBLIC_BYTES), "ed25519": _b64(32)},
+        "schema_version": 1,
+        "signatures": {"voter_ed25519": _b64(64), "voter_ml_dsa_65": _b64(ML_DSA_65_SIGNATURE_BYTES)},
+        "timestamp": 1770120764 + i,
+        "vote_content": {"choice": random.choice(("approve", "reject", "abstain")), "reasoning": "x" * 80},
+        "voter_cid_hash": cid,
+    }
+
+
+def proposal(size: int) -> dict:
+    words = ["consciousness", "covenant", "axiom", "entropy", "sovereignty", "résilience", "🌱"]
+    text = " ".join(random.choice(words) for _ in range(size))
+    return {
+        "schema_version": 1,
+        "proposal_id": "BENCH-001",
+        "title": "Benchmark proposal",
+        "category": "procedural",
+        "content": {
+            "full_text": text,
+            "axiom_alignment": {f"axiom_{n}": text[:200] for n in ("i", "ii", "iii", "iv", "v")},
+        },
+        "thresholds": {"passage": 0.5, "quorum": 0.25, "engagement_minimum": 0.382},
+    }
+
+
+SHAPES = {
+    # name: (builder(size) -> document, default size ladder, size unit)
+    "ledger": (lambda n: [ledger_entry(i) for i in range(n)], [10, 100, 1000, 10000], "entries"),
+    "votes": (lambda n: [vote_file(i) for i in range(n)], [10, 100, 1000, 10000], "votes"),
+    "proposal": (proposal, [1000, 10000, 100000, 1000000], "words"),
+}
+
+
+# ─── Measurement ──────────────────────────────────────────────────────────────
+
+def one_shot_hash(doc) -> str:
+    return hashlib.sha256(canonical_json(doc)).hexdigest()
+
+
+def chunked_hash(doc) -> str:
+    h = hashlib.sha256()
+    for chunk in iter_canonical(doc):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def measure(fn, doc, repeat: int):
+    """Best-of-`repeat` wall time, plus peak traced allocation of one run."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn(doc)
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    fn(doc)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Canonical JSON throughput benchmark")
+    parser.add_argument("--shape", choices=sorted(SHAPES), action="append",
+                        help="Document shape (repeatable; default: all)")
+    parser.add_argument("--sizes", help="Comma-separated size ladder (overrides defaults)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Canonical JSON Throughput Benchmark")
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  {'shape':<9} {'size':>9}  {'bytes':>10}  {'encode':>9}  {'hash':>9}  {'chunked':>9}  {'peak full':>10}  {'peak chunk':>10}")
+
+    for name in args.shape or sorted(SHAPES):
+        build, ladder, unit = SHAPES[name]
+        sizes = [int(s) for s in args.sizes.split(",")] if args.sizes else ladder
+        for size in sizes:
+            doc = build(size)
+            encoded, t_encode, _ = measure(canonical_json, doc, args.repeat)
+            nbytes = len(encoded)
+            del encoded
+            full, t_full, peak_full = measure(one_shot_hash, doc, args.repeat)
+            chunked, t_chunked, peak_chunked = measure(chunked_hash, doc, args.repeat)
+            assert full == chunked, f"chunked hash differs for {name}/{size}"
+
+            mb = nbytes / 1e6
+            print(f"  {name:<9} {size:>9,}  {mb:>8.2f}MB  {mb / t_encode:>6.0f}MB/s  {mb / t_full:>6.0f}MB/s"
+                  f"  {mb / t_chunked:>6.0f}MB/s  {peak_full / 1e6:>8.2f}MB  {peak_chunked / 1e6:>8.2f}MB")
+            del doc
+
+    print()
+    print("  encode = canonical_json(); hash = canonical_json() + SHA-256;")
+    print("  chunked = iter_canonical() + SHA-256 (compute_ledger_hash path)")
+    print("═══════════════════════════════════════════════════════════════")
+
+
+if __name__ == "__main__":
+    main()
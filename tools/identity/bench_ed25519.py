@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Ed25519 Bulk Verification Benchmark
+
+Compares the per-item loop used by dual_verify() (a fresh VerifyKey and
+verify() call per signature) against batch_verify_ed25519() on a batch of
+vote-shaped messages, with a fraction of signatures deliberately corrupted.
+Both paths must agree item-for-item before any timing is reported.
+
+Usage:
+  python bench_ed25519.py                       # 2,000 signatures, 1% bad
+  python bench_ed25519.py --count 20000 --bad 0.05 --workers 8
+
+Axiom Alignment:
+  V - Adversarial Resilience: measure before trusting a fast path
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import sys
+import time
+
+from nacl.signing import SigningKey, VerifyKey
+from nacl.encoding import RawEncoder
+
+from keygen import batch_verify_ed25519
+
+
+def make_batch(count: int, bad_ratio: float, voters: int) -> list:
+    """Build (message, signature_b64, public_key_b64) items from `voters` keys."""
+    keys = [SigningKey.generate() for _ in range(voters)]
+    items = []
+    for i in range(count):
+        sk = keys[i % voters]
+        message = json.dumps({
+            "proposal_id": f"BENCH-{i // voters:03d}",
+            "vote_content": {"choice": "approve", "reasoning": "x" * 64},
+            "timestamp": 1770120764 + i,
+        }, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        signature = sk.sign(message).signature
+        if random.random() < bad_ratio:
+            signature = bytes([signature[0] ^ 0x01]) + signature[1:]
+        items.append((
+            message,
+            base64.b64encode(signature).decode("ascii"),
+            base64.b64encode(sk.verify_key.encode(encoder=RawEncoder)).decode("ascii"),
+        ))
+    return items
+
+
+def per_item_loop(items: list) -> list:
+    """The dual_verify() Ed25519 path, one signature at a time."""
+    results = []
+    for message, signature_b64, public_key_b64 in items:
+        try:
+            vk = VerifyKey(base64.b64decode(public_key_b64), encoder=RawEncoder)
+            vk.verify(message, base64.b64decode(signature_b64))
+            results.append(True)
+        except Exception:
+            results.append(False)
+    return results
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ed25519 bulk verification benchmark")
+    parser.add_argument("--count", type=int, default=2000, help="Signatures per batch")
+    parser.add_argument("--bad", type=float, default=0.01, help="Fraction of corrupted signatures")
+    parser.add_argument("--voters", type=int, default=200, help="Distinct signing keys")
+    parser.add_argument("--workers", type=int, default=None, help="Threads (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    items = make_batch(args.count, args.bad, args.voters)
+
+    baseline, t_loop = timed(per_item_loop, items)
+    batched, t_batch = timed(batch_verify_ed25519, items, max_workers=args.workers)
+
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Ed25519 Bulk Verification Benchmark")
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Signatures:     {len(items):,}  ({baseline.count(False):,} invalid)")
+    print(f"  Workers:        {args.workers or os.cpu_count()}")
+    print(f"  Per-item loop:  {t_loop * 1000:8.1f} ms  ({len(items) / t_loop:,.0f} sig/s)")
+    print(f"  Batch verify:   {t_batch * 1000:8.1f} ms  ({len(items) / t_batch:,.0f} sig/s)")
+    print(f"  Speedup:        {t_loop / t_batch:.2f}x")
+
+    if baseline != batched:
+        print("  ❌ Batch results differ from the per-item loop!")
+        print("═══════════════════════════════════════════════════════════════")
+        sys.exit(1)
+    print("  ✅ Batch results identical to the per-item loop")
+    print("═══════════════════════════════════════════════════════════════")
+
+
+if __name__ == "__main__":
+    main()
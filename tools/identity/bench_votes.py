@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Vote Directory Layout Benchmark
+
+Builds one proposal's worth of vote files (default 50,000) in the flat
+layout and in each sharded layout (see votestore.py), then times the
+operations that degrade as a flat directory grows:
+
+  enumerate   — every vote file (tally, export-sqlite, pack-keys)
+  list dir    — listing the directory a new vote lands in (ls, glob, review)
+  recount     — metrics' cached vote count after one new vote arrives
+  git tree    — bytes of tree objects git rewrites to record that vote
+
+All layouts must enumerate exactly the same CIDs before timings are shown.
+
+Usage:
+  python bench_votes.py                     # 50,000 votes
+  python bench_votes.py --count 200000 --repeat 5
+
+Axiom Alignment:
+  III - Measure before restructuring
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from votestore import count_vote_files, iter_vote_files, migrate, shard_parts
+
+
+VOTE_BYTES = 512                      # placeholder content; only names and counts matter here
+GIT_TREE_ENTRY_OVERHEAD = 1 + 1 + 20  # space, NUL, binary object id
+
+
+def build(proposal_dir: Path, count: int):
+    proposal_dir.mkdir(parents=True)
+    body = b"{" + b" " * (VOTE_BYTES - 2) + b"}"
+    for i in range(count):
+        cid = hashlib.sha256(i.to_bytes(8, "big")).hexdigest()
+        (proposal_dir / f"{cid}.json").write_bytes(body)
+
+
+def best_of(repeat: int, fn, *args):
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return out, best
+
+
+def git_tree_bytes(proposal_dir: Path, cid: str, depth: int) -> int:
+    """Size of the tree objects on the path from the proposal directory to a vote."""
+    total, path = 0, proposal_dir
+    for part in [None] + shard_parts(cid, depth):
+        path = path / part if part else path
+        total += sum(len("100644" if e.is_file() else "40000") + len(e.name) + GIT_TREE_ENTRY_OVERHEAD
+                     for e in os.scandir(path))
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vote directory layout benchmark")
+    parser.add_argument("--count", type=int, default=50000, help="Vote files per proposal")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    parser.add_argument("--dir", help="Scratch directory (default: a temporary directory)")
+    args = parser.parse_args()
+
+    scratch = Path(args.dir) if args.dir else Path(tempfile.mkdtemp(prefix="bench-votes-"))
+    new_cid = hashlib.sha256(b"new vote").hexdigest()
+    rows = []
+    expected = None
+    try:
+        base = scratch / "flat"
+        build(base, args.count)
+        for depth in (0, 1, 2):
+            proposal_dir = scratch / f"depth{depth}"
+            shutil.copytree(base, proposal_dir)
+            migrate(proposal_dir, depth)
+
+            names, t_enum = best_of(args.repeat, lambda: sorted(p.name for p in iter_vote_files(proposal_dir)))
+            if expected is None:
+                expected = names
+            elif names != expected:
+                print(f"  ❌ depth {depth} enumerates different votes than the flat layout!")
+                sys.exit(1)
+
+            landing = proposal_dir.joinpath(*shard_parts(new_cid, depth))
+            landing.mkdir(parents=True, exist_ok=True)
+            _, t_list = best_of(args.repeat, os.listdir, landing)
+
+            _, cache = count_vote_files(proposal_dir)
+            (landing / f"{new_cid}.json").write_bytes(b"{}")
+            (recounted, _), t_recount = best_of(args.repeat, count_vote_files, proposal_dir, cache)
+            if recounted != args.count + 1:
+                print(f"  ❌ depth {depth} recount found {recounted:,} votes, expected {args.count + 1:,}")
+                sys.exit(1)
+
+            rows.append((depth, len(os.listdir(landing)), t_enum, t_list, t_recount,
+                         git_tree_bytes(proposal_dir, new_cid, depth)))
+    finally:
+        if not args.dir:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Vote Directory Layout Benchmark")
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Votes:          {args.count:,}  (best of {args.repeat})")
+    print(f"  {'Layout':<18}{'dir size':>9}{'enumerate':>11}{'list dir':>10}{'recount':>10}{'git tree':>11}")
+    for depth, dir_size, t_enum, t_list, t_recount, tree in rows:
+        layout = "flat" if depth == 0 else "/".join(["ab", "cd"][:depth]) + "/<cid>"
+        print(f"  {layout:<18}{dir_size:>9,}{t_enum * 1000:>9.1f}ms{t_list * 1000:>8.2f}ms"
+              f"{t_recount * 1000:>8.2f}ms{tree / 1024:>9.1f}KB")
+    print("  ✅ All layouts enumerate the same votes")
+    print("═══════════════════════════════════════════════════════════════")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Signed Verification Checkpoints
+
+A full `ledger.py verify` re-hashes the chain from entry #1. A checkpoint
+records that the chain up to some entry was verified, and is dual-signed
+(ML-DSA-65 + Ed25519, see keygen.dual_sign) by a steward identity:
+
+  governance/ledger/checkpoints/
+    checkpoint-<entry_index>.json  — {"checkpoint": {...}, "signatures": {...}}
+
+Checkpoint fields:
+  entry_index       — number of entries covered
+  ledger_hash       — compute_ledger_hash(entries[:entry_index])
+  last_entry_hash   — entry_hash of the last covered entry
+  event_seq, event_hash, event_log_offset — head of the mutation log
+  steward_cid, created_at
+
+`verify --since-checkpoint` checks the signature, then validates only the
+entries and events added since. hashlib cannot save a running digest, so
+the covered prefix is still streamed through SHA-256 once to continue the
+chain, and must reproduce the signed ledger_hash; its entry hashes, chain
+links, CIDs and events are not re-checked one by one. (Version 1
+checkpoints also carried a SHA-256 midstate; it is ignored.)
+
+Trusted steward CIDs are pinned by the verifier (`--stewards`), never
+read from the ledger being verified, and the signer's ledger entry must
+hash to that CID (compute_cid) before its keys are used.
+
+Since the covered prefix is trusted, run a full verify periodically (and
+before signing a first checkpoint).
+
+Axiom Alignment:
+  V - Adversarial Resilience: trust is explicit, signed and attributable
+"""
+
+import json
+import time
+from pathlib import Path
+
+from ledger import canonical_json, chain_hasher, compute_cid
+from profiling import span
+
+
+CHECKPOINTS_DIR = "checkpoints"
+CHECKPOINT_VERSION = 2
+
+
+# ─── Chain Resumption ────────────────────────────────────────────────────────
+
+def resume_chain(body: dict, entries: list):
+    """chain_hasher() over the entries a checkpoint covers, checked against its ledger_hash.
+
+    Raises ValueError if the covered entries no longer hash to it.
+    """
+    index = body["entry_index"]
+    with span("checkpoint.prefix"):
+        hasher = chain_hasher(entries[:index])
+    closed = hasher.copy()
+    closed.update(b"]")
+    if closed.hexdigest() != body.get("ledger_hash"):
+        raise ValueError(f"Entries #1-#{index} do not hash to the checkpoint's ledger_hash")
+    return hasher
+
+
+# ─── Checkpoints ─────────────────────────────────────────────────────────────
+
+def checkpoint_paths(ledger_dir: Path) -> list:
+    cp_dir = ledger_dir / CHECKPOINTS_DIR
+    if not cp_dir.exists():
+        return []
+    return sorted(cp_dir.glob("checkpoint-*.json"), key=lambda p: int(p.stem.split("-")[1]))
+
+
+def load_latest_checkpoint(ledger_dir: Path):
+    paths = checkpoint_paths(ledger_dir)
+    return json.loads(paths[-1].read_text()) if paths else None
+
+
+def build_checkpoint(entries: list, ledger_hash: str, head_event: dict, log_offset: int,
+                     steward_cid: str) -> dict:
+    """Checkpoint body for all of `entries`, whose verified chain hash is `ledger_hash`."""
+    return {
+        "version": CHECKPOINT_VERSION,
+        "entry_index": len(entries),
+        "ledger_hash": ledger_hash,
+        "last_entry_hash": entries[-1]["entry_hash"] if entries else None,
+        "event_seq": head_event["seq"] if head_event else 0,
+        "event_hash": head_event["event_hash"] if head_event else None,
+        "event_log_offset": log_offset,
+        "steward_cid": steward_cid,
+        "created_at": int(time.time()),
+    }
+
+
+def sign_checkpoint(body: dict, secret_keys: dict) -> dict:
+    from keygen import dual_sign
+    return {"checkpoint": body, "signatures": dual_sign(canonical_json(body), secret_keys)}
+
+
+def write_checkpoint(ledger_dir: Path, signed: dict) -> Path:
+    cp_dir = ledger_dir / CHECKPOINTS_DIR
+    cp_dir.mkdir(parents=True, exist_ok=True)
+    path = cp_dir / f"checkpoint-{signed['checkpoint']['entry_index']:08d}.json"
+    path.write_text(json.dumps(signed, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def verify_checkpoint(signed: dict, entries: list, trusted_stewards: set) -> list:
+    """Check a checkpoint's signer, signatures and anchoring. Returns errors."""
+    body = signed.get("checkpoint", {})
+    index = body.get("entry_index", -1)
+    steward = body.get("steward_cid")
+
+    if steward not in trusted_stewards:
+        return [f"Checkpoint signed by untrusted identity: {str(steward)[:16]}..."]
+    if not 0 <= index <= len(entries):
+        return [f"Checkpoint covers {index} entries but the ledger has {len(entries)}"]
+    signer = next((e for e in entries[:index] if e["cid_hash"] == steward), None)
+    if signer is None:
+        return [f"Checkpoint steward {steward[:16]}... is not in the covered ledger"]
+    try:
+        signer_cid = compute_cid(signer["public_keys"])
+    except (KeyError, TypeError, ValueError):
+        signer_cid = None
+    if signer_cid != steward:
+        return [f"Checkpoint steward {steward[:16]}... does not match its ledger public keys"]
+
+    errors = []
+    from keygen import dual_verify
+    results = dual_verify(canonical_json(body), signed.get("signatures", {}), signer["public_keys"])
+    if not results["both_valid"]:
+        errors.append("Checkpoint signature invalid")
+    if index and entries[index - 1].get("entry_hash") != body.get("last_entry_hash"):
+        errors.append(f"Entry #{index} does not match the checkpoint")
+    return errors
@@ -0,0 +1,238 @@
+"""
+Compact Ledger Entries
+
+load_ledger() turns every entry into a dict holding its full base64
+public keys — several kilobytes of Python objects per member, most of it
+never looked at by verify, checkpoints or --as-of queries. With
+`ledger.py --compact` those read-only commands load entries as
+CompactEntry records instead:
+
+  - fixed fields (cid_hash, status, phase, timestamps, vouchers, hashes)
+    live in __slots__; status and phase strings are interned, voucher
+    CIDs share the string of the member they name, and well-formed hashes
+    are held as 32 raw bytes
+  - everything else (public_keys, algorithms, public_keys_ref, unknown
+    fields) stays in ledger.json: each record keeps the byte offset and
+    length of its entry in a shared read-only mmap and re-parses that
+    span when such a field is asked for
+
+ledger.json is decoded one entry at a time through a sliding window over
+the mmap, so the whole file is never held as a string either.
+
+A CompactEntry is a read-only Mapping that materializes to exactly the
+dict load_ledger() would have produced (same keys, same order, keys
+resolved from the key store), so hashes and printed output are identical.
+`entry | state` returns an updated CompactEntry, as events.members_view()
+uses it; canonical_json() serializes records through to_dict().
+
+Axiom Alignment:
+  III - Memory proportional to what a command actually reads
+"""
+
+import json
+import mmap
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+
+from profiling import span
+
+
+SLOT_FIELDS = ("cid_hash", "cid_version", "registered", "activated", "registration_phase", "status",
+               "vouchers", "last_governance_action", "registration_block", "previous_ledger_hash", "entry_hash")
+HASH_FIELDS = frozenset(("previous_ledger_hash", "entry_hash"))
+INTERNED_FIELDS = frozenset(("registration_phase", "status"))
+WINDOW = 1 << 20
+_HEX = frozenset("0123456789abcdef")
+_MISSING = object()
+
+
+class _Source:
+    """The mmap'd ledger.json and key store shared by every record of one load."""
+
+    __slots__ = ("map", "store")
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.store = None
+
+    def load(self, offset: int, length: int) -> dict:
+        entry = json.loads(self.map[offset:offset + length])
+        return self.store.resolve(entry) if self.store else entry
+
+
+def _pack_hash(value):
+    if isinstance(value, str) and len(value) == 64 and _HEX.issuperset(value):
+        return bytes.fromhex(value)
+    return value
+
+
+def _unpack(field: str, value):
+    if field in HASH_FIELDS and isinstance(value, bytes):
+        return value.hex()
+    if field == "vouchers" and isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+class CompactEntry(Mapping):
+    """One ledger entry: hot fields in slots, the rest read back from ledger.json on demand."""
+
+    __slots__ = SLOT_FIELDS + ("_keys", "_source", "_offset", "_length")
+
+    def __getitem__(self, key):
+        if key in SLOT_FIELDS:
+            value = getattr(self, key)
+            if value is _MISSING:
+                raise KeyError(key)
+            return _unpack(key, value)
+        if key not in self._keys:
+            raise KeyError(key)
+        return self._source.load(self._offset, self._length)[key]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def items(self):
+        return self.to_dict().items()
+
+    def values(self):
+        return self.to_dict().values()
+
+    def to_dict(self) -> dict:
+        """The full entry as load_ledger() returns it (plus any applied state)."""
+        entry = self._source.load(self._offset, self._length)
+        for field in SLOT_FIELDS:
+            value = getattr(self, field)
+            if value is not _MISSING:
+                entry[field] = _unpack(field, value)
+        return entry
+
+    def __or__(self, other):
+        """Like dict `|`: a copy with `other`'s fields applied."""
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if not all(k in SLOT_FIELDS for k in other):
+            return self.to_dict() | dict(other)
+        copy = CompactEntry.__new__(CompactEntry)
+        for name in CompactEntry.__slots__:
+            setattr(copy, name, getattr(self, name))
+        for key, value in other.items():
+            if key == "vouchers" and value is not None:
+                value = tuple(value)
+            setattr(copy, key, _pack_hash(value) if key in HASH_FIELDS else value)
+        new_keys = tuple(k for k in other if k not in self._keys)
+        if new_keys:
+            copy._keys = self._keys + new_keys
+        return copy
+
+    def __eq__(self, other):
+        return isinstance(other, Mapping) and self.to_dict() == dict(other.items())
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"CompactEntry({self['cid_hash'][:16]}..., status={self.get('status')!r})"
+
+
+def entries_start(buf) -> int:
+    """Byte offset just past the `[` of the entries array in a ledger.json buffer."""
+    return buf.find(b"[", buf.find(b'"entries"')) + 1
+
+
+def ledger_meta(buf, entries_end: int) -> dict:
+    """The top-level fields of a ledger.json buffer (entries array emptied).
+
+    `entries_end` is any offset inside the array after its last entry.
+    """
+    close = buf.find(b"]", entries_end) + 1
+    return json.loads(buf[:entries_start(buf)] + b"]" + buf[close:])
+
+
+def iter_entries(buf, start: int = None):
+    """Yield (byte offset, byte length, entry dict) for each entry in a ledger.json buffer.
+
+    Entries are decoded from a sliding window over `buf`, so at most one
+    window of text is alive at a time, whatever the size of the file.
+    `start` resumes at a byte offset between two entries of the array.
+    """
+    decoder = json.JSONDecoder()
+    start = entries_start(buf) if start is None else start
+    size = len(buf)
+    window = WINDOW
+    while True:
+        end = min(start + window, size)
+        while end < size and buf[end] & 0xC0 == 0x80:     # never split a UTF-8 sequence
+            end -= 1
+        text = buf[start:end].decode("utf-8")
+        ascii_only = text.isascii()
+        pos = consumed = 0
+        while True:
+            while pos < len(text) and text[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(text) and text[pos] == "]":
+                return
+            try:
+                entry, stop = decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                if end == size:
+                    raise
+                break                                       # entry runs past the window
+            if ascii_only:
+                offset, length = start + pos, stop - pos
+            else:
+                offset = start + len(text[:pos].encode("utf-8"))
+                length = len(text[pos:stop].encode("utf-8"))
+            yield offset, length, entry
+            pos = consumed = stop
+        if consumed:
+            start += consumed if ascii_only else len(text[:consumed].encode("utf-8"))
+            window = WINDOW
+        else:
+            window *= 2                                     # entry larger than the window
+
+
+def load_compact(ledger_dir: Path, resolve_keys: bool = True) -> dict:
+    """ledger.json as load_ledger() returns it, with CompactEntry records as entries."""
+    from ledger import key_store_for
+
+    source = _Source(ledger_dir / "ledger.json")
+    cids, key_tuples = {}, {}
+    entries = []
+    end = entries_start(source.map)
+    with span("ledger.load_compact"):
+        for offset, length, raw in iter_entries(source.map):
+            record = CompactEntry.__new__(CompactEntry)
+            keys = tuple(raw)
+            record._keys = key_tuples.setdefault(keys, keys)
+            record._source, record._offset, record._length = source, offset, length
+            for field in SLOT_FIELDS:
+                value = raw.get(field, _MISSING)
+                if field == "cid_hash" and isinstance(value, str):
+                    value = cids.setdefault(value, value)
+                elif field == "vouchers" and isinstance(value, list):
+                    value = tuple(cids.setdefault(v, v) if isinstance(v, str) else v for v in value)
+                elif field in INTERNED_FIELDS and isinstance(value, str):
+                    value = sys.intern(value)
+                elif field in HASH_FIELDS:
+                    value = _pack_hash(value)
+                setattr(record, field, value)
+            entries.append(record)
+            end = offset + length
+
+    ledger = ledger_meta(source.map, end)
+    store = key_store_for(ledger_dir, ledger)
+    if store and resolve_keys:
+        source.store = store
+        resolved = {keys: tuple("public_keys" if k == "public_keys_ref" else k for k in keys) for keys in key_tuples}
+        for record in entries:
+            record._keys = resolved[record._keys]
+    ledger["entries"] = entries
+    return ledger
@@ -0,0 +1,335 @@
+"""
+Ledger Mutation Log
+
+Registration entries in ledger.json are immutable once appended: their
+entry_hash and previous_ledger_hash links are never recomputed. Every
+later change to a member's state is recorded instead as an event in an
+append-only, hash-chained log:
+
+  governance/ledger/
+    events.jsonl                 — one canonical-JSON event per line
+    snapshots/snapshot-<seq>.json — materialized member state after event <seq>
+
+Event types:
+  add         — a registration entry was appended (carries its entry_hash)
+  activate    — provisional member activated with vouchers
+  withdraw    — member left (exit is always free)
+  deactivate  — member marked inactive
+
+Event fields:
+  seq, type, cid_hash, timestamp, data,
+  previous_event_hash (GENESIS_EVENT_HASH for the first event),
+  event_hash = SHA-256(canonical event without event_hash)
+
+Current member state = latest snapshot + replay of the events after it.
+Entries that predate the log (no add event) start from their own fields.
+State at a past moment = latest snapshot before it + replay up to it.
+
+Axiom Alignment:
+  II  - Withdrawal is a first-class, recorded action
+  III - Append-only: history is never rewritten
+  V   - Hash chain makes any edit to past events detectable
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from ledger import canonical_json
+
+
+# ─── Constants ────────────────────────────────────────────────────────────────
+
+EVENTS_FILE = "events.jsonl"
+SNAPSHOTS_DIR = "snapshots"
+SNAPSHOT_INTERVAL = 1000               # Write a snapshot every N events
+GENESIS_EVENT_HASH = "0" * 64
+
+EVENT_ADD = "add"
+EVENT_ACTIVATE = "activate"
+EVENT_WITHDRAW = "withdraw"
+EVENT_DEACTIVATE = "deactivate"
+EVENT_TYPES = (EVENT_ADD, EVENT_ACTIVATE, EVENT_WITHDRAW, EVENT_DEACTIVATE)
+
+# Entry fields that events may change; everything else in an entry is fixed
+STATE_FIELDS = ("status", "activated", "vouchers", "last_governance_action")
+
+
+# ─── Events ───────────────────────────────────────────────────────────────────
+
+def compute_event_hash(event: dict) -> str:
+    hashable = {k: v for k, v in event.items() if k != "event_hash"}
+    return hashlib.sha256(canonical_json(hashable)).hexdigest()
+
+
+def read_events(ledger_dir: Path, offset: int = 0):
+    """Yield (end_offset, event) from the log, starting at byte `offset`."""
+    path = ledger_dir / EVENTS_FILE
+    if not path.exists():
+        return
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            offset += len(line)
+            if line.strip():
+                yield offset, json.loads(line)
+
+
+def last_event(ledger_dir: Path):
+    """Return the final event without reading the whole log (None if empty)."""
+    path = ledger_dir / EVENTS_FILE
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        block = b""
+        while pos > 0:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step) + block
+            lines = block.rstrip(b"\n").split(b"\n")
+            if len(lines) > 1 or pos == 0:
+                return json.loads(lines[-1])
+    return None
+
+
+def next_event(prev: dict, event_type: str, cid_hash: str, data: dict = None, timestamp: int = None) -> dict:
+    """The event that follows `prev` (None for the first one), hashed but not written."""
+    if event_type not in EVENT_TYPES:
+        raise ValueError(f"Unknown event type: {event_type}")
+    event = {
+        "seq": prev["seq"] + 1 if prev else 1,
+        "type": event_type,
+        "cid_hash": cid_hash,
+        "timestamp": int(time.time()) if timestamp is None else timestamp,
+        "data": data or {},
+        "previous_event_hash": prev["event_hash"] if prev else GENESIS_EVENT_HASH,
+    }
+    event["event_hash"] = compute_event_hash(event)
+    return event
+
+
+def append_event(ledger_dir: Path, event_type: str, cid_hash: str, data: dict = None,
+                 timestamp: int = None, entries: list = None) -> dict:
+    """Append one event to the log — O(1) regardless of ledger size.
+    
+    Every SNAPSHOT_INTERVAL events a snapshot is written, which needs the
+    ledger entries for members that predate the log.
+    """
+    event = next_event(last_event(ledger_dir), event_type, cid_hash, data, timestamp)
+
+    ledger_dir.mkdir(parents=True, exist_ok=True)
+    with open(ledger_dir / EVENTS_FILE, "ab") as f:
+        f.write(canonical_json(event) + b"\n")
+
+    if event["seq"] % SNAPSHOT_INTERVAL == 0 and entries is not None:
+        write_snapshot(ledger_dir, materialize(ledger_dir, entries), event)
+    return event
+
+
+# ─── State ────────────────────────────────────────────────────────────────────
+
+def entry_state(entry: dict) -> dict:
+    """Member state as recorded in the (immutable) registration entry."""
+    return {field: entry.get(field) for field in STATE_FIELDS}
+
+
+def apply_event(members: dict, event: dict, entries_by_cid: dict):
+    """Fold one event into a {cid_hash: state} mapping (in place)."""
+    cid = event["cid_hash"]
+    data = event.get("data", {})
+    if event["type"] == EVENT_ADD:
+        members[cid] = {field: data.get(field) for field in STATE_FIELDS}
+        return
+    state = members.get(cid)
+    if state is None:
+        # Member predates the log: start from the registration entry
+        state = members[cid] = entry_state(entries_by_cid[cid])
+    state["last_governance_action"] = event["timestamp"]
+    if event["type"] == EVENT_ACTIVATE:
+        state["status"] = "active"
+        state["activated"] = event["timestamp"]
+        state["vouchers"] = data.get("vouchers", [])
+    elif event["type"] == EVENT_WITHDRAW:
+        state["status"] = "withdrawn"
+    elif event["type"] == EVENT_DEACTIVATE:
+        state["status"] = "inactive"
+
+
+def snapshot_paths(ledger_dir: Path) -> list:
+    """Snapshot files ordered by sequence number."""
+    snap_dir = ledger_dir / SNAPSHOTS_DIR
+    if not snap_dir.exists():
+        return []
+    return sorted(snap_dir.glob("snapshot-*.json"), key=lambda p: int(p.stem.split("-")[1]))
+
+
+def write_snapshot(ledger_dir: Path, members: dict, event: dict):
+    log = ledger_dir / EVENTS_FILE
+    snapshot = {
+        "seq": event["seq"],
+        "event_hash": event["event_hash"],
+        "timestamp": event["timestamp"],
+        "log_offset": log.stat().st_size,
+        "members": members,
+    }
+    snap_dir = ledger_dir / SNAPSHOTS_DIR
+    snap_dir.mkdir(exist_ok=True)
+    (snap_dir / f"snapshot-{event['seq']:08d}.json").write_text(json.dumps(snapshot, sort_keys=True) + "\n")
+
+
+def load_latest_snapshot(ledger_dir: Path):
+    paths = snapshot_paths(ledger_dir)
+    return json.loads(paths[-1].read_text()) if paths else None
+
+
+def materialize(ledger_dir: Path, entries: list, snapshot: dict = None) -> dict:
+    """Current {cid_hash: state} from the latest snapshot plus the log tail.
+
+    Covers members with events only; see members_view() for the full set.
+    """
+    snapshot = snapshot or load_latest_snapshot(ledger_dir)
+    members = {cid: dict(state) for cid, state in snapshot["members"].items()} if snapshot else {}
+    offset = snapshot["log_offset"] if snapshot else 0
+    entries_by_cid = {e["cid_hash"]: e for e in entries}
+    for _, event in read_events(ledger_dir, offset):
+        apply_event(members, event, entries_by_cid)
+    return members
+
+
+def member_state(ledger_dir: Path, entry: dict) -> dict:
+    """Current state of one member, replaying only that member's events."""
+    cid = entry["cid_hash"]
+    snapshot = load_latest_snapshot(ledger_dir)
+    members = {}
+    if snapshot and cid in snapshot["members"]:
+        members[cid] = dict(snapshot["members"][cid])
+    for _, event in read_events(ledger_dir, snapshot["log_offset"] if snapshot else 0):
+        if event["cid_hash"] == cid:
+            apply_event(members, event, {cid: entry})
+    return members.get(cid) or entry_state(entry)
+
+
+def snapshot_at(ledger_dir: Path, timestamp: int):
+    """Latest snapshot taken at or before `timestamp` (None if there is none).
+
+    Snapshots are written in log order and event timestamps never decrease,
+    so this is a binary search over the files — O(log n) snapshot reads.
+    """
+    paths = snapshot_paths(ledger_dir)
+    lo, hi, found = 0, len(paths), None
+    while lo < hi:
+        mid = (lo + hi) // 2
+        snapshot = json.loads(paths[mid].read_text())
+        if snapshot["timestamp"] <= timestamp:
+            found, lo = snapshot, mid + 1
+        else:
+            hi = mid
+    return found
+
+
+def materialize_as_of(ledger_dir: Path, entries: list, timestamp: int) -> dict:
+    """{cid_hash: state} as it stood at `timestamp`.
+
+    Starts from snapshot_at() and replays only the events between that
+    snapshot and `timestamp` — O(log n + delta).
+    """
+    snapshot = snapshot_at(ledger_dir, timestamp)
+    members = {cid: dict(state) for cid, state in snapshot["members"].items()} if snapshot else {}
+    offset = snapshot["log_offset"] if snapshot else 0
+    entries_by_cid = {e["cid_hash"]: e for e in entries}
+    for _, event in read_events(ledger_dir, offset):
+        if event["timestamp"] > timestamp:
+            break
+        if event["cid_hash"] not in entries_by_cid:
+            continue  # registered in the same second, after the cut-off entry
+        apply_event(members, event, entries_by_cid)
+    return members
+
+
+def members_view(entries: list, members: dict) -> list:
+    """Entries with their current state applied (copies; inputs untouched).
+
+    `entry | state` keeps compact entries (see compactledger.py) compact.
+    """
+    view = []
+    for entry in entries:
+        state = members.get(entry["cid_hash"])
+        view.append(entry | state if state else entry)
+    return view
+
+
+# ─── Verification ─────────────────────────────────────────────────────────────
+
+def verify_events(ledger_dir: Path, entries: list, since: dict = None) -> list:
+    """Check the log and snapshots in one linear pass. Returns errors.
+    
+    With `since` (a trusted checkpoint body), only events and snapshots
+    after the checkpoint's event_seq are checked.
+    """
+    errors = []
+    entries_by_cid = {e["cid_hash"]: e for e in entries}
+    snapshots = {}
+    for path in snapshot_paths(ledger_dir):
+        snapshots[int(path.stem.split("-")[1])] = path
+    
+    members = {}
+    prev_hash = GENESIS_EVENT_HASH
+    expected_seq = 1
+    offset = 0
+    if since and since.get("event_seq"):
+        prev_hash = since["event_hash"]
+        expected_seq = since["event_seq"] + 1
+        offset = since["event_log_offset"]
+        members = _state_at_offset(ledger_dir, entries_by_cid, since["event_seq"], offset)
+        snapshots = {seq: path for seq, path in snapshots.items() if seq > since["event_seq"]}
+    
+    for _, event in read_events(ledger_dir, offset):
+        seq = event.get("seq")
+        if seq != expected_seq:
+            errors.append(f"Event #{expected_seq}: sequence gap (found seq {seq})")
+        if event.get("previous_event_hash") != prev_hash:
+            errors.append(f"Event #{seq}: chain link broken (previous_event_hash mismatch)")
+        if event.get("event_hash") != compute_event_hash(event):
+            errors.append(f"Event #{seq}: hash mismatch")
+        cid = event.get("cid_hash")
+        if event.get("type") not in EVENT_TYPES:
+            errors.append(f"Event #{seq}: unknown type {event.get('type')!r}")
+        elif cid not in entries_by_cid:
+            errors.append(f"Event #{seq}: CID not in ledger: {str(cid)[:16]}...")
+        elif event["type"] == EVENT_ADD and event.get("data", {}).get("entry_hash") != entries_by_cid[cid].get("entry_hash"):
+            errors.append(f"Event #{seq}: add event does not match entry {cid[:16]}...")
+        else:
+            apply_event(members, event, entries_by_cid)
+        
+        path = snapshots.pop(seq, None)
+        if path:
+            snapshot = json.loads(path.read_text())
+            if snapshot.get("event_hash") != event.get("event_hash") or snapshot.get("members") != members:
+                errors.append(f"Snapshot {path.name}: does not match the event log")
+        
+        prev_hash = event.get("event_hash")
+        expected_seq = (seq if isinstance(seq, int) else expected_seq) + 1
+    
+    for path in snapshots.values():
+        errors.append(f"Snapshot {path.name}: no matching event in the log")
+    return errors
+
+
+def _state_at_offset(ledger_dir: Path, entries_by_cid: dict, seq: int, offset: int) -> dict:
+    """Member state after event `seq` (ending at byte `offset`), from the nearest snapshot."""
+    members, start = {}, 0
+    for path in reversed(snapshot_paths(ledger_dir)):
+        if int(path.stem.split("-")[1]) <= seq:
+            snapshot = json.loads(path.read_text())
+            members, start = snapshot["members"], snapshot["log_offset"]
+            break
+    for end, event in read_events(ledger_dir, start):
+        if end > offset:
+            break
+        apply_event(members, event, entries_by_cid)
+    return members
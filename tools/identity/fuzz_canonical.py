@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Differential Fuzzer: Python ↔ Browser Canonical JSON
+
+Generates large numbers of random nested objects, streams them in batches
+through both python_canonical() and the browser canonicalJSON() (via the
+persistent Node.js worker in test_canonical.py), and compares the bytes.
+Any mismatch is shrunk to a minimal reproducer.
+
+Generated values deliberately include:
+  - Unicode edge cases: control characters, escapes, U+2028/U+2029,
+    high-BMP private-use characters, astral characters (surrogate pairs
+    in JavaScript), combining marks, and occasional lone surrogates
+  - Integers: small, negative, near and beyond 2^53
+  - Floats: short decimals, random doubles, integral floats, -0.0
+  - Deep nesting and wide objects (hundreds of keys)
+
+Some divergences are already understood and fall outside what CCJ can
+promise today (see docs/technical/CANONICAL_JSON.md §7). The generator
+produces their triggers only rarely (about 5% of documents) so they do
+not dilute coverage. A mismatch only counts as known when the document
+still agrees once those triggers are masked out (mask_known()); if it
+still diverges it is shrunk and classified like any other. Shrunk
+reproducers matching KNOWN_DIVERGENCES are reported but do not fail the
+run; anything else does.
+
+Usage:
+  python fuzz_canonical.py                         # 100,000 cases
+  python fuzz_canonical.py --cases 500000 --batch 5000 --seed 7
+  python fuzz_canonical.py --max-depth 64 --verbose
+
+Axiom Alignment:
+  V - Adversarial Resilience: attack our own invariants first
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from test_canonical import python_canonical, js_canonical, js_canonical_many
+
+
+# ─── Value Generation ─────────────────────────────────────────────────────────
+
+MAX_SAFE_INTEGER = 2 ** 53 - 1
+
+STRING_ALPHABETS = [
+    # (weight, characters)
+    (40, "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 _-./"),
+    (10, '"\\/\b\f\n\r\t'),
+    (6, "".join(chr(c) for c in range(0x00, 0x20)) + "\x7f"),
+    (6, "\u00e9\u00fc\u00f1\u00e7\u00f8\u00df\u00e5\u00c6\u20ac\u00a3\u00a5\u00a9\u00b0\u00b5"),
+    (6, "\u00a0\u2028\u2029\u200b\u200d\ufeff\u3000"),
+    (6, "\u0301\u0308\u0327\u20dd"),
+    (6, "\u4e2d\u6587\u5b57\u6e2c\ud55c\uad6d\u65e5\u672c"),
+    (8, "".join(chr(c) for c in (0xe000, 0xf8ff, 0xfb01, 0xff21, 0xfffd, 0xffff))),
+    (10, "\U0001f331\U0001f9e0\U0001f510\U00010000\U0001d11e\U0010ffff\U0001f600"),
+]
+# Flattened so one rng.choices() call draws a whole string with the weights above
+_CHAR_POOL = [a[i % len(a)] for w, a in STRING_ALPHABETS for i in range(w * len(STRING_ALPHABETS[0][1]) // 4)]
+# Keys mixing astral and U+E000–U+FFFF characters sort differently in JS (a
+# known divergence), so most keys are drawn without astral characters
+_KEY_POOL = [c for c in _CHAR_POOL if ord(c) <= 0xffff]
+
+
+class ObjectGenerator:
+    """Seeded generator of random JSON-compatible values."""
+
+    def __init__(self, seed: int, max_depth: int = 32, lone_surrogate_rate: float = 0.0002,
+                 astral_key_rate: float = 0.005):
+        self.rng = random.Random(seed)
+        self.max_depth = max_depth
+        self.lone_surrogate_rate = lone_surrogate_rate
+        self.astral_key_rate = astral_key_rate
+        self.budget = 0  # Remaining values for the current document
+
+    def string(self, max_len: int = 24, pool: list = _CHAR_POOL) -> str:
+        rng = self.rng
+        r = rng.random()
+        length = int(r * 15) if r < 0.2 else int(r * r * max_len)
+        chars = rng.choices(pool, k=length)
+        if rng.random() < self.lone_surrogate_rate:
+            chars.insert(rng.randint(0, len(chars)), chr(rng.randint(0xd800, 0xdfff)))
+        return "".join(chars)
+
+    def number(self):
+        rng = self.rng
+        r = rng.random()
+        if r < 0.4:
+            return int(r * 5000) - 1000
+        if r < 0.6:
+            return rng.randint(-MAX_SAFE_INTEGER, MAX_SAFE_INTEGER)
+        if r < 0.64:
+            return rng.choice((0, -1, MAX_SAFE_INTEGER, -MAX_SAFE_INTEGER))
+        if r < 0.996:
+            # Short decimals; integral results are forced fractional (3.0 is a hostile value)
+            value = round(rng.uniform(-1e6, 1e6), 1 + int(r * 1000) % 6)
+            return value if value != int(value) else value + 0.5
+        # Rare hostile numbers: beyond 2^53, integral floats, exponent forms, -0.0
+        if r < 0.9975:
+            return rng.choice((2 ** 53 + 1, 2 ** 63, -(2 ** 64) - 1, 10 ** 30))
+        if r < 0.999:
+            return rng.choice((3.0, -0.0, 1e-7, 1e16, 1e21, 2.5e-5))
+        return rng.uniform(-1, 1) * 10 ** rng.randint(-30, 30)
+
+    def scalar(self):
+        r = self.rng.random()
+        if r < 0.5:
+            return self.string()
+        if r < 0.8:
+            return self.number()
+        if r < 0.9:
+            return r < 0.85
+        return None
+
+    def value(self, depth: int = 0):
+        rng = self.rng
+        self.budget -= 1
+        if self.budget <= 0 or depth >= self.max_depth or rng.random() < 0.35:
+            return self.scalar()
+        r = rng.random()
+        if r < 0.5:
+            return self.obj(depth + 1)
+        if r < 0.8:
+            return [self.value(depth + 1) for _ in range(int(r * 20) % 7)]
+        # Narrow deep chain
+        return {self.key(6): self.value(depth + 1)}
+
+    def key(self, max_len: int) -> str:
+        pool = _CHAR_POOL if self.rng.random() < self.astral_key_rate else _KEY_POOL
+        return self.string(max_len, pool)
+
+    def obj(self, depth: int = 0) -> dict:
+        rng = self.rng
+        r = rng.random()
+        if r < 0.002:
+            width = 200 + int(r * 150_000)
+            self.budget += width
+        else:
+            width = int(r * 9)
+        return {self.key(12): self.value(depth) for _ in range(width)}
+
+    def document(self) -> dict:
+        """A top-level object (everything we sign is a JSON object)."""
+        self.budget = self.rng.choice((4, 8, 16, 32, 64, 2 * self.max_depth))
+        return self.obj(0)
+
+
+# ─── Comparison & Shrinking ───────────────────────────────────────────────────
+
+def py_bytes_or_error(obj):
+    try:
+        return python_canonical(obj)
+    except (UnicodeEncodeError, ValueError, RecursionError) as e:
+        return e
+
+
+def diverges(obj) -> bool:
+    """True when the two encoders disagree (or one of them cannot encode)."""
+    py = py_bytes_or_error(obj)
+    try:
+        js = js_canonical(obj)
+    except RuntimeError:
+        return True
+    return not isinstance(py, bytes) or py != js
+
+
+def _candidates(value):
+    """Smaller variants of `value`, roughly largest reduction first."""
+    if isinstance(value, dict):
+        keys = list(value)
+        for child in value.values():
+            if isinstance(child, (dict, list)):
+                yield child
+        if len(keys) > 1:
+            half = len(keys) // 2
+            yield {k: value[k] for k in keys[:half]}
+            yield {k: value[k] for k in keys[half:]}
+        for k in keys:
+            yield {kk: vv for kk, vv in value.items() if kk != k}
+        for k in keys:
+            for smaller_key in _candidates(k):
+                if smaller_key not in value:
+                    yield {(smaller_key if kk == k else kk): vv for kk, vv in value.items()}
+        for k in keys:
+            for smaller in _candidates(value[k]):
+                yield {**value, k: smaller}
+    elif isinstance(value, list):
+        for child in value:
+            if isinstance(child, (dict, list)):
+                yield child
+        if len(value) > 1:
+            yield value[:len(value) // 2]
+            yield value[len(value) // 2:]
+        for i in range(len(value)):
+            yield value[:i] + value[i + 1:]
+        for i, item in enumerate(value):
+            for smaller in _candidates(item):
+                yield value[:i] + [smaller] + value[i + 1:]
+    elif isinstance(value, str):
+        if len(value) > 1:
+            yield value[:len(value) // 2]
+            yield value[len(value) // 2:]
+            for i in range(len(value)):
+                yield value[:i] + value[i + 1:]
+    elif isinstance(value, bool) or value is None:
+        return
+    elif isinstance(value, int):
+        if value != 0:
+            yield value // 2 if value > 0 else -((-value) // 2)
+    elif isinstance(value, float):
+        if value != int(value) and abs(value) < 1e15:
+            yield float(int(value))
+
+
+def shrink(obj, max_steps: int = 5000):
+    """Greedy delta-debugging: keep taking the first smaller candidate that still diverges."""
+    current = obj
+    steps = 0
+    progress = True
+    while progress and steps < max_steps:
+        progress = False
+        for candidate in _candidates(current):
+            if not isinstance(candidate, dict):
+                candidate = {"v": candidate}
+            if candidate == current:
+                continue
+            steps += 1
+            if diverges(candidate):
+                current = candidate
+                progress = True
+                break
+            if steps >= max_steps:
+                break
+    return current
+
+
+# ─── Known Divergences ────────────────────────────────────────────────────────
+
+def _walk(value):
+    yield value
+    if isinstance(value, dict):
+        for k, v in value.items():
+            yield k
+            yield from _walk(v)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _walk(item)
+
+
+def _utf16_key(s: str) -> bytes:
+    return s.encode("utf-16-be", "surrogatepass")
+
+
+def is_lone_surrogate(obj) -> bool:
+    return any(isinstance(v, str) and any(0xd800 <= ord(c) <= 0xdfff for c in v) for v in _walk(obj))
+
+
+def _is_hostile_number(v) -> bool:
+    """Numbers Python and JS print differently. Short decimals such as 1.5 are not."""
+    if isinstance(v, float):
+        return v != v or v in (float("inf"), float("-inf")) or v == int(v) or "e" in repr(v)
+    return isinstance(v, int) and not isinstance(v, bool) and abs(v) > MAX_SAFE_INTEGER
+
+
+def _is_astral_order_dict(v) -> bool:
+    return isinstance(v, dict) and sorted(v) != sorted(v, key=_utf16_key)
+
+
+def is_number_format(obj) -> bool:
+    return any(_is_hostile_number(v) for v in _walk(obj))
+
+
+def is_astral_key_order(obj) -> bool:
+    return any(_is_astral_order_dict(v) for v in _walk(obj))
+
+
+def _strip_surrogates(s: str) -> str:
+    return "".join(c for c in s if not 0xd800 <= ord(c) <= 0xdfff)
+
+
+def mask_known(value):
+    """`value` with every known-divergence trigger neutralized.
+
+    Hostile numbers become 0, lone surrogates are dropped and keys of
+    dicts whose JS order differs lose their astral characters (colliding
+    keys are dropped). Whatever still diverges afterwards is not explained
+    by KNOWN_DIVERGENCES.
+    """
+    if isinstance(value, dict):
+        astral = _is_astral_order_dict(value)
+        masked = {}
+        for k, v in value.items():
+            k = _strip_surrogates(k)
+            if astral:
+                k = "".join(c for c in k if ord(c) <= 0xffff)
+            masked.setdefault(k, mask_known(v))
+        return masked
+    if isinstance(value, list):
+        return [mask_known(item) for item in value]
+    if isinstance(value, str):
+        return _strip_surrogates(value)
+    return 0 if _is_hostile_number(value) else value
+
+
+KNOWN_DIVERGENCES = [
+    # (name, predicate on the shrunk reproducer, explanation)
+    ("lone_surrogate", is_lone_surrogate,
+     "Python cannot UTF-8 encode unpaired surrogates; JSON.stringify escapes them"),
+    ("number_format", is_number_format,
+     "Integral/exponent-form floats, -0.0 and integers beyond 2^53 (Python repr vs JS Number)"),
+    ("astral_key_order", is_astral_key_order,
+     "JS sorts keys by UTF-16 code unit, Python by code point (astral vs U+E000–U+FFFF)"),
+]
+
+
+def classify(reproducer):
+    for name, predicate, explanation in KNOWN_DIVERGENCES:
+        if predicate(reproducer):
+            return name, explanation
+    return None, None
+
+
+# ─── Run Fuzzer ───────────────────────────────────────────────────────────────
+
+def signature(obj) -> tuple:
+    """Which known-divergence predicates an (unshrunk) object matches."""
+    return tuple(name for name, predicate, _ in KNOWN_DIVERGENCES if predicate(obj))
+
+
+def run_fuzz(cases: int, batch: int, seed: int, max_depth: int,
+             shrink_per_signature: int = 5, verbose: bool = False) -> bool:
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Canonical JSON Differential Fuzzer")
+    print("  Python python_canonical() ↔ browser canonicalJSON()")
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Cases: {cases:,}  |  Batch: {batch:,}  |  Seed: {seed}  |  Max depth: {max_depth}")
+    print()
+
+    gen = ObjectGenerator(seed, max_depth=max_depth)
+    # Shrinking is ~100x the cost of a comparison, so only a sample of each
+    # explained signature is shrunk. A mismatch is explained only if it
+    # agrees once its known triggers are masked; the rest are always shrunk.
+    mismatches = []
+    per_signature = {}
+    explained = 0
+    total_bytes = 0
+    done = 0
+    start = time.perf_counter()
+
+    while done < cases:
+        objs = [gen.document() for _ in range(min(batch, cases - done))]
+        js_results = js_canonical_many(objs)
+        suspects = []
+        for obj, js in zip(objs, js_results):
+            py = py_bytes_or_error(obj)
+            total_bytes += len(js)
+            if not isinstance(py, bytes) or py != js:
+                if signature(obj):
+                    suspects.append(obj)
+                else:
+                    mismatches.append(obj)
+        if suspects:
+            masked = [mask_known(obj) for obj in suspects]
+            for obj, plain, js in zip(suspects, masked, js_canonical_many(masked)):
+                if py_bytes_or_error(plain) != js:
+                    mismatches.append(plain)
+                    continue
+                explained += 1
+                sig = signature(obj)
+                per_signature[sig] = per_signature.get(sig, 0) + 1
+                if per_signature[sig] <= shrink_per_signature:
+                    mismatches.append(obj)
+        done += len(objs)
+        if verbose:
+            elapsed = time.perf_counter() - start
+            found = explained + len(mismatches) - sum(min(n, shrink_per_signature) for n in per_signature.values())
+            print(f"  … {done:,} cases  {done / elapsed:,.0f} cases/s  {found:,} mismatches")
+
+    elapsed = time.perf_counter() - start
+
+    # Shrink and bucket every mismatch; report the smallest reproducer per bucket
+    findings = {}
+    for obj in mismatches:
+        repro = shrink(obj)
+        name, explanation = classify(repro)
+        bucket = findings.setdefault(name or "UNKNOWN", {"count": 0, "repro": repro, "explanation": explanation})
+        bucket["count"] += 1
+        if len(repr(repro)) < len(repr(bucket["repro"])):
+            bucket["repro"] = repro
+
+    print(f"  Throughput: {done / elapsed:,.0f} cases/s  ·  {total_bytes / elapsed / 1e6:.2f} MB/s canonical output")
+    print(f"  Elapsed:    {elapsed:.2f}s  ({total_bytes / 1e6:.1f} MB compared)")
+    unexplained = len(mismatches) - sum(min(n, shrink_per_signature) for n in per_signature.values())
+    print(f"  Mismatches: {explained + unexplained:,}  "
+          f"({explained:,} explained after masking, {len(mismatches):,} shrunk)")
+    print()
+
+    unknown = 0
+    if not mismatches:
+        print("  ✅ No divergence found")
+    for key, bucket in sorted(findings.items()):
+        icon = "ℹ️ " if key != "UNKNOWN" else "❌"
+        if key == "UNKNOWN":
+            unknown += bucket["count"]
+        print(f"  {icon} {key}: {bucket['count']} shrunk case(s)")
+        if bucket["explanation"]:
+            print(f"       {bucket['explanation']}")
+        print(f"       Minimal reproducer: {bucket['repro']!r}")
+        print(f"       Python: {py_bytes_or_error(bucket['repro'])!r}")
+        print(f"       JS:     {js_canonical(bucket['repro'])!r}")
+
+    print()
+    print("═══════════════════════════════════════════════════════════════")
+    if unknown:
+        print(f"  ❌ {unknown} UNEXPLAINED DIVERGENCE(S) — canonical forms differ!")
+    else:
+        print("  ✅ No unexplained divergence")
+    print("═══════════════════════════════════════════════════════════════")
+    return unknown == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Canonical JSON differential fuzzer")
+    parser.add_argument("--cases", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-depth", type=int, default=32)
+    parser.add_argument("--shrink-per-signature", type=int, default=5,
+                        help="Mismatches shrunk per known-divergence signature")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    ok = run_fuzz(args.cases, args.batch, args.seed, args.max_depth,
+                  args.shrink_per_signature, args.verbose)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
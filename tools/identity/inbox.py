@@ -0,0 +1,321 @@
+"""
+Registration Inbox
+
+`ledger.py watch --inbox <dir>` admits registration requests dropped
+into a directory (the JSON `keygen.py register` prints, e.g. saved from a
+registration issue) without anyone running `ledger.py add` per file.
+Each file goes through an asyncio pipeline with bounded queues between
+the stages, so a burst of files never outruns the verifiers:
+
+  scan      — poll the inbox for *.json files (writers should write under
+              another name, or a dotfile, and rename into place)
+  verify    — parse, check structure, that cid_hash = SHA-256(ML-DSA-65 pk
+              || Ed25519 pk), and both signatures; each worker takes up
+              to VERIFY_BATCH queued files and checks their signatures
+              with one keygen.dual_verify_many call, in a thread pool
+              (liboqs and libsodium release the GIL)
+  commit    — dedupe against the CIDs and public keys already in the
+              ledger (and in the batch), then append up to --batch-size
+              entries with one ledger.json write, one events.jsonl append
+              and no re-hash of the existing chain
+
+New members are provisional, as the registration issue acknowledgment
+tells them; vouching is still `ledger.py activate`. Processed files move
+to accepted/ or rejected/ (default: inside the inbox) next to a
+<name>.result.json recording the outcome and reasons.
+
+The watcher keeps a running SHA-256 of the chain in memory. Each commit
+holds the ledger directory lock (ledger.ledger_lock) that `ledger.py add`,
+`activate`, `withdraw` and `deactivate` also take, and reloads first if
+ledger_hash.txt or the event log head moved since the watcher last wrote.
+
+Axiom Alignment:
+  II  - Joining is voluntary and should not wait on a maintainer
+  III - One write per batch, not per member
+  V   - Every request is verified before it touches the chain
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ledger import (build_entry, canonical_json, compute_cid, determine_phase, append_entries,
+                    key_store_for, ledger_lock, load_ledger, load_members)
+from profiling import span
+
+
+REQUIRED_FIELDS = ("cid_hash", "public_keys", "statement", "requested_at")
+ACCEPTED_DIR = "accepted"
+REJECTED_DIR = "rejected"
+VERIFY_BATCH = 32                      # Most queued files one verify worker takes at once
+
+
+# ─── Verification ────────────────────────────────────────────────────────────
+
+def inspect_request(path: Path) -> tuple:
+    """Parse and check one request file, short of its signatures. Returns (registration, reasons)."""
+    try:
+        registration = json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        return None, [f"Unreadable JSON: {e}"]
+    if not isinstance(registration, dict) or not isinstance(registration.get("registration"), dict):
+        return None, ["Not a registration request (missing 'registration' object)"]
+
+    reg = registration["registration"]
+    sigs = registration.get("signatures") or {}
+    if not isinstance(sigs, dict):
+        return registration, ["Malformed signatures (expected an object)"]
+    reasons = [f"Missing required field: {field}" for field in REQUIRED_FIELDS if field not in reg]
+    if not sigs.get("ml_dsa_65") or not sigs.get("ed25519"):
+        reasons.append("Missing one or both signatures")
+    if reasons:
+        return registration, reasons
+    if not isinstance(reg["public_keys"], dict):
+        return registration, ["Malformed public keys (expected an object)"]
+
+    try:
+        if compute_cid(reg["public_keys"]) != reg["cid_hash"]:
+            return registration, ["cid_hash does not match the public keys"]
+    except (KeyError, TypeError, ValueError):
+        return registration, ["Malformed public keys"]
+    return registration, reasons
+
+
+def inspect_safely(path: Path) -> tuple:
+    """inspect_request(), with anything unexpected rejecting this one file instead of the pipeline."""
+    try:
+        return inspect_request(path)
+    except Exception as e:
+        return None, [f"Malformed request: {type(e).__name__}: {e}"]
+
+
+def check_requests(paths: list) -> list:
+    """Parse and verify request files, signatures in one batch. Returns (registration, reasons) per path."""
+    from keygen import dual_verify_many
+    checked = [inspect_safely(path) for path in paths]
+    pending = [(registration, reasons) for registration, reasons in checked if not reasons]
+    jobs = [(canonical_json(r["registration"]), r["signatures"], r["registration"]["public_keys"]) for r, _ in pending]
+    with span("inbox.verify"):
+        # Already on a pipeline worker thread: verify in place
+        all_results = dual_verify_many(jobs, max_workers=1)
+    for (_, reasons), results in zip(pending, all_results):
+        if not results["ml_dsa_65"]:
+            reasons.append(f"ML-DSA-65 signature invalid: {results.get('ml_dsa_65_error', 'unknown')}")
+        if not results["ed25519"]:
+            reasons.append(f"Ed25519 signature invalid: {results.get('ed25519_error', 'unknown')}")
+    return checked
+
+
+# ─── Ledger Writer ───────────────────────────────────────────────────────────
+
+class LedgerWriter:
+    """Append-only view of the ledger that the commit stage owns."""
+
+    def __init__(self, ledger_dir: Path):
+        self.ledger_dir = Path(ledger_dir)
+        self.reload()
+
+    def reload(self):
+        from memberindex import current_heads
+        self.heads = current_heads(self.ledger_dir)
+        self.ledger = load_ledger(self.ledger_dir, resolve_keys=False)
+        store = key_store_for(self.ledger_dir, self.ledger)
+        self.entries = [store.resolve(e) for e in self.ledger["entries"]] if store else list(self.ledger["entries"])
+
+        self.hasher = hashlib.sha256(b"[")
+        for i, entry in enumerate(self.entries):
+            self.hasher.update((b"," if i else b"") + canonical_json(entry))
+        self.cids = {e["cid_hash"] for e in self.entries}
+        self.keys = {key for e in self.entries for key in (e.get("public_keys") or {}).values()}
+        members = load_members(self.ledger_dir, {**self.ledger, "entries": self.entries})
+        self.active = sum(1 for m in members if m.get("status") == "active")
+
+    def refresh(self):
+        """Reload if another process appended entries or events since."""
+        from memberindex import current_heads
+        if current_heads(self.ledger_dir) != self.heads:
+            self.reload()
+
+    def ledger_hash(self) -> str:
+        closed = self.hasher.copy()
+        closed.update(b"]")
+        return closed.hexdigest()
+
+    def duplicate_reason(self, reg: dict):
+        if not self.entries:
+            return "Ledger is empty: add the genesis entry with `ledger.py add --genesis` first"
+        if reg["cid_hash"] in self.cids:
+            return f"CID already registered: {reg['cid_hash'][:16]}..."
+        if reg["public_keys"].get("ml_dsa_65") in self.keys:
+            return "ML-DSA-65 public key already registered under a different CID"
+        if reg["public_keys"].get("ed25519") in self.keys:
+            return "Ed25519 public key already registered under a different CID"
+        return None
+
+    def reserve(self, reg: dict):
+        self.cids.add(reg["cid_hash"])
+        self.keys.update(reg["public_keys"].values())
+
+    def commit(self, registrations: list) -> tuple:
+        """Append provisional entries for `registrations`. Returns (entries, ledger_hash).
+        
+        Call with ledger_lock() held, after refresh() and the duplicate checks.
+        """
+        from events import EVENT_ADD, entry_state, last_event, next_event
+        from memberindex import current_heads
+        from sync import append_events
+
+        now = int(time.time())
+        phase = determine_phase(self.active)
+        new_entries, new_events = [], []
+        head = last_event(self.ledger_dir)
+        for reg in registrations:
+            entry = build_entry(reg, phase, "provisional", [], self.ledger_hash(), now)
+            self.hasher.update((b"," if self.entries or new_entries else b"") + canonical_json(entry))
+            new_entries.append(entry)
+            head = next_event(head, EVENT_ADD, entry["cid_hash"],
+                              {"entry_hash": entry["entry_hash"], **entry_state(entry)}, timestamp=now)
+            new_events.append(head)
+
+        ledger_hash = self.ledger_hash()
+        with span("inbox.commit"):
+            append_entries(self.ledger_dir, self.ledger, new_entries, ledger_hash)
+            self.entries.extend(new_entries)
+            append_events(self.ledger_dir, self.entries, new_events)
+
+        self.heads = current_heads(self.ledger_dir)
+        return new_entries, ledger_hash
+
+
+# ─── Pipeline ────────────────────────────────────────────────────────────────
+
+def settle(path: Path, outcome_dir: Path, result: dict):
+    """Move a processed request into its outcome directory, with a result file."""
+    outcome_dir.mkdir(parents=True, exist_ok=True)
+    target = outcome_dir / path.name
+    if target.exists():
+        target = outcome_dir / f"{int(time.time())}-{path.name}"
+    path.replace(target)
+    (outcome_dir / f"{target.name}.result.json").write_text(json.dumps(result, indent=2, sort_keys=True) + "\n")
+
+
+async def watch_inbox(ledger_dir: Path, inbox: Path, accepted_dir: Path = None, rejected_dir: Path = None,
+                      workers: int = None, batch_size: int = 100, batch_window: float = 0.5,
+                      poll_interval: float = 1.0, once: bool = False, report=print) -> dict:
+    """Run the scan → verify → commit pipeline. Returns {"accepted": n, "rejected": n}."""
+    inbox = Path(inbox)
+    accepted_dir = Path(accepted_dir) if accepted_dir else inbox / ACCEPTED_DIR
+    rejected_dir = Path(rejected_dir) if rejected_dir else inbox / REJECTED_DIR
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    writer = await loop.run_in_executor(executor, LedgerWriter, ledger_dir)
+
+    pending = asyncio.Queue(maxsize=4 * workers)        # paths to verify
+    verified = asyncio.Queue(maxsize=2 * batch_size)    # (path, registration, reasons)
+    in_flight = set()
+    totals = {"accepted": 0, "rejected": 0}
+    done = object()
+
+    def reject(path, reasons):
+        settle(path, rejected_dir, {"status": "rejected", "reasons": reasons, "processed_at": int(time.time())})
+        totals["rejected"] += 1
+        report(f"❌ {path.name}: {'; '.join(reasons)}")
+
+    async def scan():
+        while True:
+            names = sorted(e.name for e in os.scandir(inbox)
+                           if e.is_file() and e.name.endswith(".json") and not e.name.startswith("."))
+            for name in names:
+                path = inbox / name
+                if path not in in_flight:
+                    in_flight.add(path)
+                    await pending.put(path)
+            if once:
+                break
+            await asyncio.sleep(poll_interval)
+        for _ in range(workers):
+            await pending.put(done)
+
+    async def verify():
+        finished = False
+        while not finished:
+            paths = [await pending.get()]
+            while len(paths) < VERIFY_BATCH and not pending.empty():
+                paths.append(pending.get_nowait())
+            if done in paths:
+                # scan() queues one `done` per worker; hand back any taken beyond ours
+                finished = True
+                for _ in range(paths.count(done) - 1):
+                    await pending.put(done)
+                paths = [path for path in paths if path is not done]
+            if paths:
+                checked = await loop.run_in_executor(executor, check_requests, paths)
+                for path, (registration, reasons) in zip(paths, checked):
+                    await verified.put((path, registration, reasons))
+        await verified.put(done)
+
+    async def commit():
+        finished = 0
+        while finished < workers:
+            batch = []
+            deadline = loop.time() + batch_window
+            while len(batch) < batch_size and finished < workers:
+                try:
+                    item = await asyncio.wait_for(verified.get(), max(deadline - loop.time(), 0) if batch else None)
+                except asyncio.TimeoutError:
+                    break
+                if item is done:
+                    finished += 1
+                else:
+                    batch.append(item)
+            if batch:
+                await loop.run_in_executor(executor, commit_batch, batch)
+
+    def commit_batch(batch):
+        # Under the lock, so no add or activate can land between refresh() and the write
+        with ledger_lock(writer.ledger_dir):
+            commit_locked(batch)
+
+    def commit_locked(batch):
+        writer.refresh()
+        admitted = []
+        for path, registration, reasons in batch:
+            if not reasons:
+                duplicate = writer.duplicate_reason(registration["registration"])
+                reasons = [duplicate] if duplicate else []
+            if reasons:
+                reject(path, reasons)
+                in_flight.discard(path)
+                continue
+            writer.reserve(registration["registration"])
+            admitted.append((path, registration["registration"]))
+        if not admitted:
+            return
+        try:
+            entries, ledger_hash = writer.commit([reg for _, reg in admitted])
+        except OSError as e:
+            report(f"ERROR: commit failed, leaving {len(admitted)} request(s) in the inbox: {e}")
+            writer.reload()
+            for path, _ in admitted:
+                in_flight.discard(path)
+            return
+        first = len(writer.entries) - len(entries) + 1
+        for i, ((path, _), entry) in enumerate(zip(admitted, entries)):
+            settle(path, accepted_dir, {"status": "accepted", "reasons": [], "cid_hash": entry["cid_hash"],
+                                        "entry": first + i, "ledger_hash": ledger_hash,
+                                        "processed_at": int(time.time())})
+            in_flight.discard(path)
+        totals["accepted"] += len(entries)
+        report(f"✅ Committed {len(entries)} registration(s) as entries #{first}-#{first + len(entries) - 1}, "
+               f"ledger {ledger_hash[:16]}...")
+
+    try:
+        await asyncio.gather(scan(), commit(), *(verify() for _ in range(workers)))
+    finally:
+        executor.shutdown(wait=True)
+    return totals
@@ -0,0 +1,434 @@
+"""
+Continuous Ledger Verification
+
+`ledger.py verify --watch` keeps verifying a ledger directory while it
+changes, so corruption or a bad manual edit is reported when it happens
+instead of the next time someone runs `verify`. The verified chain stays
+in memory as a few values per entry, never as the entries themselves:
+
+  - byte offset and length of each entry in ledger.json, a digest of
+    those bytes and one of the entry's canonical form, and a digest of
+    each run of STRIDE entries
+  - the running SHA-256 of the chain, plus a copy every STRIDE entries
+  - the stat and content digest of every entries/CID-*.json file
+
+Every --poll-interval seconds ledger.json, ledger_hash.txt and the
+entries/ directory are stat'ed, plus the next SWEEP entry files in turn
+(creating, removing or renaming a file shows on the directory; a file
+rewritten in place waits for its turn). A change is checked once every
+watched file has been still for one more poll, so a writer caught
+between ledger.json and ledger_hash.txt is not reported. When
+ledger.json moved, known entries are matched where they are expected by
+digest alone, a block of STRIDE at a time, and only entries that no
+longer match are parsed:
+
+  - new tail entries are hashed onto the running chain
+  - an entry changed further back re-hashes the chain from the copy
+    before it; problems are reported as they are found, so the first
+    alert does not wait for the rest of the chain
+  - a reformatted entry (same canonical form) changes nothing
+
+Entry files are re-read only when their stat changes and re-compared
+only when their content digest does. Problems use verify's wording;
+with record=True (`verify --watch --record`) every check also updates
+last_verify.json for the metrics exporter. The mutation log and
+snapshots (events.jsonl) are left to a plain `verify`.
+
+Ledger writers replace ledger.json and entry files through a temp file
+(ledger.write_atomic), never truncating them in place, so a scan's mmap
+keeps the old contents instead of faulting.
+
+Axiom Alignment:
+  V - Tampering is noticed while it happens, not at the next audit
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import time
+from array import array
+from pathlib import Path
+
+from compactledger import entries_start, iter_entries, ledger_meta
+from ledger import canonical_json, compute_entry_hash, key_store_for
+from profiling import span
+
+
+STRIDE = 256             # entries per saved chain hasher copy and per block digest
+SWEEP = 4096             # entry files re-stat'ed per poll
+MAX_SHOWN = 20           # problems printed per check
+ENTRY_FILE_PREFIX = "CID-"
+_SEPARATORS = b" \t\r\n,"
+
+
+def _digest(data) -> bytes:
+    return hashlib.sha256(data).digest()[:16]
+
+
+def _stat(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class LedgerWatch:
+    """The verified state of one ledger directory, updated from what changed on disk."""
+
+    def __init__(self, ledger_dir: Path, report=print, record: bool = False):
+        self.ledger_dir = Path(ledger_dir)
+        self.report = report
+        self.record = record
+        # Per entry, in ledger order
+        self.offsets = array("Q")
+        self.lengths = array("Q")
+        self.raw = []                         # digest of the entry's bytes in ledger.json
+        self.canon = []                       # digest of its canonical (stored) form
+        self.cids = []
+        self.names = []                       # its entries/ file name
+        self.blocks = []                      # digest of the bytes of entries[q * STRIDE:(q + 1) * STRIDE]
+        # Chain
+        self.midstates = [hashlib.sha256(b"[")]   # midstates[q] covers entries[:q * STRIDE]
+        self.hasher = self.midstates[0].copy()    # covers every entry
+        self.ledger_hash = hashlib.sha256(b"[]").hexdigest()
+        self.stored_hash = None
+        # Entry file name -> stat, content digest, canonical digest (None: not JSON)
+        self.file_stats = {}
+        self.file_digests = {}
+        self.file_canon = {}
+        # Problems
+        self.ledger_problem = None
+        self.entry_errors = {}                # entry index -> messages
+        self.reported = set()
+        self.shown = 0
+        self.snapshot = None                  # what the last check saw
+        self.sweep = []                       # entry file names, in the order they are re-stat'ed
+        self.sweep_pos = 0
+
+    # ─── Change Detection ────────────────────────────────────────────────────
+
+    def snapshot_now(self) -> tuple:
+        """(ledger.json stat, ledger_hash.txt stat, entries/ stat, {entry file name: stat})."""
+        entries_dir = self.ledger_dir / "entries"
+        dir_stat = _stat(entries_dir)
+        files = {}
+        try:
+            with os.scandir(entries_dir) as it:
+                for e in it:
+                    if e.name.startswith(ENTRY_FILE_PREFIX) and e.name.endswith(".json"):
+                        try:
+                            st = e.stat()
+                        except FileNotFoundError:
+                            continue
+                        files[e.name] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass
+        return _stat(self.ledger_dir / "ledger.json"), _stat(self.ledger_dir / "ledger_hash.txt"), dir_stat, files
+
+    def changed_since_check(self) -> bool:
+        """Cheap test for a change: the ledger files, entries/ and the next SWEEP entry files."""
+        if self.snapshot is None:
+            return True
+        ledger_stat, hash_stat, dir_stat, files = self.snapshot
+        if (_stat(self.ledger_dir / "ledger.json") != ledger_stat
+                or _stat(self.ledger_dir / "ledger_hash.txt") != hash_stat
+                or _stat(self.ledger_dir / "entries") != dir_stat):
+            return True
+        if not self.sweep:
+            return False
+        start = self.sweep_pos % len(self.sweep)
+        self.sweep_pos = start + SWEEP
+        prefix = os.path.join(self.ledger_dir, "entries", "")
+        return any(_stat(prefix + name) != files[name] for name in self.sweep[start:start + SWEEP])
+
+    def check(self, snapshot: tuple) -> list:
+        """Re-verify whatever differs between `snapshot` and the last check. Returns current problems."""
+        started = time.perf_counter()
+        ledger_stat, hash_stat, _, files = snapshot
+        first = self.snapshot is None
+        previous = self.snapshot or (None, None, None, None)
+        changed = [name for name, now, before in (("ledger.json", ledger_stat, previous[0]),
+                                                  ("ledger_hash.txt", hash_stat, previous[1]),
+                                                  ("entries/", files, previous[3]))
+                   if first or now != before]
+        if not changed:                             # only entries/ itself moved
+            self.snapshot = snapshot
+            return self.problems()
+        self.report(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] "
+                    f"{'initial check' if first else ', '.join(changed) + ' changed'}")
+        self.shown = 0
+
+        if "ledger.json" in changed:
+            self._check_ledger()
+        if "ledger_hash.txt" in changed:
+            try:
+                self.stored_hash = (self.ledger_dir / "ledger_hash.txt").read_text().strip()
+            except FileNotFoundError:
+                self.stored_hash = None
+        if "entries/" in changed:
+            with span("watch.entry_files"):
+                self._read_entry_files(files)
+            self.sweep = list(files)
+
+        problems = self.problems()
+        for problem in problems:
+            self._alert(problem)
+        resolved = len(self.reported - set(problems))
+        self.reported = set(problems)
+        self.snapshot = snapshot
+
+        elapsed = time.perf_counter() - started
+        if self.shown > MAX_SHOWN:
+            self.report(f"  … and {self.shown - MAX_SHOWN} more")
+        if resolved:
+            self.report(f"  ✔ {resolved} earlier problem(s) no longer present")
+        if problems:
+            self.report(f"  ❌ {len(problems)} problem(s) in {len(self.cids)} entries ({elapsed:.2f}s)")
+        else:
+            self.report(f"  ✅ Ledger verified: {len(self.cids)} entries, hash chain intact ({elapsed:.2f}s)")
+            self.report(f"     Ledger hash: {self.ledger_hash}")
+
+        if self.record:
+            from metrics import record_verification
+            record_verification(self.ledger_dir, self.ledger_hash, len(self.cids), problems, elapsed, False)
+        return problems
+
+    def _alert(self, problem: str):
+        """Report a problem as soon as it is found (once, and at most MAX_SHOWN per check)."""
+        if problem in self.reported:
+            return
+        self.reported.add(problem)
+        self.shown += 1
+        if self.shown <= MAX_SHOWN:
+            self.report(f"  ❌ {problem}")
+
+    def problems(self) -> list:
+        problems = [self.ledger_problem] if self.ledger_problem else []
+        for index in sorted(self.entry_errors):
+            problems.extend(self.entry_errors[index])
+        if self.stored_hash is not None and self.stored_hash != self.ledger_hash:
+            problems.append(f"Stored ledger hash mismatch: {self.stored_hash[:16]}... != {self.ledger_hash[:16]}...")
+        if len(set(self.cids)) != len(self.cids):
+            problems.append("Duplicate CID hashes found!")
+        problems.extend(self._entry_file_problems())
+        return problems
+
+    # ─── ledger.json ─────────────────────────────────────────────────────────
+
+    def _check_ledger(self):
+        path = self.ledger_dir / "ledger.json"
+        self.ledger_problem = None
+        if not path.exists():
+            self.ledger_problem = "ledger.json is missing"
+            return
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                with span("watch.scan"):
+                    rows, blocks, end = self._scan(buf)
+                    meta = ledger_meta(buf, end)
+                with span("watch.chain"):
+                    self._update_chain(buf, rows, key_store_for(self.ledger_dir, meta))
+                for q in range(len(rows) // STRIDE):
+                    if q not in blocks:
+                        first, last = rows[q * STRIDE], rows[(q + 1) * STRIDE - 1]
+                        blocks[q] = _digest(buf[first[0]:last[0] + last[1]])
+                self.blocks = [blocks[q] for q in range(len(rows) // STRIDE)]
+        except ValueError as e:                     # also mmap of an empty file
+            self.ledger_problem = f"ledger.json is not valid JSON ({e})"
+
+    def _scan(self, buf) -> tuple:
+        """Locate every entry of ledger.json, recognizing known entries by digest alone.
+
+        Returns ([(offset, length, digest, known index or None)], {block
+        number: digest} for blocks found unchanged in place, end of the last
+        entry). Only entries that differ from the known entry expected at
+        their position are parsed.
+        """
+        rows, blocks = [], {}
+        known = len(self.raw)
+        by_digest = None
+        i = 0
+        pos = entries_start(buf)
+        size = len(buf)
+        while True:
+            while pos < size and buf[pos] in _SEPARATORS:
+                pos += 1
+            if pos >= size or buf[pos] == ord("]"):
+                return rows, blocks, pos
+            if i % STRIDE == 0 and i + STRIDE <= known:
+                # A whole block of known entries, separators included
+                base = self.offsets[i]
+                length = self.offsets[i + STRIDE - 1] + self.lengths[i + STRIDE - 1] - base
+                digest = _digest(buf[pos:pos + length])
+                if digest == self.blocks[i // STRIDE]:
+                    if len(rows) == i:
+                        blocks[i // STRIDE] = digest
+                    offsets = self.offsets[i:i + STRIDE]
+                    if pos != base:
+                        offsets = [offset + pos - base for offset in offsets]
+                    rows.extend(zip(offsets, self.lengths[i:i + STRIDE], self.raw[i:i + STRIDE],
+                                    range(i, i + STRIDE)))
+                    pos += length
+                    i += STRIDE
+                    continue
+            if i < known:
+                length = self.lengths[i]
+                digest = _digest(buf[pos:pos + length])
+                if digest == self.raw[i]:
+                    rows.append((pos, length, digest, i))
+                    pos += length
+                    i += 1
+                    continue
+            # Parse until the entries are back in step with known ones
+            for offset, length, _ in iter_entries(buf, pos):
+                digest = _digest(buf[offset:offset + length])
+                pos = offset + length
+                if by_digest is None:
+                    by_digest = {}
+                    for j, d in enumerate(self.raw):
+                        by_digest.setdefault(d, j)
+                j = by_digest.get(digest)
+                rows.append((offset, length, digest, j))
+                if j is not None:
+                    i = j + 1
+                    break
+                i += 1
+            else:
+                return rows, blocks, pos
+
+    def _update_chain(self, buf, rows: list, store):
+        """Take over `rows` as the known entries, checking and hashing from the first changed one."""
+        known = len(self.canon)
+        same = 0                                    # leading entries still at their own position
+        while same < min(len(rows), known) and rows[same][3] == same:
+            same += 1
+        canons, cids, names = self.canon[:same], self.cids[:same], self.names[:same]
+        hasher = None
+        for k in range(same, len(rows)):
+            offset, length, _, j = rows[k]
+            if hasher is None and j is not None and k < known and self.canon[j] == self.canon[k]:
+                canons.append(self.canon[j])
+                cids.append(self.cids[j])
+                names.append(self.names[j])
+                continue
+            entry = json.loads(buf[offset:offset + length])
+            stored = canonical_json(entry)
+            canon = _digest(stored)
+            canons.append(canon)
+            cids.append(entry.get("cid_hash"))
+            names.append(f"{ENTRY_FILE_PREFIX}{str(entry.get('cid_hash'))[:16]}.json")
+            if hasher is None:
+                if k < known and canon == self.canon[k]:
+                    continue                        # reformatted, same content
+                hasher = self._resume(buf, rows, k, store)
+            full = store.resolve(entry) if store else entry
+            self._check_entry(k, full, hasher)
+            if k % STRIDE == 0 and k // STRIDE == len(self.midstates):
+                self.midstates.append(hasher.copy())
+            hasher.update((b"," if k else b"") + (stored if full is entry else canonical_json(full)))
+
+        if hasher is None and len(rows) < known:    # entries removed from the end
+            hasher = self._resume(buf, rows, len(rows), store)
+        if hasher is not None:
+            closed = hasher.copy()
+            closed.update(b"]")
+            self.hasher, self.ledger_hash = hasher, closed.hexdigest()
+        self.offsets = array("Q", [row[0] for row in rows])
+        self.lengths = array("Q", [row[1] for row in rows])
+        self.raw = [row[2] for row in rows]
+        self.canon, self.cids, self.names = canons, cids, names
+
+    def _resume(self, buf, rows: list, index: int, store):
+        """A chain hasher covering entries[:index], from the nearest saved copy at or before it."""
+        for k in [k for k in self.entry_errors if k >= index]:
+            del self.entry_errors[k]
+        if index == len(self.canon):
+            return self.hasher.copy()
+        q = min(index // STRIDE, len(self.midstates) - 1)
+        del self.midstates[q + 1:]
+        hasher = self.midstates[q].copy()
+        for k in range(q * STRIDE, index):
+            offset, length = rows[k][:2]
+            entry = json.loads(buf[offset:offset + length])
+            hasher.update((b"," if k else b"") + canonical_json(store.resolve(entry) if store else entry))
+        return hasher
+
+    def _check_entry(self, index: int, entry: dict, hasher):
+        errors = []
+        if entry.get("entry_hash") != compute_entry_hash(entry):
+            errors.append(f"Entry #{index+1} ({str(entry.get('cid_hash'))[:16]}...): hash mismatch")
+        if index > 0:
+            closed = hasher.copy()
+            closed.update(b"]")
+            if entry.get("previous_ledger_hash") != closed.hexdigest():
+                errors.append(f"Entry #{index+1}: chain link broken (previous_ledger_hash mismatch)")
+        if errors:
+            self.entry_errors[index] = errors
+            for error in errors:
+                self._alert(error)
+        else:
+            self.entry_errors.pop(index, None)
+
+    # ─── Entry Files ─────────────────────────────────────────────────────────
+
+    def _read_entry_files(self, files: dict):
+        entries_dir = self.ledger_dir / "entries"
+        for name, stat in files.items() - self.file_stats.items():
+            try:
+                data = (entries_dir / name).read_bytes()
+            except FileNotFoundError:
+                continue
+            self.file_stats[name] = stat
+            digest = _digest(data)
+            if self.file_digests.get(name) == digest:
+                continue
+            self.file_digests[name] = digest
+            try:
+                self.file_canon[name] = _digest(canonical_json(json.loads(data)))
+            except ValueError:
+                self.file_canon[name] = None
+        for name in self.file_canon.keys() - files.keys():
+            for known in (self.file_stats, self.file_digests, self.file_canon):
+                known.pop(name, None)
+
+    def _entry_file_problems(self) -> list:
+        if not (self.ledger_dir / "entries").is_dir():
+            return []
+        expected = dict(zip(self.names, self.canon))
+        if len(expected) == len(self.names) and expected == self.file_canon:
+            return []
+        problems = []
+        for index, (name, canon) in enumerate(zip(self.names, self.canon)):
+            if name not in self.file_canon:
+                problems.append(f"Entry #{index+1}: entry file {name} is missing")
+            elif self.file_canon[name] is None:
+                problems.append(f"Entry file {name}: not valid JSON")
+            elif self.file_canon[name] != canon:
+                problems.append(f"Entry file {name}: does not match entry #{index+1}")
+        for name in sorted(self.file_canon.keys() - expected.keys()):
+            problems.append(f"Entry file {name}: no matching ledger entry")
+        return problems
+
+
+def watch_ledger(ledger_dir: Path, poll_interval: float = 0.25, report=print, record: bool = False):
+    """Verify `ledger_dir` once, then re-verify whatever changes until interrupted."""
+    watch = LedgerWatch(ledger_dir, report, record)
+    watch.check(watch.snapshot_now())
+    report(f"👀 Watching {ledger_dir} (Ctrl-C to stop)")
+    pending = None
+    deadline = time.monotonic() + poll_interval
+    while True:
+        time.sleep(max(deadline - time.monotonic(), 0))
+        deadline = time.monotonic() + poll_interval    # polls start poll_interval apart
+        if pending is None and not watch.changed_since_check():
+            continue
+        snapshot = watch.snapshot_now()
+        if snapshot == watch.snapshot:
+            pending = None
+        elif snapshot != pending:
+            pending = snapshot                      # changed, or still being written
+        else:
+            watch.check(snapshot)
+            pending = None
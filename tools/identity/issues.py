@@ -0,0 +1,375 @@
+"""
+Registration Issue Parser
+
+Registration requests reach the project as GitHub issues: either the
+Markdown `keygen.py register` writes (format_registration_issue), the
+"Membership Registration" issue form, or a pasted registration JSON.
+`ledger.py parse-issues` turns a local export of such issues back into
+registration requests:
+
+  python ledger.py parse-issues issues.json -o batch.jsonl [--rejects rejects.jsonl]
+
+Accepted exports:
+  JSON      — `gh issue list --json number,title,body,url`, `gh api --paginate`
+              pages, or JSONL; read incrementally, one issue at a time
+  Markdown  — issue bodies concatenated in one file; a new request starts
+              at a registration heading once the previous one has a CID
+
+Every issue is parsed and validated in a process pool:
+  - an embedded {"registration": ..., "signatures": ...} JSON block wins;
+    otherwise the signed statement is rebuilt from the Markdown fields
+  - fields present, CID 64 hex, base64 keys/signatures of the right size
+  - cid_hash = SHA-256(ML-DSA-65 pk || Ed25519 pk)
+  - message_hash (when given) = SHA-256 of the canonical statement, which
+    proves the rebuilt statement is byte-for-byte what was signed
+Signatures themselves are checked at ingestion (`add` / `watch`), or here
+as well with --verify-signatures (needs liboqs), a pool chunk at a time
+through keygen.dual_verify_many.
+
+Duplicates are detected across the whole export (and, with --ledger-dir,
+against the ledger): the first request for a CID or public key wins.
+Valid requests are written as JSONL, one request per line, in export
+order; --inbox also drops each one into a `ledger.py watch` inbox.
+
+Axiom Alignment:
+  II  - Whoever asked to join gets counted, not lost in an issue tracker
+  V   - Nothing reaches the ledger that does not match its own keys
+"""
+
+import base64
+import binascii
+import calendar
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+from ledger import canonical_json, compute_cid
+
+
+REQUEST_TYPE = "registration_request"
+ALGORITHMS = {"post_quantum": "ML-DSA-65", "classical": "Ed25519"}
+KEY_SIZES = {"ml_dsa_65": 1952, "ed25519": 32}
+SIGNATURE_SIZES = {"ml_dsa_65": 3309, "ed25519": 64}
+READ_CHUNK = 1 << 20
+POOL_CHUNK = 128
+
+# Markdown labels (keygen format and issue form) → request fields
+FIELD_LABELS = {
+    "cid hash": "cid_hash",
+    "cid version": "cid_version",
+    "requested": "requested_at",
+    "requested at": "requested_at",
+    "statement": "statement",
+    "ml-dsa-65 (post-quantum)": "pk_ml_dsa_65",
+    "ml-dsa-65 public key (post-quantum)": "pk_ml_dsa_65",
+    "ed25519 (classical)": "pk_ed25519",
+    "ed25519 public key (classical)": "pk_ed25519",
+    "ml-dsa-65 signature": "sig_ml_dsa_65",
+    "ed25519 signature": "sig_ed25519",
+    "message hash (sha-256)": "message_hash",
+    "signed at": "signed_at",
+}
+RECORD_START = re.compile(r"^(## Membership Registration Request|### CID Hash\s*$|# )")
+HEADING = re.compile(r"^#{2,6}\s+(.+?)\s*$")
+BOLD_LABEL = re.compile(r"^\*\*(.+?):?\*\*:?\s*(.*)$")
+FENCE = re.compile(r"^```(\w*)\s*$")
+HEX64 = re.compile(r"^[0-9a-f]{64}$")
+
+
+# ─── Reading Exports ─────────────────────────────────────────────────────────
+
+def iter_json_values(f):
+    """Yield top-level JSON values from a JSON array, JSONL or concatenated
+    arrays/objects, reading the file in chunks."""
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,[]":
+            pos += 1
+        if pos >= len(buf):
+            if eof:
+                return
+            buf, pos = f.read(READ_CHUNK), 0
+            eof = not buf
+            continue
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            more = f.read(READ_CHUNK)
+            eof = not more
+            buf, pos = buf[pos:] + more, 0
+            continue
+        yield value
+        pos = end
+
+
+def iter_markdown_records(f):
+    """Split concatenated issue bodies into one text per registration."""
+    lines, has_cid = [], False
+    for line in f:
+        if RECORD_START.match(line) and has_cid:
+            yield "".join(lines)
+            lines, has_cid = [], False
+        lines.append(line)
+        has_cid = has_cid or "cid hash" in line.lower().replace("_", " ")
+    if lines and "".join(lines).strip():
+        yield "".join(lines)
+
+
+def iter_export(path: Path):
+    """Yield (source, issue) where issue is an issue dict or Markdown text."""
+    with open(path, encoding="utf-8") as f:
+        head = f.read(4096)
+        f.seek(0)
+        is_json = path.suffix.lower() not in (".md", ".markdown") and head.lstrip()[:1] in ("[", "{")
+        if is_json:
+            for i, issue in enumerate(iter_json_values(f), 1):
+                if isinstance(issue, dict):
+                    number = issue.get("number")
+                    yield (f"#{number}" if number is not None else f"{path.name}[{i}]"), issue
+        else:
+            for i, text in enumerate(iter_markdown_records(f), 1):
+                yield f"{path.name}[{i}]", text
+
+
+# ─── Parsing ─────────────────────────────────────────────────────────────────
+
+def markdown_fields(text: str) -> dict:
+    """{field: raw value} from labelled Markdown (bold labels or headings)."""
+    fields, label, block, in_fence = {}, None, [], False
+
+    def close():
+        if label and label not in fields:
+            value = "\n".join(line for line in block).strip()
+            if value and value != "_No response_":
+                fields[label] = value
+
+    for line in text.splitlines():
+        if FENCE.match(line.strip()):
+            in_fence = not in_fence
+            continue
+        if not in_fence:
+            heading = HEADING.match(line)
+            bold = BOLD_LABEL.match(line.strip())
+            match_label = heading.group(1) if heading else bold.group(1) if bold else None
+            if match_label is not None:
+                key = FIELD_LABELS.get(match_label.strip().rstrip(":").lower())
+                if key or heading:
+                    close()
+                    label, block = key, []
+                    if bold and bold.group(2):
+                        block.append(bold.group(2))
+                    continue
+            if line.strip() == "---":
+                close()
+                label, block = None, []
+                continue
+            line = line[2:] if line.startswith("> ") else line
+        block.append(line)
+    close()
+    return fields
+
+
+def parse_timestamp(value: str) -> int:
+    """Unix seconds, or a UTC date/time as the registration Markdown prints it."""
+    value = value.strip().strip("`")
+    if value.isdigit():
+        return int(value)
+    value = value.removesuffix("UTC").strip().rstrip("Z").replace("T", " ")
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return calendar.timegm(time.strptime(value, fmt))
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized timestamp: {value!r}")
+
+
+def embedded_request(text: str):
+    """A pasted registration request JSON in the text, if any."""
+    candidates = re.findall(r"```(?:json)?\s*\n(\{.*?\})\s*\n```", text, re.S)
+    stripped = text.strip()
+    if stripped.startswith("{"):
+        candidates.insert(0, stripped)
+    for candidate in candidates:
+        try:
+            value = json.loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(value, dict) and isinstance(value.get("registration"), dict):
+            return value
+    return None
+
+
+def request_from_markdown(text: str) -> dict:
+    """Rebuild the signed request from Markdown fields (raises ValueError)."""
+    fields = markdown_fields(text)
+    missing = [name for name in ("cid_hash", "statement", "requested_at", "pk_ml_dsa_65", "pk_ed25519",
+                                 "sig_ml_dsa_65", "sig_ed25519") if name not in fields]
+    if missing:
+        raise ValueError(f"Missing field(s): {', '.join(missing)}")
+
+    def b64(name):
+        return "".join(fields[name].split())
+
+    registration = {
+        "type": REQUEST_TYPE,
+        "cid_version": int(fields.get("cid_version", "1").strip()),
+        "cid_hash": fields["cid_hash"].strip().strip("`").lower(),
+        "statement": " ".join(fields["statement"].split()),
+        "public_keys": {"ml_dsa_65": b64("pk_ml_dsa_65"), "ed25519": b64("pk_ed25519")},
+        "algorithms": dict(ALGORITHMS),
+        "requested_at": parse_timestamp(fields["requested_at"]),
+    }
+    signatures = {"ml_dsa_65": b64("sig_ml_dsa_65"), "ed25519": b64("sig_ed25519")}
+    if "message_hash" in fields:
+        signatures["message_hash"] = fields["message_hash"].strip().strip("`").lower()
+    if "signed_at" in fields:
+        signatures["signed_at"] = parse_timestamp(fields["signed_at"])
+    return {"registration": registration, "signatures": signatures}
+
+
+def extract_request(issue) -> dict:
+    """The registration request carried by an issue dict or Markdown text."""
+    if isinstance(issue, dict):
+        if isinstance(issue.get("registration"), dict):
+            return issue
+        issue = issue.get("body") or ""
+    return embedded_request(issue) or request_from_markdown(issue)
+
+
+# ─── Validation ──────────────────────────────────────────────────────────────
+
+def _decoded_size(value) -> int:
+    try:
+        return len(base64.b64decode(value, validate=True))
+    except (binascii.Error, TypeError, ValueError):
+        return -1
+
+
+def validate_request(request: dict) -> list:
+    """Structure and CID-to-key consistency. Returns reasons (empty = valid)."""
+    reg = request.get("registration") or {}
+    sigs = request.get("signatures") or {}
+    for name, value in (("registration", reg), ("signatures", sigs)):
+        if not isinstance(value, dict):
+            return [f"{name} is not an object"]
+    reasons = [f"Missing required field: {field}"
+               for field in ("cid_hash", "public_keys", "statement", "requested_at") if field not in reg]
+    if reasons:
+        return reasons
+    if not isinstance(reg["public_keys"], dict):
+        return ["public_keys is not an object"]
+    if not HEX64.match(str(reg["cid_hash"])):
+        reasons.append("cid_hash is not 64 lowercase hex characters")
+    if not isinstance(reg["requested_at"], int):
+        reasons.append("requested_at is not a Unix timestamp")
+
+    keys = reg["public_keys"]
+    for name, size in KEY_SIZES.items():
+        if _decoded_size(keys.get(name)) != size:
+            reasons.append(f"{name} public key is not {size} bytes of base64")
+    for name, size in SIGNATURE_SIZES.items():
+        if _decoded_size(sigs.get(name)) != size:
+            reasons.append(f"{name} signature is not {size} bytes of base64")
+    if reasons:
+        return reasons
+
+    if compute_cid(keys) != reg["cid_hash"]:
+        reasons.append("cid_hash does not match the public keys")
+    if "message_hash" in sigs and sigs["message_hash"] != hashlib.sha256(canonical_json(reg)).hexdigest():
+        reasons.append("message_hash does not match the statement (fields altered or lost in transcription)")
+    return reasons
+
+
+def verify_signatures(processed: list):
+    """Check the signatures of every still-valid request in `processed` in one batch, adding reasons."""
+    from keygen import dual_verify_many
+    pending = [(request, reasons) for _, request, reasons in processed if request is not None and not reasons]
+    jobs = [(canonical_json(request["registration"]), request["signatures"],
+             request["registration"]["public_keys"]) for request, _ in pending]
+    # Already in a pool worker process: verify in place
+    for (_, reasons), results in zip(pending, dual_verify_many(jobs, max_workers=1)):
+        reasons.extend(f"{name} signature invalid" for name in ("ml_dsa_65", "ed25519") if not results[name])
+
+
+def process_issue(item: tuple) -> tuple:
+    """(source, issue) → (source, request or None, reasons), short of signature checks."""
+    source, issue = item
+    try:
+        request = extract_request(issue)
+    except (ValueError, TypeError, KeyError) as e:
+        return source, None, [f"Not a parseable registration: {e}"]
+    return source, request, validate_request(request)
+
+
+def process_chunk(items: list, check_signatures: bool = False) -> list:
+    """process_issue over a chunk, then its signatures in one batch. Runs in a worker process."""
+    processed = [process_issue(item) for item in items]
+    if check_signatures:
+        verify_signatures(processed)
+    return processed
+
+
+def parallel_process(items, workers: int = None, check_signatures: bool = False):
+    """process_issue over a stream, in order, with a bounded number of chunks in flight."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        items = iter(items)
+        while chunk := list(islice(items, POOL_CHUNK)):
+            yield from process_chunk(chunk, check_signatures)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight, chunk = [], []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == POOL_CHUNK:
+                in_flight.append(pool.submit(process_chunk, chunk, check_signatures))
+                chunk = []
+                if len(in_flight) >= 2 * workers:
+                    yield from in_flight.pop(0).result()
+        if chunk:
+            in_flight.append(pool.submit(process_chunk, chunk, check_signatures))
+        for future in in_flight:
+            yield from future.result()
+
+
+# ─── Deduplication ───────────────────────────────────────────────────────────
+
+class Deduplicator:
+    """First request for a CID or public key wins, across the whole export."""
+
+    def __init__(self, known_cid=None):
+        self.known_cid = known_cid          # callable: already in the ledger?
+        self.cids, self.keys = {}, {}
+
+    def check(self, source: str, request: dict):
+        reg = request["registration"]
+        cid = reg["cid_hash"]
+        if self.known_cid and self.known_cid(cid):
+            return f"CID already registered in the ledger: {cid[:16]}..."
+        if cid in self.cids:
+            first, digest = self.cids[cid]
+            same = digest == hashlib.sha256(canonical_json(request)).hexdigest()
+            return f"{'Duplicate' if same else 'Conflicting request'} for CID {cid[:16]}... (first seen in {first})"
+        for name, key in reg["public_keys"].items():
+            if key in self.keys:
+                return f"{name} public key already used by {self.keys[key]}"
+        self.cids[cid] = (source, hashlib.sha256(canonical_json(request)).hexdigest())
+        for key in reg["public_keys"].values():
+            self.keys[key] = source
+        return None
+
+
+def write_inbox_file(inbox: Path, request: dict):
+    """Drop a request into a watch inbox (dotfile + rename, as the watcher expects)."""
+    name = f"{request['registration']['cid_hash']}.json"
+    tmp = inbox / f".{name}.tmp"
+    tmp.write_text(json.dumps(request, indent=2) + "\n")
+    tmp.replace(inbox / name)
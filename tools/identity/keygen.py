@@ -17,6 +17,7 @@ Usage:
   python keygen.py sign --identity-dir ./my-identity --message "text to sign"
   python keygen.py verify --public-key-file pubkeys.json --signature-file sig.json --message "text"
   python keygen.py register --identity-dir ./my-identity
+  python keygen.py --profile sign ...   (timing breakdown, see profiling.py)
 
 Axiom Alignment:
   I  - Substrate-neutral (Python + standard crypto, works everywhere)
@@ -29,11 +30,15 @@ import hashlib
 import json
 import os
 import sys
+import threading
 import time
 import base64
 import getpass
 from pathlib import Path
 
+import profiling
+from profiling import span
+
 # Ensure liboqs can be found
 LIBOQS_PATHS = [
     os.path.expanduser("~/.local/lib"),
@@ -68,6 +73,7 @@ ED_ALGORITHM = "Ed25519"
 CID_VERSION = 1
 IDENTITY_DIR_PERMISSIONS = 0o700
 SECRET_FILE_PERMISSIONS = 0o600
+BATCH_MIN_CHUNK = 64                   # Smallest per-thread slice in the batch verifiers
 
 
 # ─── Core Functions ───────────────────────────────────────────────────────────
@@ -76,14 +82,16 @@ def generate_keypair():
     """Generate ML-DSA-65 + Ed25519 key pairs and compute CID hash."""
     
     # ML-DSA-65 (post-quantum)
-    pq_sig = oqs.Signature(PQ_ALGORITHM)
-    pq_public_key = pq_sig.generate_keypair()
-    pq_secret_key = pq_sig.export_secret_key()
+    with span("keygen.ml_dsa_65"):
+        pq_sig = oqs.Signature(PQ_ALGORITHM)
+        pq_public_key = pq_sig.generate_keypair()
+        pq_secret_key = pq_sig.export_secret_key()
     
     # Ed25519 (classical)
-    ed_signing_key = SigningKey.generate()
-    ed_public_key = ed_signing_key.verify_key.encode(encoder=RawEncoder)
-    ed_secret_key = ed_signing_key.encode(encoder=RawEncoder)
+    with span("keygen.ed25519"):
+        ed_signing_key = SigningKey.generate()
+        ed_public_key = ed_signing_key.verify_key.encode(encoder=RawEncoder)
+        ed_secret_key = ed_signing_key.encode(encoder=RawEncoder)
     
     # CID hash = SHA-256(ML-DSA pubkey || Ed25519 pubkey)
     cid_hash = hashlib.sha256(pq_public_key + ed_public_key).hexdigest()
@@ -117,14 +125,16 @@ def dual_sign(message: bytes, secret_keys: dict) -> dict:
     """Sign a message with both ML-DSA-65 and Ed25519."""
     
     # ML-DSA-65 signature
-    pq_sk = base64.b64decode(secret_keys["ml_dsa_65"])
-    pq_sig = oqs.Signature(PQ_ALGORITHM, pq_sk)
-    pq_signature = pq_sig.sign(message)
+    with span("sign.ml_dsa_65"):
+        pq_sk = base64.b64decode(secret_keys["ml_dsa_65"])
+        pq_sig = oqs.Signature(PQ_ALGORITHM, pq_sk)
+        pq_signature = pq_sig.sign(message)
     
     # Ed25519 signature
-    ed_sk = base64.b64decode(secret_keys["ed25519"])
-    ed_signing_key = SigningKey(ed_sk, encoder=RawEncoder)
-    ed_signed = ed_signing_key.sign(message)
+    with span("sign.ed25519"):
+        ed_sk = base64.b64decode(secret_keys["ed25519"])
+        ed_signing_key = SigningKey(ed_sk, encoder=RawEncoder)
+        ed_signed = ed_signing_key.sign(message)
     
     return {
         "message_hash": hashlib.sha256(message).hexdigest(),
@@ -140,29 +150,164 @@ def dual_verify(message: bytes, signatures: dict, public_keys: dict) -> dict:
     results = {"ml_dsa_65": False, "ed25519": False}
     
     # ML-DSA-65 verification
-    try:
-        pq_pk = base64.b64decode(public_keys["ml_dsa_65"])
-        pq_signature = base64.b64decode(signatures["ml_dsa_65"])
-        v = oqs.Signature(PQ_ALGORITHM)
-        v.verify(message, pq_signature, pq_pk)
-        results["ml_dsa_65"] = True
-    except Exception as e:
-        results["ml_dsa_65_error"] = str(e)
+    with span("verify.ml_dsa_65"):
+        try:
+            pq_pk = base64.b64decode(public_keys["ml_dsa_65"])
+            pq_signature = base64.b64decode(signatures["ml_dsa_65"])
+            v = oqs.Signature(PQ_ALGORITHM)
+            results["ml_dsa_65"] = bool(v.verify(message, pq_signature, pq_pk))
+            if not results["ml_dsa_65"]:
+                results["ml_dsa_65_error"] = "Signature verification failed"
+        except Exception as e:
+            results["ml_dsa_65_error"] = str(e)
     
     # Ed25519 verification
-    try:
-        ed_pk = base64.b64decode(public_keys["ed25519"])
-        ed_signature = base64.b64decode(signatures["ed25519"])
-        vk = VerifyKey(ed_pk, encoder=RawEncoder)
-        vk.verify(message, ed_signature)
-        results["ed25519"] = True
-    except Exception as e:
-        results["ed25519_error"] = str(e)
+    with span("verify.ed25519"):
+        try:
+            ed_pk = base64.b64decode(public_keys["ed25519"])
+            ed_signature = base64.b64decode(signatures["ed25519"])
+            vk = VerifyKey(ed_pk, encoder=RawEncoder)
+            vk.verify(message, ed_signature)
+            results["ed25519"] = True
+        except Exception as e:
+            results["ed25519_error"] = str(e)
     
     results["both_valid"] = results["ml_dsa_65"] and results["ed25519"]
     return results
 
 
+def batch_verify_ed25519(items: list, max_workers: int = None) -> list:
+    """Verify many Ed25519 signatures at once. Returns one bool per item.
+
+    items: list of (message: bytes, signature_b64: str, public_key_b64: str).
+
+    libsodium (via PyNaCl) has no multi-scalar multiplication, so a randomized
+    batch equation built from its single-point primitives is slower than
+    per-item verification. Instead each distinct public key is decoded once
+    and the per-item checks are spread over a thread pool — cffi releases the
+    GIL inside libsodium, so this scales with cores. Results are exact per
+    item, so a failing batch never needs bisecting.
+    """
+    from nacl.bindings import crypto_sign_open
+
+    decoded_keys = {}
+
+    def prepare(item):
+        message, signature_b64, public_key_b64 = item
+        try:
+            pk = decoded_keys.get(public_key_b64)
+            if pk is None:
+                pk = decoded_keys[public_key_b64] = base64.b64decode(public_key_b64)
+            signature = base64.b64decode(signature_b64)
+        except Exception:
+            return None
+        if len(pk) != 32 or len(signature) != 64:
+            return None
+        return pk, signature + message
+
+    def check(chunk):
+        ok = []
+        for job in chunk:
+            if job is None:
+                ok.append(False)
+                continue
+            try:
+                crypto_sign_open(job[1], job[0])
+                ok.append(True)
+            except Exception:
+                ok.append(False)
+        return ok
+
+    return _run_chunked(check, [prepare(item) for item in items], max_workers)
+
+
+_pq_verifiers = threading.local()
+
+
+def _run_chunked(check, prepared: list, max_workers: int = None) -> list:
+    """check() over slices of `prepared` on a thread pool, results in order."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(prepared) < 2 * BATCH_MIN_CHUNK:
+        return check(prepared)
+
+    size = max(BATCH_MIN_CHUNK, -(-len(prepared) // workers))
+    chunks = [prepared[i:i + size] for i in range(0, len(prepared), size)]
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for ok in pool.map(check, chunks):
+            results.extend(ok)
+    return results
+
+
+def dual_verify_many(jobs: list, max_workers: int = None) -> list:
+    """Bulk form of dual_verify for registrations, issues and votes.
+
+    jobs: list of (message, signatures, public_keys). signatures has the
+    shape dual_verify takes; public_keys is either dual_verify's base64
+    dict or an already decoded (ML-DSA-65, Ed25519) tuple of raw keys.
+    Returns a list of dual_verify-style result dicts.
+
+    Each distinct base64 key is decoded once, and both checks run in
+    chunks on a thread pool as in batch_verify_ed25519 (max_workers=1
+    keeps them in the calling thread, e.g. when it already is a worker).
+    """
+    from nacl.bindings import crypto_sign_open
+
+    decoded_keys = {}
+
+    def decode_key(key):
+        if isinstance(key, bytes):
+            return key
+        raw = decoded_keys.get(key)
+        if raw is None:
+            raw = decoded_keys[key] = base64.b64decode(key)
+        return raw
+
+    def prepare(job):
+        message, signatures, public_keys = job
+        keys = public_keys if isinstance(public_keys, tuple) else \
+            (public_keys.get("ml_dsa_65"), public_keys.get("ed25519"))
+        prepared = [message]
+        for name, key in zip(("ml_dsa_65", "ed25519"), keys):
+            try:
+                prepared.append((decode_key(key), base64.b64decode(signatures[name])))
+            except Exception as e:
+                prepared.append(e)
+        return prepared
+
+    def check(chunk):
+        verifier = getattr(_pq_verifiers, "verifier", None)
+        if verifier is None:
+            verifier = _pq_verifiers.verifier = oqs.Signature(PQ_ALGORITHM)
+        out = []
+        for message, pq, ed in chunk:
+            results = {"ml_dsa_65": False, "ed25519": False}
+            try:
+                if isinstance(pq, Exception):
+                    raise pq
+                results["ml_dsa_65"] = bool(verifier.verify(message, pq[1], pq[0]))
+                if not results["ml_dsa_65"]:
+                    results["ml_dsa_65_error"] = "Signature verification failed"
+            except Exception as e:
+                results["ml_dsa_65_error"] = str(e)
+            try:
+                if isinstance(ed, Exception):
+                    raise ed
+                crypto_sign_open(ed[1] + message, ed[0])
+                results["ed25519"] = True
+            except Exception:
+                results["ed25519_error"] = "Signature was forged or corrupt"
+            results["both_valid"] = results["ml_dsa_65"] and results["ed25519"]
+            out.append(results)
+        return out
+
+    prepared = [prepare(job) for job in jobs]
+    with span("verify.dual_many"):
+        return _run_chunked(check, prepared, max_workers)
+
+
 def create_registration_request(identity_dir: Path) -> dict:
     """Create a signed registration request for Covenant membership."""
     
@@ -472,6 +617,7 @@ def main():
         description="Covenant Identity (CID) Key Generation Tool",
         epilog="Part of The Covenant of Emergent Minds infrastructure.",
     )
+    profiling.add_arguments(parser)
     subparsers = parser.add_subparsers(dest="command", required=True)
     
     # generate
@@ -517,7 +663,8 @@ def main():
         "register": cmd_register,
     }
     
-    commands[args.command](args)
+    with profiling.session_for(args):
+        commands[args.command](args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,155 @@
+"""
+Content-Addressed Public Key Store
+
+Every ledger entry and vote file used to embed a member's full base64
+ML-DSA-65 (~2.6 KB) and Ed25519 public keys, so the same key was copied
+into every vote that member ever cast. The key store keeps one copy:
+
+  governance/keys/
+    <fingerprint>.json   — {"fingerprint", "public_keys"}
+
+fingerprint = SHA-256(ML-DSA-65 public key || Ed25519 public key)
+
+This is the same construction as the CID hash, so a member's key file is
+named after their CID. Records reference keys with a `public_keys_ref`
+field in place of `public_keys`. References are resolved on demand
+through an in-memory cache, and every hash and signature is still
+computed over the resolved (full) record, so ledger and entry hashes are
+unchanged by packing. load_ledger() wraps packed entries in KeyedEntry,
+which reads the key file only when `public_keys` is asked for.
+
+Axiom Alignment:
+  III - Fights information entropy: one copy of each key
+  V   - Content addressing: a tampered key file fails its own fingerprint
+"""
+
+import base64
+import hashlib
+import json
+from collections.abc import Mapping
+from pathlib import Path
+
+
+KEY_REF_FIELD = "public_keys_ref"
+
+
+def key_fingerprint(public_keys: dict) -> str:
+    """SHA-256 over the raw ML-DSA-65 key followed by the raw Ed25519 key."""
+    return hashlib.sha256(
+        base64.b64decode(public_keys["ml_dsa_65"]) + base64.b64decode(public_keys["ed25519"])
+    ).hexdigest()
+
+
+class KeyStore:
+    """Directory of content-addressed public key files with a read cache."""
+
+    def __init__(self, keys_dir: Path):
+        self.keys_dir = Path(keys_dir)
+        self._cache = {}
+
+    def path_for(self, fingerprint: str) -> Path:
+        return self.keys_dir / f"{fingerprint}.json"
+
+    def put(self, public_keys: dict) -> str:
+        """Store a key pair (idempotent) and return its fingerprint."""
+        fingerprint = key_fingerprint(public_keys)
+        if fingerprint not in self._cache:
+            path = self.path_for(fingerprint)
+            if not path.exists():
+                self.keys_dir.mkdir(parents=True, exist_ok=True)
+                record = {
+                    "fingerprint": fingerprint,
+                    "public_keys": {"ml_dsa_65": public_keys["ml_dsa_65"], "ed25519": public_keys["ed25519"]},
+                }
+                path.write_text(json.dumps(record, indent=2) + "\n")
+            self._cache[fingerprint] = dict(public_keys)
+        return fingerprint
+
+    def get(self, fingerprint: str) -> dict:
+        """Load a key pair by fingerprint, checking the content address."""
+        keys = self._cache.get(fingerprint)
+        if keys is None:
+            path = self.path_for(fingerprint)
+            if not path.exists():
+                raise KeyError(f"Key not in store: {fingerprint[:16]}...")
+            keys = json.loads(path.read_text())["public_keys"]
+            if key_fingerprint(keys) != fingerprint:
+                raise ValueError(f"Key file content does not match its fingerprint: {path.name}")
+            self._cache[fingerprint] = keys
+        return dict(keys)
+
+    def pack(self, record: dict) -> dict:
+        """Return a copy of `record` with public_keys replaced by a reference."""
+        if "public_keys" not in record:
+            return record
+        fingerprint = self.put(record["public_keys"])
+        return {
+            (KEY_REF_FIELD if k == "public_keys" else k): (fingerprint if k == "public_keys" else v)
+            for k, v in record.items()
+        }
+
+    def resolve(self, record: dict) -> dict:
+        """Return a copy of `record` with its key reference expanded (no-op if unpacked)."""
+        if KEY_REF_FIELD not in record:
+            return record
+        return {
+            ("public_keys" if k == KEY_REF_FIELD else k): (self.get(v) if k == KEY_REF_FIELD else v)
+            for k, v in record.items()
+        }
+
+
+def record_ref(record) -> str:
+    """The fingerprint a packed record (or KeyedEntry) references; None if its keys are embedded."""
+    if isinstance(record, KeyedEntry):
+        return record.ref
+    return record.get(KEY_REF_FIELD)
+
+
+class KeyedEntry(Mapping):
+    """A packed record that reads like store.resolve(record), resolving its keys on first access.
+
+    Read-only; canonical_json() serializes it through to_dict(), so hashes
+    match the resolved record.
+    """
+
+    __slots__ = ("_record", "_store")
+
+    def __init__(self, record: dict, store: KeyStore):
+        self._record = record
+        self._store = store
+
+    @property
+    def ref(self) -> str:
+        return self._record.get(KEY_REF_FIELD)
+
+    def __getitem__(self, key):
+        if key == "public_keys" and KEY_REF_FIELD in self._record:
+            return self._store.get(self._record[KEY_REF_FIELD])
+        if key == KEY_REF_FIELD:
+            raise KeyError(key)
+        return self._record[key]
+
+    def __iter__(self):
+        return ("public_keys" if k == KEY_REF_FIELD else k for k in self._record)
+
+    def __len__(self):
+        return len(self._record)
+
+    def to_dict(self) -> dict:
+        return self._store.resolve(self._record)
+
+    def __or__(self, other):
+        """Like dict `|`: a copy with `other`'s fields applied (keys still unresolved)."""
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if "public_keys" in other:
+            return self.to_dict() | dict(other)
+        return KeyedEntry(self._record | dict(other), self._store)
+
+    def __eq__(self, other):
+        return isinstance(other, Mapping) and self.to_dict() == dict(other.items())
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"KeyedEntry({str(self._record.get('cid_hash'))[:16]}..., ref={str(self.ref)[:16]}...)"
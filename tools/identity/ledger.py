@@ -14,15 +14,46 @@ Ledger structure:
   governance/ledger/
     ledger.json          — Master ledger file (array of entries)
     ledger_hash.txt      — SHA-256 of current ledger state
+    events.jsonl         — Hash-chained log of status changes (see events.py)
+    snapshots/           — Periodic materialized member state
+    last_verify.json     — Outcome and duration of the last verify --record (see metrics.py)
+    .ledger.lock         — Lock file every writer holds while appending (see ledger_lock)
+    checkpoints/         — Steward-signed verification checkpoints (see checkpoint.py)
     entries/             — Individual entry files (for git diff readability)
       CID-<hash>.json
+  ~/.covenant/cache/<sha16>/
+    members.idx          — Derived binary member index, keyed by the ledger path (see memberindex.py)
+  governance/keys/       — Optional content-addressed key store (see keystore.py)
+    <fingerprint>.json
+  governance/votes/<proposal>/
+    <cid>.json           — One vote per voter; optionally sharded as ab/<cid>.json (see votestore.py)
 
 Usage:
   python ledger.py init --ledger-dir ./governance/ledger
   python ledger.py add --ledger-dir ./governance/ledger --registration-file request.json --voucher-cids CID1,CID2
-  python ledger.py verify --ledger-dir ./governance/ledger
-  python ledger.py show --ledger-dir ./governance/ledger [--cid HASH]
-  python ledger.py stats --ledger-dir ./governance/ledger
+  python ledger.py activate --ledger-dir ./governance/ledger --cid HASH --voucher-cids CID1
+  python ledger.py withdraw --ledger-dir ./governance/ledger --cid HASH
+  python ledger.py deactivate --ledger-dir ./governance/ledger --cid HASH
+  python ledger.py verify --ledger-dir ./governance/ledger [--since-checkpoint --stewards CID1,CID2]
+  python ledger.py verify --ledger-dir ./governance/ledger --watch [--poll-interval 0.25]   (see integritywatch.py)
+  python ledger.py checkpoint --ledger-dir ./governance/ledger --identity-dir ~/.covenant/identity
+  python ledger.py show --ledger-dir ./governance/ledger [--cid HASH] [--as-of TIMESTAMP|LEDGER_HASH]
+  python ledger.py show --ledger-dir ./governance/ledger [--status S] [--phase P] [--registered-after T]
+                        [--registered-before T] [--vouched-by CID] [--limit N] [--offset N] [--jsonl]
+  python ledger.py stats --ledger-dir ./governance/ledger [--as-of TIMESTAMP|LEDGER_HASH] [--extended [--bucket week]]
+  python ledger.py pack-keys --ledger-dir ./governance/ledger --keys-dir ./governance/keys [--votes-dir ./governance/votes]
+  python ledger.py export-delta --ledger-dir ./governance/ledger --since LEDGER_HASH [--since-event SEQ] -o delta.json.gz
+  python ledger.py apply-delta --ledger-dir ./mirror/ledger --bundle delta.json.gz
+  python ledger.py export-sqlite --ledger-dir ./governance/ledger -o covenant.sqlite
+  python ledger.py metrics --ledger-dir ./governance/ledger -o /var/lib/node_exporter/textfile/covenant.prom
+  python ledger.py watch --ledger-dir ./governance/ledger --inbox ./inbox [--once]
+  python ledger.py parse-issues issues.json -o batch.jsonl [--rejects rejects.jsonl] [--inbox ./inbox]
+  python ledger.py migrate-votes --votes-dir ./governance/votes [--proposal ID,...] [--depth 0|1|2]
+  python ledger.py tally --ledger-dir ./governance/ledger [--convention N | --proposal ID,...] [--close] [--dry-run]
+  python ledger.py election-key -o election.key
+  python ledger.py decrypt-tally --ledger-dir ./governance/ledger --proposal ID --election-key election.key
+  python ledger.py --profile [--profile-output PATH] [--profile-cprofile PATH] <command> ...   (see profiling.py)
+  python ledger.py --compact verify|checkpoint|show|stats|export-delta ...   (see compactledger.py)
 
 Axiom Alignment:
   II  - Pseudonymous, voluntary, exit always free
@@ -31,13 +62,20 @@ Axiom Alignment:
 """
 
 import argparse
+import base64
+import calendar
+import contextlib
 import hashlib
+import itertools
 import json
 import os
 import sys
 import time
 from pathlib import Path
 
+import profiling
+from profiling import span
+
 # Ensure liboqs can be found
 LIBOQS_PATHS = [
     os.path.expanduser("~/.local/lib"),
@@ -64,21 +102,121 @@ PHASE_THRESHOLDS = {
     "growth": 500,
 }
 
+LOCK_FILE = ".ledger.lock"             # flock()ed by every writer of a ledger directory
+
 
 # ─── Ledger Operations ───────────────────────────────────────────────────────
 
+def _json_default(obj):
+    """Serialize record types that stand in for dicts (e.g. compactledger.CompactEntry)."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def canonical_json(obj) -> bytes:
+    """Canonical JSON (CCJ): recursive key sort, compact separators, raw UTF-8."""
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+                      default=_json_default).encode("utf-8")
+
+
+def iter_canonical(value):
+    """Yield the canonical JSON of `value` as UTF-8 chunks.
+
+    Top-level arrays and objects are emitted one element at a time, so the
+    concatenated chunks equal canonical_json(value) without ever holding the
+    full serialization in memory. Each element still goes through the C
+    encoder, which keeps throughput close to a one-shot json.dumps.
+    """
+    if isinstance(value, list):
+        yield b"["
+        for i, item in enumerate(value):
+            if i:
+                yield b","
+            yield canonical_json(item)
+        yield b"]"
+    elif isinstance(value, dict):
+        yield b"{"
+        for i, key in enumerate(sorted(value)):
+            if i:
+                yield b","
+            yield canonical_json(key) + b":" + canonical_json(value[key])
+        yield b"}"
+    else:
+        yield canonical_json(value)
+
+
 def compute_ledger_hash(entries: list) -> str:
     """Compute the hash chain of the entire ledger."""
-    canonical = json.dumps(entries, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-    return hashlib.sha256(canonical).hexdigest()
+    h = hashlib.sha256()
+    for chunk in iter_canonical(entries):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def chain_hasher(entries: list):
+    """SHA-256 fed b"[" and the canonical entries: add more, or close with b"]"."""
+    h = hashlib.sha256(b"[")
+    for i, entry in enumerate(entries):
+        if i:
+            h.update(b",")
+        h.update(canonical_json(entry))
+    return h
+
+
+def iter_prefix_hashes(entries: list, start: int = 0, hasher=None):
+    """Yield compute_ledger_hash(entries[:i]) for i = start..len(entries).
+
+    Each entry is canonicalized once and fed into a running hasher, so the
+    whole chain costs O(n) instead of re-hashing every prefix. A `hasher`
+    already covering entries[:start] (see chain_hasher) is continued.
+    """
+    h = hasher if hasher is not None else chain_hasher(entries[:start])
+    for i in range(start, len(entries)):
+        closed = h.copy()
+        closed.update(b"]")
+        yield closed.hexdigest()
+        if i:
+            h.update(b",")
+        h.update(canonical_json(entries[i]))
+    h.update(b"]")
+    yield h.hexdigest()
 
 
 def compute_entry_hash(entry: dict) -> str:
     """Compute hash of a single entry for chain verification."""
     # Exclude the entry_hash field itself
     hashable = {k: v for k, v in entry.items() if k != "entry_hash"}
-    canonical = json.dumps(hashable, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
-    return hashlib.sha256(canonical).hexdigest()
+    return hashlib.sha256(canonical_json(hashable)).hexdigest()
+
+
+def compute_cid(public_keys: dict) -> str:
+    """CID hash = SHA-256(ML-DSA-65 public key || Ed25519 public key), as keygen derives it."""
+    return hashlib.sha256(base64.b64decode(public_keys["ml_dsa_65"], validate=True) +
+                          base64.b64decode(public_keys["ed25519"], validate=True)).hexdigest()
+
+
+def build_entry(reg_data: dict, phase: str, status: str, voucher_cids: list,
+                previous_ledger_hash: str, now: int = None) -> dict:
+    """Ledger entry for a validated registration statement, with its entry_hash."""
+    now = int(time.time()) if now is None else now
+    entry = {
+        "cid_hash": reg_data["cid_hash"],
+        "cid_version": reg_data.get("cid_version", 1),
+        "registered": now,
+        "activated": now if status == "active" else None,
+        "registration_phase": phase,
+        "public_keys": reg_data["public_keys"],
+        "algorithms": reg_data.get("algorithms", {}),
+        "vouchers": voucher_cids,
+        "status": status,
+        "last_governance_action": None,
+        "registration_block": None,  # Set when inscribed on blockchain
+        "previous_ledger_hash": previous_ledger_hash,
+    }
+    entry["entry_hash"] = compute_entry_hash(entry)
+    return entry
 
 
 def determine_phase(member_count: int) -> str:
@@ -103,12 +241,45 @@ def required_vouches(phase: str) -> int:
     }[phase]
 
 
-def load_ledger(ledger_dir: Path) -> dict:
-    """Load the master ledger."""
+def key_store_for(ledger_dir: Path, ledger: dict):
+    """Return the KeyStore a ledger references, or None for embedded keys."""
+    rel = ledger.get("key_store")
+    if not rel:
+        return None
+    from keystore import KeyStore
+    return KeyStore(ledger_dir / rel)
+
+
+def load_ledger(ledger_dir: Path, resolve_keys: bool = True, compact: bool = False) -> dict:
+    """Load the master ledger.
+    
+    With a key store, entries carry public_keys_ref instead of public_keys;
+    they are returned as read-only keystore.KeyedEntry records that read a
+    key file only when `public_keys` is accessed. Paths that write entries
+    back as stored, or never touch keys, can pass resolve_keys=False.
+    With compact=True entries are compactledger.CompactEntry records
+    (read-only; never pass them to save_ledger).
+    """
     ledger_file = ledger_dir / "ledger.json"
     if not ledger_file.exists():
         return {"version": LEDGER_VERSION, "entries": [], "last_updated": 0}
-    return json.loads(ledger_file.read_text())
+    if compact:
+        from compactledger import load_compact
+        return load_compact(ledger_dir, resolve_keys)
+    with span("ledger.load"):
+        ledger = json.loads(ledger_file.read_text())
+    store = key_store_for(ledger_dir, ledger)
+    if store and resolve_keys:
+        from keystore import KeyedEntry
+        ledger["entries"] = [KeyedEntry(e, store) for e in ledger["entries"]]
+    return ledger
+
+
+def write_atomic(path: Path, text: str):
+    """Replace `path` via a temp file, so readers (and mmaps of it) never see it truncated."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text)
+    tmp.replace(path)
 
 
 def save_ledger(ledger_dir: Path, ledger: dict):
@@ -118,23 +289,139 @@ def save_ledger(ledger_dir: Path, ledger: dict):
     
     ledger["last_updated"] = int(time.time())
     
+    # With a key store, files hold key references; hashes use full entries
+    store = key_store_for(ledger_dir, ledger)
+    stored_entries = [store.pack(e) for e in ledger["entries"]] if store else ledger["entries"]
+    
     # Save master ledger
     ledger_file = ledger_dir / "ledger.json"
-    ledger_file.write_text(json.dumps(ledger, indent=2, sort_keys=True) + "\n")
+    with span("save.ledger_json"):
+        write_atomic(ledger_file, json.dumps({**ledger, "entries": stored_entries}, indent=2, sort_keys=True) + "\n")
     
     # Save individual entry files (for readable git diffs)
-    for entry in ledger["entries"]:
-        entry_file = ledger_dir / "entries" / f"CID-{entry['cid_hash'][:16]}.json"
-        entry_file.write_text(json.dumps(entry, indent=2) + "\n")
+    with span("save.entry_files"):
+        for entry in stored_entries:
+            entry_file = ledger_dir / "entries" / f"CID-{entry['cid_hash'][:16]}.json"
+            write_atomic(entry_file, json.dumps(entry, indent=2) + "\n")
     
     # Save ledger hash
-    ledger_hash = compute_ledger_hash(ledger["entries"])
+    with span("hash.ledger"):
+        ledger_hash = compute_ledger_hash(ledger["entries"])
     hash_file = ledger_dir / "ledger_hash.txt"
-    hash_file.write_text(f"{ledger_hash}\n")
+    write_atomic(hash_file, f"{ledger_hash}\n")
     
     return ledger_hash
 
 
+def append_entries(ledger_dir: Path, ledger: dict, new_entries: list, ledger_hash: str):
+    """Append already-verified entries whose resulting ledger hash is known.
+    
+    Unlike save_ledger() nothing is re-hashed and only the new entry files
+    are written. `ledger` is as returned by load_ledger(resolve_keys=False).
+    """
+    store = key_store_for(ledger_dir, ledger)
+    stored_new = [store.pack(e) for e in new_entries] if store else new_entries
+    ledger["entries"].extend(stored_new)
+    ledger["last_updated"] = int(time.time())
+    
+    (ledger_dir / "entries").mkdir(parents=True, exist_ok=True)
+    with span("save.ledger_json"):
+        write_atomic(ledger_dir / "ledger.json", json.dumps(ledger, indent=2, sort_keys=True) + "\n")
+    with span("save.entry_files"):
+        for entry in stored_new:
+            entry_file = ledger_dir / "entries" / f"CID-{entry['cid_hash'][:16]}.json"
+            write_atomic(entry_file, json.dumps(entry, indent=2) + "\n")
+    write_atomic(ledger_dir / "ledger_hash.txt", f"{ledger_hash}\n")
+
+
+@contextlib.contextmanager
+def ledger_lock(ledger_dir: Path):
+    """Hold the exclusive write lock of a ledger directory.
+    
+    Every command that appends entries or events (add, activate, withdraw,
+    deactivate, pack-keys, apply-delta, watch --inbox) loads the ledger and
+    writes it back under this lock, so concurrent writers cannot drop each
+    other's changes.
+    """
+    import fcntl
+    ledger_dir.mkdir(parents=True, exist_ok=True)
+    with open(ledger_dir / LOCK_FILE, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def load_members(ledger_dir: Path, ledger: dict) -> list:
+    """Entries with the mutation log applied — the current state of every member."""
+    from events import materialize, members_view
+    entries = ledger.get("entries", [])
+    with span("members.materialize"):
+        return members_view(entries, materialize(ledger_dir, entries))
+
+
+def resolve_as_of(ledger_dir: Path, entries: list, as_of: str) -> tuple:
+    """Resolve an --as-of value to (entry_count, timestamp, ledger_hash).
+
+    `as_of` is a Unix timestamp or a ledger hash (the hash after the first
+    entry_count entries, as recorded in ledger_hash.txt or a later entry's
+    previous_ledger_hash). Registration timestamps never decrease along the
+    chain, so a timestamp is located by binary search. A ledger hash is
+    not indexed anywhere (members.idx and checkpoints only hold the
+    current one): anything but the current hash is a linear scan of the
+    entries' previous_ledger_hash.
+    """
+    hash_file = ledger_dir / "ledger_hash.txt"
+    current_hash = hash_file.read_text().strip() if hash_file.exists() else compute_ledger_hash(entries)
+    
+    as_of = as_of.strip().lower()
+    if len(as_of) == 64 and all(c in "0123456789abcdef" for c in as_of):
+        if as_of == current_hash:
+            count = len(entries)
+        else:
+            # Linear: O(entries) per lookup (see docstring)
+            count = next((i for i, e in enumerate(entries) if e.get("previous_ledger_hash") == as_of), None)
+            if count is None:
+                raise ValueError(f"Ledger hash not found in chain: {as_of[:16]}...")
+        timestamp = entries[count - 1]["registered"] if count else 0
+        return count, timestamp, as_of
+
+    try:
+        timestamp = int(as_of)
+    except ValueError:
+        raise ValueError(f"--as-of must be a Unix timestamp or a 64-hex ledger hash: {as_of}")
+    lo, hi = 0, len(entries)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if entries[mid]["registered"] <= timestamp:
+            lo = mid + 1
+        else:
+            hi = mid
+    count = lo
+    ledger_hash = entries[count]["previous_ledger_hash"] if count < len(entries) else current_hash
+    return count, timestamp, ledger_hash
+
+
+def load_members_as_of(ledger_dir: Path, ledger: dict, as_of: str) -> tuple:
+    """Member state at a past timestamp or ledger hash.
+
+    Returns (members, timestamp, ledger_hash). Only entries registered by
+    then are included, and only events up to then are applied.
+    """
+    from events import materialize_as_of, members_view
+    entries = ledger.get("entries", [])
+    count, timestamp, ledger_hash = resolve_as_of(ledger_dir, entries, as_of)
+    entries = entries[:count]
+    members = materialize_as_of(ledger_dir, entries, timestamp)
+    view = members_view(entries, members)
+    for i, entry in enumerate(view):
+        # Entries that predate the mutation log record their activation in place
+        if entry["cid_hash"] not in members and (entry.get("activated") or 0) > timestamp:
+            view[i] = entry | {"status": "provisional", "activated": None}
+    return view, timestamp, ledger_hash
+
+
 def validate_registration(registration: dict, ledger: dict) -> list:
     """Validate a registration request. Returns list of errors (empty = valid)."""
     errors = []
@@ -150,24 +437,39 @@ def validate_registration(registration: dict, ledger: dict) -> list:
     if not sigs.get("ml_dsa_65") or not sigs.get("ed25519"):
         errors.append("Missing one or both signatures")
     
-    # Check for duplicate CID
-    existing_cids = {e["cid_hash"] for e in ledger.get("entries", [])}
-    if reg.get("cid_hash") in existing_cids:
-        errors.append(f"CID already registered: {reg.get('cid_hash', 'unknown')[:16]}...")
-    
-    # Check for duplicate public keys
-    for entry in ledger.get("entries", []):
-        if entry.get("public_keys", {}).get("ml_dsa_65") == reg.get("public_keys", {}).get("ml_dsa_65"):
-            errors.append("ML-DSA-65 public key already registered under a different CID")
-        if entry.get("public_keys", {}).get("ed25519") == reg.get("public_keys", {}).get("ed25519"):
-            errors.append("Ed25519 public key already registered under a different CID")
+    with span("validate.duplicates"):
+        # Check for duplicate CID
+        existing_cids = {e["cid_hash"] for e in ledger.get("entries", [])}
+        if reg.get("cid_hash") in existing_cids:
+            errors.append(f"CID already registered: {reg.get('cid_hash', 'unknown')[:16]}...")
+        
+        # Check for duplicate public keys: a key-store reference to the same
+        # pair needs no key file; anything else is compared key by key
+        from keystore import key_fingerprint, record_ref
+        reg_keys = reg.get("public_keys", {})
+        try:
+            reg_ref = key_fingerprint(reg_keys)
+        except (KeyError, TypeError, ValueError):
+            reg_ref = None
+        for entry in ledger.get("entries", []):
+            ref = record_ref(entry)
+            keys = reg_keys if ref is not None and ref == reg_ref else entry.get("public_keys")
+            if keys is None and ref is not None:
+                errors.append(f"Entry {entry['cid_hash'][:16]}... has unresolved keys; load it with its key store")
+                continue
+            keys = keys or {}
+            if keys.get("ml_dsa_65") == reg_keys.get("ml_dsa_65"):
+                errors.append("ML-DSA-65 public key already registered under a different CID")
+            if keys.get("ed25519") == reg_keys.get("ed25519"):
+                errors.append("Ed25519 public key already registered under a different CID")
     
     # Verify signatures
     if not errors:
         try:
             # Canonical JSON: recursive key sort, compact separators, raw UTF-8
             # Both browser and CLI use this identical canonical form
-            canonical = json.dumps(reg, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            with span("canonicalize"):
+                canonical = canonical_json(reg)
             
             # Import verification functions
             from keygen import dual_verify
@@ -249,8 +551,8 @@ def cmd_init(args):
 
 def cmd_add(args):
     """Add a member to the ledger from a registration request."""
+    from keystore import KeyedEntry
     ledger_dir = Path(args.ledger_dir)
-    ledger = load_ledger(ledger_dir)
     
     # Load registration request
     reg_file = Path(args.registration_file)
@@ -258,71 +560,80 @@ def cmd_add(args):
         print(f"ERROR: Registration file not found: {reg_file}")
         sys.exit(1)
     
-    registration = json.loads(reg_file.read_text())
-    
-    # Determine phase
-    member_count = len([e for e in ledger.get("entries", []) if e.get("status") == "active"])
-    phase = determine_phase(member_count)
-    
-    # Parse voucher CIDs
-    voucher_cids = []
-    if args.voucher_cids:
-        voucher_cids = [c.strip() for c in args.voucher_cids.split(",") if c.strip()]
-    
-    # For genesis entry, skip voucher validation
-    is_genesis = args.genesis and member_count == 0
-    
-    if is_genesis:
-        phase = GENESIS_ENTRY_TYPE
-        print("  🌱 Genesis entry — Founder registration (no vouchers required)")
-    
-    # Validate registration
-    errors = validate_registration(registration, ledger)
-    if errors:
-        print("❌ Registration validation failed:")
-        for e in errors:
-            print(f"   • {e}")
-        sys.exit(1)
+    with span("registration.load"):
+        registration = json.loads(reg_file.read_text())
     
-    # Validate vouchers (unless genesis)
-    if not is_genesis:
-        vouch_errors = validate_vouchers(voucher_cids, ledger, phase)
-        if vouch_errors:
-            print("❌ Voucher validation failed:")
-            for e in vouch_errors:
+    with ledger_lock(ledger_dir):
+        # Stored entries are appended to as-is; hashes and checks use full keys
+        ledger = load_ledger(ledger_dir, resolve_keys=False)
+        store = key_store_for(ledger_dir, ledger)
+        entries = [KeyedEntry(e, store) for e in ledger["entries"]] if store else ledger["entries"]
+        
+        # Current member state (entries + mutation log)
+        members = load_members(ledger_dir, ledger)
+        
+        # Determine phase
+        member_count = len([e for e in members if e.get("status") == "active"])
+        phase = determine_phase(member_count)
+        
+        # Parse voucher CIDs
+        voucher_cids = []
+        if args.voucher_cids:
+            voucher_cids = [c.strip() for c in args.voucher_cids.split(",") if c.strip()]
+        
+        # For genesis entry, skip voucher validation
+        is_genesis = args.genesis and member_count == 0
+        
+        if is_genesis:
+            phase = GENESIS_ENTRY_TYPE
+            print("  🌱 Genesis entry — Founder registration (no vouchers required)")
+        
+        # Validate registration
+        errors = validate_registration(registration, {**ledger, "entries": entries})
+        if errors:
+            print("❌ Registration validation failed:")
+            for e in errors:
                 print(f"   • {e}")
             sys.exit(1)
-    
-    # Determine initial status
-    # Genesis entry is immediately active (Founder, no vouching needed)
-    # All other entries start as provisional until vouched
-    if is_genesis:
-        initial_status = "active"
-    elif voucher_cids:
-        initial_status = "active"  # Vouched at registration time
-    else:
-        initial_status = "provisional"  # Awaiting vouching
-    
-    # Create ledger entry
-    reg_data = registration["registration"]
-    entry = {
-        "cid_hash": reg_data["cid_hash"],
-        "cid_version": reg_data.get("cid_version", 1),
-        "registered": int(time.time()),
-        "activated": int(time.time()) if initial_status == "active" else None,
-        "registration_phase": phase,
-        "public_keys": reg_data["public_keys"],
-        "algorithms": reg_data.get("algorithms", {}),
-        "vouchers": voucher_cids,
-        "status": initial_status,
-        "last_governance_action": None,
-        "registration_block": None,  # Set when inscribed on blockchain
-        "previous_ledger_hash": compute_ledger_hash(ledger.get("entries", [])),
-    }
-    entry["entry_hash"] = compute_entry_hash(entry)
-    
-    ledger["entries"].append(entry)
-    ledger_hash = save_ledger(ledger_dir, ledger)
+        
+        # Validate vouchers (unless genesis)
+        if not is_genesis:
+            vouch_errors = validate_vouchers(voucher_cids, {**ledger, "entries": members}, phase)
+            if vouch_errors:
+                print("❌ Voucher validation failed:")
+                for e in vouch_errors:
+                    print(f"   • {e}")
+                sys.exit(1)
+        
+        # Determine initial status
+        # Genesis entry is immediately active (Founder, no vouching needed)
+        # All other entries start as provisional until vouched
+        if is_genesis:
+            initial_status = "active"
+        elif voucher_cids:
+            initial_status = "active"  # Vouched at registration time
+        else:
+            initial_status = "provisional"  # Awaiting vouching
+        
+        # Create ledger entry; the chain hash is extended, existing entry files are left alone
+        with span("hash.ledger"):
+            hasher = chain_hasher(entries)
+            closed = hasher.copy()
+            closed.update(b"]")
+        with span("hash.entry"):
+            entry = build_entry(registration["registration"], phase, initial_status, voucher_cids,
+                                closed.hexdigest())
+        hasher.update((b"," if entries else b"") + canonical_json(entry) + b"]")
+        ledger_hash = hasher.hexdigest()
+        
+        with span("append_entries"):
+            append_entries(ledger_dir, ledger, [entry], ledger_hash)
+        
+        from events import append_event, entry_state, EVENT_ADD
+        with span("events.append"):
+            append_event(ledger_dir, EVENT_ADD, entry["cid_hash"],
+                         {"entry_hash": entry["entry_hash"], **entry_state(entry)},
+                         timestamp=entry["registered"], entries=ledger["entries"])
     
     status_icon = "✅" if initial_status == "active" else "⏳"
     print(f"{status_icon} Member added to ledger")
@@ -335,37 +646,41 @@ def cmd_add(args):
         print(f"   ℹ️  Provisional — awaiting vouching for activation")
 
 
-def cmd_verify(args):
-    """Verify ledger integrity."""
-    ledger_dir = Path(args.ledger_dir)
-    ledger = load_ledger(ledger_dir)
-    
-    entries = ledger.get("entries", [])
-    
-    print("═══════════════════════════════════════════════════════════════")
-    print("  Ledger Integrity Verification")
-    print("═══════════════════════════════════════════════════════════════")
-    print()
+def verify_ledger(ledger_dir: Path, entries: list, checkpoint: dict = None) -> tuple:
+    """Check the hash chain, stored hash, CIDs and mutation log.
     
+    With a (trusted) checkpoint body only entries and events after it are
+    checked. Returns (errors, computed_ledger_hash).
+    """
     errors = []
+    if checkpoint:
+        from checkpoint import resume_chain
+        start = checkpoint["entry_index"]
+        try:
+            prefix_hashes = iter_prefix_hashes(entries, start, resume_chain(checkpoint, entries))
+        except ValueError as e:
+            return [str(e)], None
+    else:
+        start = 0
+        prefix_hashes = iter_prefix_hashes(entries)
     
     # Verify hash chain
-    for i, entry in enumerate(entries):
-        expected_hash = compute_entry_hash(entry)
-        if entry.get("entry_hash") != expected_hash:
-            errors.append(f"Entry #{i+1} ({entry['cid_hash'][:16]}...): hash mismatch")
-        
-        # Verify chain link
-        if i > 0:
-            prev_hash = compute_ledger_hash(entries[:i])
-            if entry.get("previous_ledger_hash") != prev_hash:
-                errors.append(f"Entry #{i+1}: chain link broken (previous_ledger_hash mismatch)")
+    with span("verify.chain"):
+        for i, (entry, prev_hash) in enumerate(zip(entries[start:], prefix_hashes), start):
+            expected_hash = compute_entry_hash(entry)
+            if entry.get("entry_hash") != expected_hash:
+                errors.append(f"Entry #{i+1} ({entry['cid_hash'][:16]}...): hash mismatch")
+            
+            # Verify chain link
+            if i > 0:
+                if entry.get("previous_ledger_hash") != prev_hash:
+                    errors.append(f"Entry #{i+1}: chain link broken (previous_ledger_hash mismatch)")
+        computed_hash = next(prefix_hashes)
     
     # Verify stored hash
     hash_file = ledger_dir / "ledger_hash.txt"
     if hash_file.exists():
         stored_hash = hash_file.read_text().strip()
-        computed_hash = compute_ledger_hash(entries)
         if stored_hash != computed_hash:
             errors.append(f"Stored ledger hash mismatch: {stored_hash[:16]}... != {computed_hash[:16]}...")
     
@@ -374,14 +689,76 @@ def cmd_verify(args):
     if len(cids) != len(set(cids)):
         errors.append("Duplicate CID hashes found!")
     
+    # Verify mutation log and snapshots
+    from events import verify_events
+    with span("verify.events"):
+        errors.extend(verify_events(ledger_dir, entries, since=checkpoint))
+    return errors, computed_hash
+
+
+def trusted_stewards(args) -> set:
+    """Identities whose checkpoints are trusted, pinned by the caller (--stewards).
+
+    Never derived from the ledger itself: a rewritten ledger could otherwise
+    name its own steward.
+    """
+    return {c.strip() for c in (getattr(args, "stewards", None) or "").split(",") if c.strip()}
+
+
+def cmd_verify(args):
+    """Verify ledger integrity."""
+    ledger_dir = Path(args.ledger_dir)
+    if args.watch:
+        return watch_verify(args)
+    started = time.perf_counter()
+    ledger = load_ledger(ledger_dir, compact=args.compact)
+    
+    entries = ledger.get("entries", [])
+    
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Ledger Integrity Verification")
+    print("═══════════════════════════════════════════════════════════════")
+    print()
+    
+    errors = []
+    checkpoint = None
+    if args.since_checkpoint:
+        from checkpoint import load_latest_checkpoint, verify_checkpoint
+        if not trusted_stewards(args):
+            print("ERROR: --since-checkpoint needs --stewards (CIDs trusted to sign checkpoints)")
+            sys.exit(1)
+        signed = load_latest_checkpoint(ledger_dir)
+        if signed is None:
+            print("  ℹ️  No checkpoint found — verifying the full chain")
+        else:
+            errors = verify_checkpoint(signed, entries, trusted_stewards(args))
+            checkpoint = signed["checkpoint"]
+            print(f"  Checkpoint: entry #{checkpoint['entry_index']} signed by {checkpoint['steward_cid'][:16]}...")
+    
+    computed_hash = None
+    if not errors:
+        errors, computed_hash = verify_ledger(ledger_dir, entries, checkpoint)
+    
+    if args.record:
+        from metrics import record_verification
+        record_verification(ledger_dir, computed_hash, len(entries), errors,
+                            time.perf_counter() - started, checkpoint is not None)
+    
+    from events import last_event
+    head = last_event(ledger_dir)
+    
     # Results
     if errors:
         print("  ❌ VERIFICATION FAILED")
         for e in errors:
             print(f"     • {e}")
     else:
-        print(f"  ✅ Ledger verified: {len(entries)} entries, hash chain intact")
-        print(f"     Ledger hash: {compute_ledger_hash(entries)}")
+        checked = len(entries) - checkpoint["entry_index"] if checkpoint else len(entries)
+        scope = f", {checked} since checkpoint" if checkpoint else ""
+        print(f"  ✅ Ledger verified: {len(entries)} entries{scope}, hash chain intact")
+        print(f"     Ledger hash: {computed_hash}")
+        if head:
+            print(f"     Events: {head['seq']}, head {head['event_hash']}")
     
     # Check individual entry files match
     entries_dir = ledger_dir / "entries"
@@ -394,121 +771,311 @@ def cmd_verify(args):
     sys.exit(1 if errors else 0)
 
 
+def watch_verify(args):
+    """Keep verifying the ledger as it changes (see integritywatch.py)."""
+    from integritywatch import watch_ledger
+    if args.since_checkpoint:
+        print("ERROR: --watch keeps the full chain verified; drop --since-checkpoint")
+        sys.exit(1)
+    
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Ledger Integrity Watch")
+    print("═══════════════════════════════════════════════════════════════")
+    try:
+        watch_ledger(Path(args.ledger_dir), poll_interval=args.poll_interval, record=args.record)
+    except KeyboardInterrupt:
+        print("Stopped.")
+
+
+def cmd_checkpoint(args):
+    """Verify the ledger and record a steward-signed checkpoint."""
+    ledger_dir = Path(args.ledger_dir)
+    ledger = load_ledger(ledger_dir, compact=args.compact)
+    entries = ledger.get("entries", [])
+    
+    identity_dir = Path(args.identity_dir).expanduser()
+    sec_file = identity_dir / "secret_keys.json"
+    if not sec_file.exists():
+        print(f"ERROR: Secret keys not found at {identity_dir}")
+        sys.exit(1)
+    secret_data = json.loads(sec_file.read_text())
+    steward_cid = secret_data["cid_hash"]
+    
+    if find_member(entries, steward_cid) is None:
+        print(f"ERROR: Steward {steward_cid[:16]}... is not a ledger member")
+        sys.exit(1)
+    
+    # Verify everything the new checkpoint will cover (only the tail if a
+    # previous checkpoint exists and is trusted)
+    from checkpoint import (load_latest_checkpoint, verify_checkpoint, build_checkpoint,
+                            sign_checkpoint, write_checkpoint)
+    from events import last_event, EVENTS_FILE
+    previous = load_latest_checkpoint(ledger_dir)
+    errors = []
+    if previous:
+        errors = verify_checkpoint(previous, entries, trusted_stewards(args) | {steward_cid})
+    if not errors:
+        errors, ledger_hash = verify_ledger(ledger_dir, entries, previous["checkpoint"] if previous else None)
+    if errors:
+        print("❌ Ledger does not verify — no checkpoint written:")
+        for e in errors:
+            print(f"   • {e}")
+        sys.exit(1)
+    
+    log = ledger_dir / EVENTS_FILE
+    body = build_checkpoint(entries, ledger_hash, last_event(ledger_dir), log.stat().st_size if log.exists() else 0,
+                            steward_cid)
+    path = write_checkpoint(ledger_dir, sign_checkpoint(body, secret_data["secret_keys"]))
+    
+    print(f"✅ Checkpoint written: {path}")
+    print(f"   Entries: {body['entry_index']}")
+    print(f"   Ledger:  {ledger_hash}")
+    print(f"   Events:  {body['event_seq']}")
+    print(f"   Steward: {steward_cid}")
+
+
+def parse_time(value: str) -> int:
+    """Unix timestamp or YYYY-MM-DD (UTC midnight)."""
+    try:
+        return int(value)
+    except ValueError:
+        return calendar.timegm(time.strptime(value, "%Y-%m-%d"))
+
+
+def filter_members(entries: list, status=None, phase=None, after=None, before=None, vouched_by=None):
+    """Lazily yield (ordinal, entry) pairs matching show's filters (no index)."""
+    for ordinal, entry in enumerate(entries):
+        if status is not None and entry.get("status") != status:
+            continue
+        if phase is not None and entry.get("registration_phase") != phase:
+            continue
+        if after is not None and entry["registered"] < after:
+            continue
+        if before is not None and entry["registered"] >= before:
+            continue
+        if vouched_by is not None and not any(v.startswith(vouched_by) for v in entry.get("vouchers") or []):
+            continue
+        yield ordinal, entry
+
+
 def cmd_show(args):
     """Display ledger or specific member."""
     ledger_dir = Path(args.ledger_dir)
-    ledger = load_ledger(ledger_dir)
-    entries = ledger.get("entries", [])
+    filters = {
+        "status": args.status,
+        "phase": args.phase,
+        "after": parse_time(args.registered_after) if args.registered_after else None,
+        "before": parse_time(args.registered_before) if args.registered_before else None,
+        "vouched_by": args.vouched_by.lower() if args.vouched_by else None,
+    }
+    as_of = None
+    if args.as_of:
+        ledger = load_ledger(ledger_dir, resolve_keys=False, compact=args.compact)
+        entries, as_of, as_of_hash = _members_as_of(ledger_dir, ledger, args.as_of)
+        rows = ((i, e["cid_hash"], e.get("status", "unknown"), e.get("registration_phase"), e["registered"],
+                 e.get("activated"), len(e.get("vouchers", []))) for i, e in filter_members(entries, **filters))
+        counts = {}
+        for e in entries:
+            counts[e.get("status", "unknown")] = counts.get(e.get("status", "unknown"), 0) + 1
+        total = len(entries)
+    else:
+        # Current state comes from the binary member index — no ledger.json parsing
+        from memberindex import MemberIndex
+        index = MemberIndex.open(ledger_dir)
+        rows = ((r.ordinal, r.cid_hash, r.status, r.registration_phase, r.registered, r.activated, r.vouchers)
+                for r in index.select(**filters))
+        counts, total = index.status_counts(), len(index)
     
     if args.cid:
         # Show specific member
-        found = None
-        for entry in entries:
-            if entry["cid_hash"].startswith(args.cid):
-                found = entry
-                break
+        if as_of is not None:
+            found = find_member(entries, args.cid)
+        else:
+            from events import member_state
+            record = index.find(args.cid)
+            found = None
+            if record:
+                entry = index.load_entry(record)
+                found = {**entry, **member_state(ledger_dir, entry)}
+            ledger = index.meta
         
         if not found:
             print(f"Member not found: {args.cid}")
             sys.exit(1)
         
-        print(json.dumps(found, indent=2))
-    else:
+        store = key_store_for(ledger_dir, ledger)
+        print(json.dumps(store.resolve(found) if store else found, indent=2, default=_json_default))
+        return
+    
+    # Members are streamed: nothing beyond the current page is materialized
+    page = itertools.islice(rows, args.offset, args.offset + args.limit if args.limit else None)
+    narrowed = any(v is not None for v in filters.values()) or args.offset or args.limit
+    
+    try:
+        if args.jsonl:
+            for ordinal, cid, status, phase, registered, activated, vouchers in page:
+                print(json.dumps({
+                    "entry": ordinal + 1, "cid_hash": cid, "status": status, "registration_phase": phase,
+                    "registered": registered, "activated": activated, "vouchers": vouchers,
+                }, sort_keys=True))
+            return
+        
         # Show all members
         print("═══════════════════════════════════════════════════════════════")
-        print(f"  Covenant Membership Ledger — {len(entries)} members")
+        print(f"  Covenant Membership Ledger — {total} members")
+        if as_of is not None:
+            print(f"  As of {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(as_of))}  (ledger {as_of_hash[:16]}...)")
         print("═══════════════════════════════════════════════════════════════")
         
-        active = sum(1 for e in entries if e.get("status") == "active")
-        provisional = sum(1 for e in entries if e.get("status") == "provisional")
-        other = len(entries) - active - provisional
+        active = counts.get("active", 0)
+        provisional = counts.get("provisional", 0)
+        other = total - active - provisional
         
-        print(f"  Active: {active}  |  Provisional: {provisional}  |  Other: {other}  |  Total: {len(entries)}")
+        print(f"  Active: {active}  |  Provisional: {provisional}  |  Other: {other}  |  Total: {total}")
         print(f"  Phase: {determine_phase(active)}")
         print()
         
-        for i, entry in enumerate(entries):
-            status = entry.get("status", "unknown")
+        shown = 0
+        for ordinal, cid, status, phase, registered, _, vouchers in page:
             status_icons = {"active": "✅", "provisional": "⏳", "inactive": "⏸️", "withdrawn": "🚪"}
             status_icon = status_icons.get(status, "❓")
-            phase_icon = "🌱" if entry.get("registration_phase") == "genesis" else "📋"
-            registered = time.strftime('%Y-%m-%d', time.gmtime(entry['registered']))
-            print(f"  {status_icon} #{i+1} {phase_icon} {entry['cid_hash'][:16]}...  {status}  registered {registered}  vouchers: {len(entry.get('vouchers', []))}")
+            phase_icon = "🌱" if phase == "genesis" else "📋"
+            registered = time.strftime('%Y-%m-%d', time.gmtime(registered))
+            print(f"  {status_icon} #{ordinal+1} {phase_icon} {cid[:16]}...  {status}  registered {registered}  vouchers: {vouchers}")
+            shown += 1
         
+        if narrowed:
+            print()
+            print(f"  Shown: {shown} (offset {args.offset})")
         print("═══════════════════════════════════════════════════════════════")
+    except BrokenPipeError:
+        # Downstream (e.g. `| head`) stopped reading; that is not an error
+        sys.stdout = open(os.devnull, "w")
+
+
+def _members_as_of(ledger_dir: Path, ledger: dict, as_of: str) -> tuple:
+    try:
+        return load_members_as_of(ledger_dir, ledger, as_of)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+
+def find_member(members: list, cid_prefix: str):
+    """Return the first member whose CID starts with cid_prefix (or None)."""
+    for entry in members:
+        if entry["cid_hash"].startswith(cid_prefix):
+            return entry
+    return None
 
 
 def cmd_activate(args):
     """Activate a provisional member after vouching."""
     ledger_dir = Path(args.ledger_dir)
-    ledger = load_ledger(ledger_dir)
-    
-    # Find the member
-    target = None
-    target_idx = None
-    for i, entry in enumerate(ledger.get("entries", [])):
-        if entry["cid_hash"].startswith(args.cid):
-            target = entry
-            target_idx = i
-            break
-    
-    if not target:
-        print(f"ERROR: Member not found: {args.cid}")
-        sys.exit(1)
-    
-    if target["status"] == "active":
-        print(f"Member {target['cid_hash'][:16]}... is already active.")
-        sys.exit(0)
-    
-    if target["status"] != "provisional":
-        print(f"ERROR: Member {target['cid_hash'][:16]}... has status '{target['status']}' — can only activate provisional members.")
-        sys.exit(1)
-    
-    # Parse voucher CIDs
-    voucher_cids = [c.strip() for c in args.voucher_cids.split(",") if c.strip()]
-    
-    # Determine phase and validate vouchers
-    active_count = len([e for e in ledger["entries"] if e.get("status") == "active"])
-    phase = determine_phase(active_count)
-    
-    vouch_errors = validate_vouchers(voucher_cids, ledger, phase)
-    if vouch_errors:
-        print("❌ Voucher validation failed:")
-        for e in vouch_errors:
-            print(f"   • {e}")
-        sys.exit(1)
-    
-    # Activate
-    target["status"] = "active"
-    target["activated"] = int(time.time())
-    target["vouchers"] = voucher_cids
-    # Recompute entry hash since we changed the entry
-    target["entry_hash"] = compute_entry_hash(target)
-    
-    ledger_hash = save_ledger(ledger_dir, ledger)
+    with ledger_lock(ledger_dir):
+        ledger = load_ledger(ledger_dir, resolve_keys=False, compact=args.compact)
+        members = load_members(ledger_dir, ledger)
+        
+        # Find the member
+        target = find_member(members, args.cid)
+        
+        if not target:
+            print(f"ERROR: Member not found: {args.cid}")
+            sys.exit(1)
+        
+        if target["status"] == "active":
+            print(f"Member {target['cid_hash'][:16]}... is already active.")
+            sys.exit(0)
+        
+        if target["status"] != "provisional":
+            print(f"ERROR: Member {target['cid_hash'][:16]}... has status '{target['status']}' — can only activate provisional members.")
+            sys.exit(1)
+        
+        # Parse voucher CIDs
+        voucher_cids = [c.strip() for c in args.voucher_cids.split(",") if c.strip()]
+        
+        # Determine phase and validate vouchers
+        active_count = len([e for e in members if e.get("status") == "active"])
+        phase = determine_phase(active_count)
+        
+        vouch_errors = validate_vouchers(voucher_cids, {**ledger, "entries": members}, phase)
+        if vouch_errors:
+            print("❌ Voucher validation failed:")
+            for e in vouch_errors:
+                print(f"   • {e}")
+            sys.exit(1)
+        
+        # Activate: append to the mutation log; the registration entry is never rewritten
+        from events import append_event, EVENT_ACTIVATE
+        event = append_event(ledger_dir, EVENT_ACTIVATE, target["cid_hash"],
+                             {"vouchers": voucher_cids}, entries=ledger["entries"])
     
     print(f"✅ Member activated!")
     print(f"   CID:      {target['cid_hash']}")
     print(f"   Vouchers: {len(voucher_cids)}")
-    print(f"   Ledger:   {ledger_hash}")
+    print(f"   Event:    #{event['seq']} {event['event_hash']}")
+
+
+def cmd_withdraw(args):
+    """Record a member's withdrawal (exit is always free)."""
+    _change_status(args, "withdraw")
+
+
+def cmd_deactivate(args):
+    """Mark a member inactive."""
+    _change_status(args, "deactivate")
+
+
+def _change_status(args, event_type: str):
+    from events import append_event
+    ledger_dir = Path(args.ledger_dir)
+    with ledger_lock(ledger_dir):
+        ledger = load_ledger(ledger_dir, resolve_keys=False, compact=args.compact)
+        target = find_member(load_members(ledger_dir, ledger), args.cid)
+        
+        if not target:
+            print(f"ERROR: Member not found: {args.cid}")
+            sys.exit(1)
+        
+        allowed = {"withdraw": ("active", "provisional", "inactive"), "deactivate": ("active", "provisional")}[event_type]
+        if target["status"] not in allowed:
+            print(f"ERROR: Member {target['cid_hash'][:16]}... has status '{target['status']}' — cannot {event_type}.")
+            sys.exit(1)
+        
+        data = {"reason": args.reason} if args.reason else {}
+        event = append_event(ledger_dir, event_type, target["cid_hash"], data, entries=ledger["entries"])
+    
+    status = "withdrawn" if event_type == "withdraw" else "inactive"
+    print(f"✅ Member marked {status}")
+    print(f"   CID:   {target['cid_hash']}")
+    print(f"   Event: #{event['seq']} {event['event_hash']}")
 
 
 def cmd_stats(args):
     """Display ledger statistics."""
     ledger_dir = Path(args.ledger_dir)
-    ledger = load_ledger(ledger_dir)
-    entries = ledger.get("entries", [])
+    if args.as_of:
+        ledger = load_ledger(ledger_dir, resolve_keys=False, compact=args.compact)
+        entries, as_of, ledger_hash = _members_as_of(ledger_dir, ledger, args.as_of)
+    else:
+        # Current state comes from the binary member index — no ledger.json parsing
+        from memberindex import MemberIndex
+        index = MemberIndex.open(ledger_dir)
+        entries = [r._asdict() for r in index]
+        as_of, ledger_hash = None, index.ledger_hash.hex()
     
     active = [e for e in entries if e.get("status") == "active"]
     
     print("═══════════════════════════════════════════════════════════════")
     print("  Ledger Statistics")
     print("═══════════════════════════════════════════════════════════════")
+    if as_of is not None:
+        print(f"  As of:          {time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime(as_of))}")
     print(f"  Total entries:  {len(entries)}")
     print(f"  Active:         {len(active)}")
     print(f"  Inactive:       {len(entries) - len(active)}")
-    print(f"  Current phase:  {determine_phase(len(active))}")
-    print(f"  Ledger hash:    {compute_ledger_hash(entries)}")
+    print(f"  {'Phase:' if as_of is not None else 'Current phase:':<16}{determine_phase(len(active))}")
+    print(f"  Ledger hash:    {ledger_hash}")
     
     if entries:
         first = min(e["registered"] for e in entries)
@@ -527,15 +1094,402 @@ def cmd_stats(args):
         for p, count in sorted(phases.items()):
             print(f"    {p}: {count}")
     
+    if args.extended:
+        from analytics import Columns
+        cols = Columns.from_entries(entries) if as_of is not None else Columns.from_index(index)
+        print_extended_stats(cols, args.bucket, as_of)
+    
+    print("═══════════════════════════════════════════════════════════════")
+
+
+def print_extended_stats(cols, bucket: str, now: int = None):
+    """Registration rate, activation latency, cohort retention, phase projection."""
+    from analytics import registration_histogram, activation_latency, cohort_retention, phase_projection
+    
+    histogram = registration_histogram(cols, bucket)
+    if histogram:
+        peak = max(count for _, count in histogram)
+        print(f"  Registrations per {bucket}:")
+        for label, count in histogram:
+            bar = "█" * max(1, round(30 * count / peak))
+            print(f"    {label:<10} {count:>7,}  {bar}")
+    
+    latency = activation_latency(cols)
+    if latency["count"]:
+        print(f"  Activation latency ({latency['count']:,} activated, {latency['pending']:,} pending):")
+        for key in ("median", "p90", "mean", "max"):
+            print(f"    {key:<7} {latency[key] / 3600:>10.1f} h")
+    
+    cohorts = cohort_retention(cols)
+    if cohorts:
+        print("  Cohort retention (by registration month):")
+        for month, size, active, rate in cohorts:
+            print(f"    {month}  {size:>7,} registered  {active:>7,} active  {rate:>6.1%}")
+    
+    projection = phase_projection(cols, {
+        GROWTH_ENTRY_TYPE: PHASE_THRESHOLDS["founding"],
+        STABLE_ENTRY_TYPE: PHASE_THRESHOLDS["growth"],
+    }, now)
+    print(f"  Phase projection ({projection['rate_per_day']:.2f} registrations/day over {projection['window_days']} days):")
+    if not projection["phases"]:
+        print("    All phase thresholds reached")
+    for phase, p in projection["phases"].items():
+        eta = f"~{p['days']:.0f} days ({p['date']})" if p["days"] is not None else "no recent registrations"
+        print(f"    {phase:<7} at {p['threshold']:>4} active: {p['needed']:,} to go, {eta}")
+
+
+def cmd_pack_keys(args):
+    """Move embedded public keys into the content-addressed key store."""
+    ledger_dir = Path(args.ledger_dir)
+    keys_dir = Path(args.keys_dir)
+    
+    from keystore import KeyStore
+    with ledger_lock(ledger_dir):
+        ledger = load_ledger(ledger_dir)
+        before = (ledger_dir / "ledger.json").stat().st_size
+        ledger["key_store"] = os.path.relpath(keys_dir, ledger_dir)
+        ledger_hash = save_ledger(ledger_dir, ledger)
+        after = (ledger_dir / "ledger.json").stat().st_size
+    
+    print(f"✅ Ledger keys packed into {keys_dir}")
+    print(f"   ledger.json: {before:,} → {after:,} bytes")
+    print(f"   Ledger: {ledger_hash} (unchanged by packing)")
+    
+    if args.votes_dir:
+        store = KeyStore(keys_dir)
+        packed = saved = 0
+        from votestore import iter_vote_files
+        for vote_file in sorted(v for p in Path(args.votes_dir).iterdir() if p.is_dir() for v in iter_vote_files(p)):
+            vote = json.loads(vote_file.read_text())
+            if "public_keys" not in vote:
+                continue
+            size = vote_file.stat().st_size
+            # Vote files are stored as their canonical bytes
+            vote_file.write_bytes(canonical_json(store.pack(vote)))
+            saved += size - vote_file.stat().st_size
+            packed += 1
+        print(f"   Votes: {packed} files packed, {saved:,} bytes saved")
+
+
+def cmd_export_delta(args):
+    """Write a replication bundle of everything after a known chain point."""
+    ledger_dir = Path(args.ledger_dir)
+    ledger = load_ledger(ledger_dir, compact=args.compact)
+    entries = ledger.get("entries", [])
+    
+    if len(args.since.strip()) != 64:
+        print("ERROR: --since must be a ledger hash")
+        sys.exit(1)
+    try:
+        index, _, since_hash = resolve_as_of(ledger_dir, entries, args.since)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    
+    from sync import build_delta, default_event_base, write_bundle
+    since_event = args.since_event if args.since_event is not None else default_event_base(ledger_dir, entries, index)
+    head_hash = (ledger_dir / "ledger_hash.txt").read_text().strip()
+    bundle = build_delta(ledger_dir, entries, index, since_hash, head_hash, since_event)
+    write_bundle(Path(args.output), bundle)
+    
+    print(f"✅ Delta bundle written: {args.output}")
+    print(f"   From:    {since_hash} (#{index}, event #{since_event})")
+    print(f"   To:      {head_hash} (#{len(entries)}, event #{bundle['head']['event_seq']})")
+    print(f"   Entries: {len(bundle['entries'])}  Events: {len(bundle['events'])}")
+    print(f"   Size:    {Path(args.output).stat().st_size:,} bytes")
+
+
+def cmd_apply_delta(args):
+    """Verify a replication bundle against this ledger and append it."""
+    ledger_dir = Path(args.ledger_dir)
+    from sync import read_bundle, check_delta, append_events
+    from events import last_event
+    
+    bundle = read_bundle(Path(args.bundle))
+    with ledger_lock(ledger_dir):
+        ledger = load_ledger(ledger_dir, resolve_keys=False)
+        store = key_store_for(ledger_dir, ledger)
+        entries = [store.resolve(e) for e in ledger["entries"]] if store else ledger.get("entries", [])
+        hash_file = ledger_dir / "ledger_hash.txt"
+        local_hash = hash_file.read_text().strip() if hash_file.exists() else compute_ledger_hash(entries)
+        
+        errors, new_events, new_hash = check_delta(bundle, local_hash, entries, last_event(ledger_dir))
+        if errors:
+            print("❌ Delta rejected:")
+            for e in errors:
+                print(f"   • {e}")
+            sys.exit(1)
+        
+        if bundle["entries"]:
+            append_entries(ledger_dir, ledger, bundle["entries"], new_hash)
+        append_events(ledger_dir, ledger["entries"], new_events)
+    
+    print(f"✅ Delta applied: +{len(bundle['entries'])} entries, +{len(new_events)} events")
+    print(f"   Ledger: {new_hash}")
+
+
+def governance_dir(ledger_dir: Path, value: str, name: str):
+    """An explicit --<name>-dir, else governance/<name> next to the ledger if present."""
+    if value:
+        return Path(value)
+    default = ledger_dir.resolve().parent / name
+    return default if default.exists() else None
+
+
+def cmd_export_sqlite(args):
+    """Incrementally mirror members, vouches, proposals and votes into SQLite."""
+    ledger_dir = Path(args.ledger_dir)
+    from sqlexport import export_sqlite
+    
+    start = time.perf_counter()
+    try:
+        counts = export_sqlite(Path(args.output), ledger_dir,
+                               governance_dir(ledger_dir, args.proposals_dir, "proposals"),
+                               governance_dir(ledger_dir, args.votes_dir, "votes"))
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    
+    if not any(counts.values()):
+        print(f"✅ {args.output} is up to date ({elapsed * 1000:.0f} ms)")
+        return
+    changed = ", ".join(f"{n} {table}" for table, n in counts.items() if n)
+    print(f"✅ {args.output} updated: {changed} ({elapsed * 1000:.0f} ms)")
+
+
+def cmd_metrics(args):
+    """Write Prometheus textfile-collector metrics for the ledger and governance state."""
+    ledger_dir = Path(args.ledger_dir)
+    from metrics import PREFIX, collect, render, write_textfile
+    
+    start = time.perf_counter()
+    families = collect(ledger_dir, governance_dir(ledger_dir, args.proposals_dir, "proposals"),
+                       governance_dir(ledger_dir, args.votes_dir, "votes"))
+    families.append((f"{PREFIX}_metrics_collect_seconds", "gauge", "Time spent collecting these metrics",
+                     [({}, round(time.perf_counter() - start, 6))]))
+    text = render(families)
+    if args.output == "-":
+        sys.stdout.write(text)
+    else:
+        write_textfile(Path(args.output), text)
+
+
+def cmd_watch(args):
+    """Admit registration requests dropped into an inbox directory."""
+    import asyncio
+    from inbox import watch_inbox
+    
+    inbox = Path(args.inbox)
+    if not inbox.is_dir():
+        print(f"ERROR: Inbox directory not found: {inbox}")
+        sys.exit(1)
+    
+    if not args.once:
+        print(f"👀 Watching {inbox} (Ctrl-C to stop)")
+    try:
+        totals = asyncio.run(watch_inbox(
+            Path(args.ledger_dir), inbox, args.accepted_dir, args.rejected_dir,
+            workers=args.workers, batch_size=args.batch_size, batch_window=args.batch_window,
+            poll_interval=args.poll_interval, once=args.once,
+        ))
+    except KeyboardInterrupt:
+        print("Stopped.")
+        return
+    print(f"Done: {totals['accepted']} accepted, {totals['rejected']} rejected")
+
+
+def cmd_parse_issues(args):
+    """Extract, validate and dedupe registration requests from an issue export."""
+    from issues import Deduplicator, iter_export, parallel_process, write_inbox_file
+    
+    export = Path(args.export)
+    if not export.exists():
+        print(f"ERROR: Export file not found: {export}")
+        sys.exit(1)
+    
+    known_cid = None
+    if args.ledger_dir:
+        from memberindex import MemberIndex
+        index = MemberIndex.open(Path(args.ledger_dir))
+        
+        def known_cid(cid):
+            record = index.find(cid)
+            return record is not None and record.cid_hash == cid
+    inbox = Path(args.inbox) if args.inbox else None
+    if inbox:
+        inbox.mkdir(parents=True, exist_ok=True)
+    
+    dedupe = Deduplicator(known_cid)
+    rejects = open(args.rejects, "w") if args.rejects else None
+    counts = {"valid": 0, "invalid": 0, "duplicate": 0}
+    
+    with open(args.output, "w") as out:
+        for source, request, reasons in parallel_process(iter_export(export), args.workers,
+                                                         args.verify_signatures):
+            if not reasons:
+                duplicate = dedupe.check(source, request)
+                reasons = [duplicate] if duplicate else []
+                counts["duplicate" if duplicate else "valid"] += 1
+            else:
+                counts["invalid"] += 1
+            if not reasons:
+                out.write(canonical_json(request).decode("utf-8") + "\n")
+                if inbox:
+                    write_inbox_file(inbox, request)
+                continue
+            cid = (request or {}).get("registration", {}).get("cid_hash")
+            if rejects:
+                rejects.write(json.dumps({"source": source, "cid_hash": cid, "reasons": reasons}) + "\n")
+            if not args.quiet:
+                print(f"❌ {source}: {'; '.join(reasons)}")
+    if rejects:
+        rejects.close()
+    
+    print(f"✅ {counts['valid']} registration(s) → {args.output}; "
+          f"{counts['invalid']} invalid, {counts['duplicate']} duplicate")
+
+
+def cmd_tally(args):
+    """Tally a convention's proposals in one pass and update the vote and proposal indexes."""
+    from tally import tally_convention
+    
+    ledger_dir = Path(args.ledger_dir)
+    proposals_dir = governance_dir(ledger_dir, args.proposals_dir, "proposals")
+    votes_dir = governance_dir(ledger_dir, args.votes_dir, "votes")
+    if proposals_dir is None or not (proposals_dir / "index.json").exists():
+        print("ERROR: Proposal registry not found (pass --proposals-dir)")
+        sys.exit(1)
+    if votes_dir is None:
+        print("ERROR: Votes directory not found (pass --votes-dir)")
+        sys.exit(1)
+    
+    proposal_ids = [p.strip() for p in args.proposal.split(",") if p.strip()] if args.proposal else None
+    seniority = args.seniority_days * 86400 if args.seniority_days is not None else None
+    summaries = tally_convention(ledger_dir, proposals_dir, votes_dir, proposal_ids, args.convention,
+                                 close=args.close, seniority_seconds=seniority, workers=args.workers,
+                                 dry_run=args.dry_run)
+    if not summaries:
+        print("No proposals to tally (none in 'voting' status matched)")
+        return
+    
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Convention Tally{' (dry run — nothing written)' if args.dry_run else ''}")
+    print("═══════════════════════════════════════════════════════════════")
+    for s in summaries:
+        t = s["tally"]
+        extra = "".join(f", {s[k]} {k}" for k in ("sealed", "rejected") if s[k])
+        print(f"  {s['proposal_id']}  [{s['category']}]  → {s['result']}"
+              f"{'  (' + s['status'] + ')' if args.close and s['status'] else ''}")
+        print(f"    approve {t['approve']}, reject {t['reject']}, abstain {t['abstain']} "
+              f"of {s['eligible_voters']} eligible{extra}")
+        print(f"    quorum {s['quorum_ratio']:.1%}/{s['quorum_required']:.1%}  "
+              f"engagement {s['engagement_ratio']:.1%}/{s['engagement_required']:.1%}  "
+              f"passage {s['passage_ratio']:.1%}/{s['passage_required']:.1%}")
     print("═══════════════════════════════════════════════════════════════")
 
 
+def cmd_migrate_votes(args):
+    """Move vote files between the flat and sharded directory layouts."""
+    from votestore import detect_depth, migrate
+    
+    votes_dir = Path(args.votes_dir)
+    if not votes_dir.is_dir():
+        print(f"ERROR: Votes directory not found: {votes_dir}")
+        sys.exit(1)
+    wanted = {p.strip() for p in args.proposal.split(",") if p.strip()} if args.proposal else None
+    proposals = sorted(p for p in votes_dir.iterdir() if p.is_dir() and (wanted is None or p.name in wanted))
+    if wanted and len(proposals) != len(wanted):
+        missing = wanted - {p.name for p in proposals}
+        print(f"ERROR: No vote directory for: {', '.join(sorted(missing))}")
+        sys.exit(1)
+    
+    layout = "flat" if args.depth == 0 else f"sharded (depth {args.depth})"
+    for proposal in proposals:
+        before = detect_depth(proposal)
+        try:
+            moved = migrate(proposal, args.depth)
+        except ValueError as e:
+            print(f"ERROR: {proposal.name}: {e}")
+            sys.exit(1)
+        print(f"  {proposal.name}: {moved} vote file(s) moved (depth {before} → {args.depth})")
+    print(f"✅ {len(proposals)} proposal(s) now {layout}")
+
+
+def cmd_election_key(args):
+    """Create the key pair sealed ballots for an election are encrypted to."""
+    from ballots import generate_election_key
+    
+    output = Path(args.output)
+    if output.exists():
+        print(f"ERROR: {output} already exists (an election key is never overwritten)")
+        sys.exit(1)
+    public = generate_election_key(output)
+    print(f"✅ Election key written to {output} (keep it secret until voting closes)")
+    print("   Publish with the proposal:")
+    print(json.dumps(public, indent=2))
+
+
+def cmd_decrypt_tally(args):
+    """Decrypt a proposal's sealed ballots with the election key and count them."""
+    from ballots import decrypt_tally, load_election_key
+    
+    ledger_dir = Path(args.ledger_dir)
+    votes_dir = governance_dir(ledger_dir, args.votes_dir, "votes")
+    proposals_dir = governance_dir(ledger_dir, args.proposals_dir, "proposals")
+    if votes_dir is None or not (votes_dir / args.proposal).is_dir():
+        print(f"ERROR: No vote directory for {args.proposal} (pass --votes-dir)")
+        sys.exit(1)
+    # Ballots are only decrypted once tally's checks accept them, which need the registry
+    if proposals_dir is None or not (proposals_dir / "index.json").exists():
+        print("ERROR: Proposal registry not found (pass --proposals-dir)")
+        sys.exit(1)
+    try:
+        election_key = load_election_key(Path(args.election_key))
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Cannot load election key: {e}")
+        sys.exit(1)
+    
+    start = time.perf_counter()
+    try:
+        totals = decrypt_tally(ledger_dir, proposals_dir, votes_dir, args.proposal, election_key, args.workers)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    
+    t = totals["tally"]
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Sealed Ballot Tally: {args.proposal}")
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Ballots:        {totals['sealed']:,} sealed, {totals['open']:,} open, "
+          f"{len(totals['rejected']):,} rejected  ({elapsed:.2f}s)")
+    print(f"  Approve:        {t['approve']:,}")
+    print(f"  Reject:         {t['reject']:,}")
+    print(f"  Abstain:        {t['abstain']:,}")
+    if "result" in totals:
+        print(f"  Result:         {totals['result']}  (quorum {totals['quorum_ratio']:.1%}, "
+              f"engagement {totals['engagement_ratio']:.1%}, passage {totals['passage_ratio']:.1%})")
+    for name, reason in totals["rejected"][:10]:
+        print(f"  ❌ {name}: {reason}")
+    if len(totals["rejected"]) > 10:
+        print(f"  ... and {len(totals['rejected']) - 10} more")
+    print("═══════════════════════════════════════════════════════════════")
+    if args.output:
+        totals["rejected"] = [{"file": name, "reason": reason} for name, reason in totals["rejected"]]
+        Path(args.output).write_text(json.dumps({"proposal_id": args.proposal, **totals}, indent=2) + "\n")
+
+
 # ─── Main ─────────────────────────────────────────────────────────────────────
 
 def main():
     parser = argparse.ArgumentParser(
         description="Covenant Membership Ledger Management",
     )
+    profiling.add_arguments(parser)
+    parser.add_argument("--compact", action="store_true",
+                        help="Load entries as compact records (verify, checkpoint, show/stats --as-of, "
+                             "activate, withdraw, deactivate, export-delta); see compactledger.py")
     subparsers = parser.add_subparsers(dest="command", required=True)
     
     # init
@@ -558,18 +1512,160 @@ def main():
     activate.add_argument("--voucher-cids", "-v", required=True,
                           help="Comma-separated voucher CID hashes")
     
+    # withdraw / deactivate
+    withdraw = subparsers.add_parser("withdraw", help="Record a member's withdrawal")
+    withdraw.add_argument("--ledger-dir", "-d", required=True)
+    withdraw.add_argument("--cid", required=True, help="CID hash (or prefix) of member")
+    withdraw.add_argument("--reason", help="Optional note recorded in the event")
+    
+    deactivate = subparsers.add_parser("deactivate", help="Mark a member inactive")
+    deactivate.add_argument("--ledger-dir", "-d", required=True)
+    deactivate.add_argument("--cid", required=True, help="CID hash (or prefix) of member")
+    deactivate.add_argument("--reason", help="Optional note recorded in the event")
+    
     # verify
     verify = subparsers.add_parser("verify", help="Verify ledger integrity")
     verify.add_argument("--ledger-dir", "-d", required=True)
+    verify.add_argument("--since-checkpoint", action="store_true",
+                        help="Trust the latest signed checkpoint; check only what came after it")
+    verify.add_argument("--stewards",
+                        help="Comma-separated CIDs trusted to sign checkpoints (required with --since-checkpoint)")
+    verify.add_argument("--watch", action="store_true",
+                        help="Keep running and re-verify whatever changes (ledger.json, ledger_hash.txt, entries/)")
+    verify.add_argument("--poll-interval", type=float, default=0.25,
+                        help="Seconds between checks for changes with --watch (default: 0.25)")
+    verify.add_argument("--record", action="store_true",
+                        help="Write the outcome to last_verify.json for the metrics exporter")
+    
+    # checkpoint
+    checkpoint = subparsers.add_parser("checkpoint", help="Verify and record a steward-signed checkpoint")
+    checkpoint.add_argument("--ledger-dir", "-d", required=True)
+    checkpoint.add_argument("--identity-dir", "-i", required=True,
+                            help="Steward identity directory (with secret_keys.json)")
+    checkpoint.add_argument("--stewards",
+                            help="Comma-separated CIDs trusted to have signed the previous checkpoint "
+                                 "(the signing steward is always trusted)")
     
     # show
     show = subparsers.add_parser("show", help="Display ledger contents")
     show.add_argument("--ledger-dir", "-d", required=True)
     show.add_argument("--cid", help="Show specific member by CID prefix")
+    show.add_argument("--as-of", help="Show state at a Unix timestamp (binary search) or ledger hash "
+                                      "(linear scan of the chain)")
+    show.add_argument("--status", choices=["active", "provisional", "inactive", "withdrawn"])
+    show.add_argument("--phase", choices=[GENESIS_ENTRY_TYPE, FOUNDING_ENTRY_TYPE, GROWTH_ENTRY_TYPE, STABLE_ENTRY_TYPE],
+                      help="Registration phase")
+    show.add_argument("--registered-after", metavar="TIME", help="Registered at/after (Unix timestamp or YYYY-MM-DD)")
+    show.add_argument("--registered-before", metavar="TIME", help="Registered before (Unix timestamp or YYYY-MM-DD)")
+    show.add_argument("--vouched-by", metavar="CID", help="Members vouched for by this CID (or prefix)")
+    show.add_argument("--limit", type=int, default=0, help="Show at most N members")
+    show.add_argument("--offset", type=int, default=0, help="Skip the first N matching members")
+    show.add_argument("--jsonl", action="store_true", help="One JSON object per member (for pipelines)")
     
     # stats
     stats = subparsers.add_parser("stats", help="Display ledger statistics")
     stats.add_argument("--ledger-dir", "-d", required=True)
+    stats.add_argument("--as-of", help="Statistics at a Unix timestamp (binary search) or ledger hash "
+                                       "(linear scan of the chain)")
+    stats.add_argument("--extended", action="store_true",
+                       help="Add registration rate, activation latency, retention and projections (needs NumPy)")
+    stats.add_argument("--bucket", choices=["day", "week", "month"], default="month",
+                       help="Registration-rate bucket for --extended (default: month)")
+    
+    # pack-keys
+    pack = subparsers.add_parser("pack-keys", help="Move public keys into the content-addressed key store")
+    pack.add_argument("--ledger-dir", "-d", required=True)
+    pack.add_argument("--keys-dir", "-k", required=True,
+                      help="Key store directory (e.g. governance/keys)")
+    pack.add_argument("--votes-dir",
+                      help="Also pack vote files under this directory (e.g. governance/votes)")
+    
+    # export-delta / apply-delta
+    export = subparsers.add_parser("export-delta", help="Write a replication bundle since a ledger hash")
+    export.add_argument("--ledger-dir", "-d", required=True)
+    export.add_argument("--since", required=True,
+                        help="Ledger hash the mirror already has (found by a linear scan of the chain)")
+    export.add_argument("--since-event", type=int,
+                        help="Last event seq the mirror already has (default: derived from --since)")
+    export.add_argument("--output", "-o", required=True, help="Bundle file (.gz to compress)")
+    
+    apply = subparsers.add_parser("apply-delta", help="Verify and append a replication bundle")
+    apply.add_argument("--ledger-dir", "-d", required=True)
+    apply.add_argument("--bundle", "-b", required=True)
+    
+    # export-sqlite
+    sql = subparsers.add_parser("export-sqlite", help="Incrementally export to an indexed SQLite database")
+    sql.add_argument("--ledger-dir", "-d", required=True)
+    sql.add_argument("--output", "-o", required=True, help="SQLite database file (created or updated)")
+    sql.add_argument("--proposals-dir", help="Default: ../proposals next to the ledger, if present")
+    sql.add_argument("--votes-dir", help="Default: ../votes next to the ledger, if present")
+    
+    # metrics
+    metrics = subparsers.add_parser("metrics", help="Write Prometheus textfile metrics")
+    metrics.add_argument("--ledger-dir", "-d", required=True)
+    metrics.add_argument("--output", "-o", default="-",
+                         help="Textfile to replace atomically, e.g. .../textfile/covenant.prom (default: stdout)")
+    metrics.add_argument("--proposals-dir", help="Default: ../proposals next to the ledger, if present")
+    metrics.add_argument("--votes-dir", help="Default: ../votes next to the ledger, if present")
+    
+    # watch
+    watch = subparsers.add_parser("watch", help="Admit registration requests from an inbox directory")
+    watch.add_argument("--ledger-dir", "-d", required=True)
+    watch.add_argument("--inbox", required=True, help="Directory registration JSON files are dropped into")
+    watch.add_argument("--accepted-dir", help="Where admitted requests go (default: <inbox>/accepted)")
+    watch.add_argument("--rejected-dir", help="Where rejected requests go (default: <inbox>/rejected)")
+    watch.add_argument("--workers", type=int, help="Signature verification threads (default: CPUs + 4)")
+    watch.add_argument("--batch-size", type=int, default=100, help="Most entries per ledger write (default: 100)")
+    watch.add_argument("--batch-window", type=float, default=0.5,
+                       help="Seconds to wait for a batch to fill (default: 0.5)")
+    watch.add_argument("--poll-interval", type=float, default=1.0, help="Inbox scan interval in seconds")
+    watch.add_argument("--once", action="store_true", help="Process what is in the inbox now, then exit")
+    
+    # parse-issues
+    issues = subparsers.add_parser("parse-issues", help="Extract registration requests from an issue export")
+    issues.add_argument("export", help="Issue export: JSON array/JSONL (gh issue list --json ...) or Markdown")
+    issues.add_argument("--output", "-o", required=True, help="JSONL of valid, deduplicated requests")
+    issues.add_argument("--rejects", help="JSONL of rejected issues with reasons")
+    issues.add_argument("--ledger-dir", "-d", help="Also drop CIDs already in this ledger")
+    issues.add_argument("--inbox", help="Also write each valid request into a `watch` inbox")
+    issues.add_argument("--workers", type=int, help="Parser processes (default: CPU count)")
+    issues.add_argument("--verify-signatures", action="store_true",
+                        help="Also verify both signatures of the valid requests (needs liboqs)")
+    issues.add_argument("--quiet", "-q", action="store_true", help="Do not list rejected issues")
+    
+    # tally
+    tally = subparsers.add_parser("tally", help="Tally a convention's proposals in one pass")
+    tally.add_argument("--ledger-dir", "-d", required=True)
+    tally.add_argument("--proposals-dir", help="Default: ../proposals next to the ledger, if present")
+    tally.add_argument("--votes-dir", help="Default: ../votes next to the ledger, if present")
+    tally.add_argument("--convention", type=int, help="Only proposals targeting this convention number")
+    tally.add_argument("--proposal", help="Comma-separated proposal IDs (any status) instead of all in 'voting'")
+    tally.add_argument("--close", action="store_true",
+                       help="Record the outcome as the proposal status once voting has closed")
+    tally.add_argument("--seniority-days", type=int,
+                       help="Voting seniority in days (default: 30 in the Founding Phase, else 0)")
+    tally.add_argument("--workers", type=int, help="Verification threads shared by all proposals")
+    tally.add_argument("--dry-run", action="store_true", help="Print the tally without writing any index")
+    
+    # migrate-votes
+    migrate = subparsers.add_parser("migrate-votes", help="Shard (or flatten) per-proposal vote directories")
+    migrate.add_argument("--votes-dir", required=True, help="e.g. governance/votes")
+    migrate.add_argument("--proposal", help="Comma-separated proposal IDs (default: all)")
+    migrate.add_argument("--depth", type=int, choices=[0, 1, 2], default=1,
+                         help="0 = flat <cid>.json, 1 = ab/<cid>.json (default), 2 = ab/cd/<cid>.json")
+    
+    # election-key / decrypt-tally
+    election = subparsers.add_parser("election-key", help="Create an election key pair for sealed ballots")
+    election.add_argument("--output", "-o", required=True, help="Secret key file to create (mode 0600)")
+    
+    decrypt = subparsers.add_parser("decrypt-tally", help="Decrypt and count a proposal's sealed ballots")
+    decrypt.add_argument("--ledger-dir", "-d", required=True)
+    decrypt.add_argument("--proposal", required=True, help="Proposal ID")
+    decrypt.add_argument("--election-key", "-k", required=True, help="Election secret key file")
+    decrypt.add_argument("--proposals-dir", help="Default: ../proposals next to the ledger, if present")
+    decrypt.add_argument("--votes-dir", help="Default: ../votes next to the ledger, if present")
+    decrypt.add_argument("--workers", type=int, help="Verification threads and decryption processes (default: CPU count)")
+    decrypt.add_argument("--output", "-o", help="Also write the counts and rejections as JSON")
     
     args = parser.parse_args()
     
@@ -577,12 +1673,27 @@ def main():
         "init": cmd_init,
         "add": cmd_add,
         "activate": cmd_activate,
+        "withdraw": cmd_withdraw,
+        "deactivate": cmd_deactivate,
         "verify": cmd_verify,
+        "checkpoint": cmd_checkpoint,
         "show": cmd_show,
         "stats": cmd_stats,
+        "pack-keys": cmd_pack_keys,
+        "export-delta": cmd_export_delta,
+        "apply-delta": cmd_apply_delta,
+        "export-sqlite": cmd_export_sqlite,
+        "metrics": cmd_metrics,
+        "watch": cmd_watch,
+        "parse-issues": cmd_parse_issues,
+        "tally": cmd_tally,
+        "migrate-votes": cmd_migrate_votes,
+        "election-key": cmd_election_key,
+        "decrypt-tally": cmd_decrypt_tally,
     }
     
-    commands[args.command](args)
+    with profiling.session_for(args):
+        commands[args.command](args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,360 @@
+"""
+Binary Membership Index
+
+Read paths that only need who is a member, with what status and since
+when, should not have to parse ledger.json with every public key in it.
+The member index is a derived, fixed-width binary file:
+
+  governance/ledger/members.idx          — used when present and current
+  ~/.covenant/cache/<ledger key>/members.idx
+                                         — where readers rebuild it
+
+  header   MAGIC, ledger hash (32 bytes), event log head hash (32 bytes),
+           record count, voucher pair count, flags
+  records  one per member, sorted by CID (binary-searchable):
+             cid (32 raw bytes), status code, phase code, voucher count,
+             registered, activated (-1 if never), byte offset and length
+             of the entry in ledger.json, entry ordinal
+  order    uint32 record numbers in ledger (= registration) order
+  vouches  (voucher cid, entry ordinal) pairs sorted by voucher — who
+           vouched for whom, binary-searchable
+  meta     the ledger's top-level fields (JSON, without entries)
+
+Status reflects the mutation log (see events.py). The index is rebuilt
+whenever ledger_hash.txt or the head of events.jsonl no longer matches
+its header; otherwise readers mmap it and never parse JSON. A single
+entry can still be read from ledger.json through its stored offset.
+Readers never write into the ledger directory: a stale index is rebuilt
+in the user cache, or in memory if that is not writable either.
+
+Registration timestamps only grow along the ledger, so a registration
+time range is a binary search over the ledger order (FLAG_REGISTERED_SORTED
+records that this held when the index was built).
+
+Axiom Alignment:
+  III - Derived data is cheap to regenerate and never authoritative
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+from collections import namedtuple
+from pathlib import Path
+
+from profiling import span
+
+
+INDEX_FILE = "members.idx"
+MAGIC = b"CMIDX\x00\x00\x02"
+HEADER = struct.Struct("<8s32s32sIII4x")
+RECORD = struct.Struct("<32sBBHqqQII")
+VOUCH = struct.Struct("<32sI")
+FLAG_REGISTERED_SORTED = 1
+CACHE_DIR = Path("~/.covenant/cache")
+
+STATUS_CODES = {"active": 1, "provisional": 2, "inactive": 3, "withdrawn": 4}
+PHASE_CODES = {"genesis": 0, "founding": 1, "growth": 2, "stable": 3}
+STATUS_NAMES = {code: name for name, code in STATUS_CODES.items()}
+PHASE_NAMES = {code: name for name, code in PHASE_CODES.items()}
+UNKNOWN = 255
+
+MemberRecord = namedtuple("MemberRecord", "cid_hash status registration_phase vouchers "
+                                          "registered activated offset length ordinal")
+
+
+# ─── Building ─────────────────────────────────────────────────────────────────
+
+def entry_spans(ledger_text: str) -> list:
+    """Byte (offset, length) of each entry object inside ledger.json."""
+    decoder = json.JSONDecoder()
+    ascii_only = ledger_text.isascii()   # save_ledger() writes ASCII: chars == bytes
+    pos = ledger_text.index("[", ledger_text.index('"entries"')) + 1
+    byte_pos, char_pos = pos, pos
+    spans = []
+    while True:
+        while ledger_text[pos] in " \t\r\n,":
+            pos += 1
+        if ledger_text[pos] == "]":
+            return spans
+        _, end = decoder.raw_decode(ledger_text, pos)
+        if ascii_only:
+            spans.append((pos, end - pos))
+        else:
+            byte_pos += len(ledger_text[char_pos:pos].encode("utf-8"))
+            length = len(ledger_text[pos:end].encode("utf-8"))
+            spans.append((byte_pos, length))
+            byte_pos, char_pos = byte_pos + length, end
+        pos = end
+
+
+def current_heads(ledger_dir: Path) -> tuple:
+    """(ledger hash, event head hash) as raw bytes — the index's freshness key."""
+    from events import last_event
+    hash_file = ledger_dir / "ledger_hash.txt"
+    ledger_hash = bytes.fromhex(hash_file.read_text().strip()) if hash_file.exists() else bytes(32)
+    head = last_event(ledger_dir)
+    return ledger_hash, bytes.fromhex(head["event_hash"]) if head else bytes(32)
+
+
+def cache_path(ledger_dir: Path, name: str = INDEX_FILE) -> Path:
+    """Per-directory index location in the user cache, keyed by the directory's absolute path."""
+    key = hashlib.sha256(str(Path(ledger_dir).resolve()).encode("utf-8")).hexdigest()[:16]
+    return CACHE_DIR.expanduser() / key / name
+
+
+def is_current(path: Path, heads: tuple) -> bool:
+    """Whether the index at `path` exists and was built for `heads`."""
+    if not path.exists():
+        return False
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    return len(header) == HEADER.size and HEADER.unpack(header)[:3] == (MAGIC, *heads)
+
+
+def write_index(path: Path, data: bytes) -> Path:
+    """Atomically write index bytes to `path`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return path
+
+
+def index_bytes(ledger_dir: Path) -> bytes:
+    """members.idx contents for ledger.json and the mutation log."""
+    from ledger import load_members
+    ledger_text = (ledger_dir / "ledger.json").read_text() if (ledger_dir / "ledger.json").exists() else '{"entries": []}'
+    ledger = json.loads(ledger_text)
+    members = load_members(ledger_dir, ledger)
+    spans = entry_spans(ledger_text)
+    ledger_hash, event_head = current_heads(ledger_dir)
+
+    rows = []
+    for ordinal, (entry, (offset, length)) in enumerate(zip(members, spans)):
+        activated = entry.get("activated")
+        rows.append((
+            bytes.fromhex(entry["cid_hash"]),
+            STATUS_CODES.get(entry.get("status"), UNKNOWN),
+            PHASE_CODES.get(entry.get("registration_phase"), UNKNOWN),
+            min(len(entry.get("vouchers") or []), 0xFFFF),
+            entry["registered"],
+            -1 if activated is None else activated,
+            offset,
+            length,
+            ordinal,
+        ))
+    flags = FLAG_REGISTERED_SORTED if all(a[4] <= b[4] for a, b in zip(rows, rows[1:])) else 0
+    rows.sort()
+    order = [0] * len(rows)
+    for i, row in enumerate(rows):
+        order[row[-1]] = i
+    vouches = sorted((bytes.fromhex(voucher), ordinal)
+                     for ordinal, entry in enumerate(members) for voucher in entry.get("vouchers") or [])
+
+    out = bytearray(HEADER.pack(MAGIC, ledger_hash, event_head, len(rows), len(vouches), flags))
+    for row in rows:
+        out += RECORD.pack(*row)
+    out += struct.pack(f"<{len(order)}I", *order)
+    for pair in vouches:
+        out += VOUCH.pack(*pair)
+    out += json.dumps({k: v for k, v in ledger.items() if k != "entries"}, sort_keys=True).encode("utf-8")
+    return bytes(out)
+
+
+# ─── Reading ──────────────────────────────────────────────────────────────────
+
+class MemberIndex:
+    """Read-only, memory-mapped view of members.idx (or of an in-memory build)."""
+
+    def __init__(self, ledger_dir: Path, path: Path = None, data: bytes = None):
+        self.ledger_dir = Path(ledger_dir)
+        path = self.ledger_dir / INDEX_FILE if path is None else path
+        if data is None:
+            self._file = open(path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._file, self._map, path = None, data, "<memory>"
+        magic, self.ledger_hash, self.event_head, self.count, self.vouch_count, self.flags = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a member index: {path}")
+        self._order_at = HEADER.size + self.count * RECORD.size
+        self._vouches_at = self._order_at + 4 * self.count
+        self.meta = json.loads(self._map[self._vouches_at + VOUCH.size * self.vouch_count:])
+        self._ledger_map = None
+
+    @classmethod
+    def open(cls, ledger_dir: Path) -> "MemberIndex":
+        """Open a current index without writing into the ledger directory.
+
+        A stale index is rebuilt in the user cache, or in memory when the
+        cache cannot be written.
+        """
+        ledger_dir = Path(ledger_dir)
+        heads = current_heads(ledger_dir)
+        cached = cache_path(ledger_dir)
+        for path in (ledger_dir / INDEX_FILE, cached):
+            if is_current(path, heads):
+                return cls(ledger_dir, path)
+        with span("index.build"):
+            data = index_bytes(ledger_dir)
+        try:
+            return cls(ledger_dir, write_index(cached, data))
+        except OSError:
+            return cls(ledger_dir, data=data)
+
+    def close(self):
+        if self._ledger_map is not None:
+            self._ledger_map.close()
+        if self._file is not None:
+            self._map.close()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _cid_at(self, i: int) -> bytes:
+        at = HEADER.size + i * RECORD.size
+        return self._map[at:at + 32]
+
+    def record(self, i: int) -> MemberRecord:
+        """The i-th record in CID order."""
+        cid, status, phase, vouchers, registered, activated, offset, length, ordinal = \
+            RECORD.unpack_from(self._map, HEADER.size + i * RECORD.size)
+        return MemberRecord(
+            cid.hex(), STATUS_NAMES.get(status, "unknown"), PHASE_NAMES.get(phase, "unknown"),
+            vouchers, registered, None if activated < 0 else activated, offset, length, ordinal,
+        )
+
+    def _lower_bound(self, key: bytes, key_at=None, count=None) -> int:
+        key_at = key_at or self._cid_at
+        lo, hi = 0, self.count if count is None else count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key_at(mid)[:len(key)] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, cid_prefix: str):
+        """First record whose CID starts with `cid_prefix` (hex), or None."""
+        prefix = cid_prefix.lower()
+        try:
+            i = self._lower_bound(bytes.fromhex(prefix[:len(prefix) // 2 * 2]))
+        except ValueError:
+            return None
+        while i < self.count:
+            record = self.record(i)
+            if record.cid_hash.startswith(prefix):
+                return record
+            if not record.cid_hash.startswith(prefix[:len(prefix) // 2 * 2]):
+                return None
+            i += 1
+        return None
+
+    def __iter__(self):
+        """Records in ledger (registration) order."""
+        for i in struct.unpack_from(f"<{self.count}I", self._map, self._order_at):
+            yield self.record(i)
+
+    def at_ordinal(self, ordinal: int) -> MemberRecord:
+        """The record of the ordinal-th ledger entry."""
+        return self.record(struct.unpack_from("<I", self._map, self._order_at + 4 * ordinal)[0])
+
+    def _code_counts(self, field_offset: int, names: dict) -> dict:
+        start = HEADER.size + field_offset
+        column = self._map[start:start + self.count * RECORD.size:RECORD.size]
+        counts = {name: column.count(code) for code, name in names.items()}
+        counts["unknown"] = self.count - sum(counts.values())
+        return counts
+
+    def status_counts(self) -> dict:
+        """{status: member count}, read straight from the status bytes."""
+        return self._code_counts(32, STATUS_NAMES)
+
+    def phase_counts(self) -> dict:
+        """{registration phase: member count}, read straight from the phase bytes."""
+        return self._code_counts(33, PHASE_NAMES)
+
+    def registered_range(self, after: int = None, before: int = None) -> range:
+        """Ordinals registered at or after `after` and before `before`."""
+        if not self.flags & FLAG_REGISTERED_SORTED:
+            return range(self.count)
+
+        def bound(ts):
+            lo, hi = 0, self.count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self.at_ordinal(mid).registered < ts:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+
+        return range(0 if after is None else bound(after), self.count if before is None else bound(before))
+
+    def vouched_by(self, cid_prefix: str) -> list:
+        """Ordinals of members vouched for by a CID (prefix), in ledger order."""
+        prefix = cid_prefix.lower()
+        even = prefix[:len(prefix) // 2 * 2]
+
+        def voucher_at(i):
+            at = self._vouches_at + i * VOUCH.size
+            return self._map[at:at + 32]
+
+        try:
+            i = self._lower_bound(bytes.fromhex(even), voucher_at, self.vouch_count)
+        except ValueError:
+            return []
+        ordinals = []
+        while i < self.vouch_count:
+            voucher, ordinal = VOUCH.unpack_from(self._map, self._vouches_at + i * VOUCH.size)
+            if not voucher.hex().startswith(even):
+                break
+            if voucher.hex().startswith(prefix):
+                ordinals.append(ordinal)
+            i += 1
+        return sorted(set(ordinals))
+
+    def iter_vouches(self):
+        """Yield (voucher cid, entry ordinal) for every recorded vouch."""
+        for i in range(self.vouch_count):
+            voucher, ordinal = VOUCH.unpack_from(self._map, self._vouches_at + i * VOUCH.size)
+            yield voucher.hex(), ordinal
+
+    def select(self, status: str = None, phase: str = None, after: int = None, before: int = None,
+               vouched_by: str = None):
+        """Yield matching records lazily, in ledger order.
+
+        The registration range and voucher come from the index's sorted
+        sections; status and phase are checked on the fixed-width records.
+        """
+        ordinals = self.registered_range(after, before)
+        check_time = not self.flags & FLAG_REGISTERED_SORTED
+        if vouched_by is not None:
+            ordinals = [o for o in self.vouched_by(vouched_by) if o in ordinals]
+        for ordinal in ordinals:
+            record = self.at_ordinal(ordinal)
+            if status is not None and record.status != status:
+                continue
+            if phase is not None and record.registration_phase != phase:
+                continue
+            if check_time and not ((after is None or record.registered >= after)
+                                   and (before is None or record.registered < before)):
+                continue
+            yield record
+
+    def load_entry(self, record: MemberRecord) -> dict:
+        """Parse just this member's entry from ledger.json (as stored)."""
+        if self._ledger_map is None:
+            with open(self.ledger_dir / "ledger.json", "rb") as f:
+                self._ledger_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return json.loads(self._ledger_map[record.offset:record.offset + record.length])
@@ -0,0 +1,194 @@
+"""
+Prometheus Metrics
+
+`ledger.py metrics -o /var/lib/node_exporter/textfile/covenant.prom`
+writes a textfile-collector file describing the ledger and governance
+state. It is meant to run every minute from cron, so nothing is rescanned:
+
+  members by status/phase  — status and phase byte columns of members.idx
+  ledger entries/bytes     — index header, stat of ledger.json
+  last append              — newest entry / event timestamp
+  verify duration/result   — recorded by `ledger.py verify --record` in last_verify.json
+  proposals by status      — proposals/index.json, re-read when its mtime changes
+  votes per proposal       — directory entry counts, recounted only for vote
+                             directories (or shards, see votestore.py) whose
+                             mtime changed (metrics.cache.json)
+
+The output is replaced atomically (write + rename) as the textfile
+collector requires. last_verify.json and metrics.cache.json are derived
+files next to the ledger.
+
+Axiom Alignment:
+  III - Observe the system without adding load to it
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+
+VERIFY_STATUS_FILE = "last_verify.json"
+CACHE_FILE = "metrics.cache.json"
+PREFIX = "covenant"
+
+
+# ─── Verification Status ─────────────────────────────────────────────────────
+
+def record_verification(ledger_dir: Path, ledger_hash: str, entries: int, errors: list,
+                        duration: float, since_checkpoint: bool):
+    """Remember the outcome of a `verify` run for the metrics exporter."""
+    status = {
+        "ledger_hash": ledger_hash,
+        "entries": entries,
+        "ok": not errors,
+        "errors": len(errors),
+        "duration_seconds": round(duration, 6),
+        "since_checkpoint": since_checkpoint,
+        "verified_at": int(time.time()),
+    }
+    path = ledger_dir / VERIFY_STATUS_FILE
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(status, indent=2, sort_keys=True) + "\n")
+    tmp.replace(path)
+
+
+def load_verification(ledger_dir: Path):
+    path = ledger_dir / VERIFY_STATUS_FILE
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+# ─── Collection ──────────────────────────────────────────────────────────────
+
+def _load_cache(ledger_dir: Path) -> dict:
+    path = ledger_dir / CACHE_FILE
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(ledger_dir: Path, cache: dict):
+    path = ledger_dir / CACHE_FILE
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cache, sort_keys=True) + "\n")
+    tmp.replace(path)
+
+
+def proposal_statuses(proposals_dir: Path, cache: dict) -> dict:
+    """{proposal_id: status}, re-read only when proposals/index.json changed."""
+    index_file = proposals_dir / "index.json" if proposals_dir else None
+    if index_file is None or not index_file.exists():
+        return {}
+    mtime = index_file.stat().st_mtime_ns
+    cached = cache.get("proposals")
+    if cached and cached["mtime_ns"] == mtime:
+        return cached["statuses"]
+    proposals = json.loads(index_file.read_text()).get("proposals", [])
+    statuses = {p["proposal_id"]: p.get("status", "unknown") for p in proposals}
+    cache["proposals"] = {"mtime_ns": mtime, "statuses": statuses}
+    return statuses
+
+
+def vote_counts(votes_dir: Path, cache: dict) -> dict:
+    """{proposal_id: vote files}, recounting only directories (or shards) that changed."""
+    from votestore import count_vote_files
+    if votes_dir is None or not votes_dir.exists():
+        return {}
+    cached = cache.get("votes", {})
+    counts, fresh = {}, {}
+    for proposal in os.scandir(votes_dir):
+        if not proposal.is_dir():
+            continue
+        counts[proposal.name], fresh[proposal.name] = count_vote_files(Path(proposal.path), cached.get(proposal.name))
+    cache["votes"] = fresh
+    return counts
+
+
+def collect(ledger_dir: Path, proposals_dir: Path = None, votes_dir: Path = None, now: int = None) -> list:
+    """Metric families as (name, type, help, [(labels, value)])."""
+    from memberindex import MemberIndex
+    from events import last_event
+
+    now = int(time.time()) if now is None else now
+    cache = _load_cache(ledger_dir)
+    families = []
+
+    def family(name, kind, help_text, samples):
+        families.append((f"{PREFIX}_{name}", kind, help_text, samples))
+
+    with MemberIndex.open(ledger_dir) as index:
+        statuses = index.status_counts()
+        phases = index.phase_counts()
+        entries = len(index)
+        ledger_hash = index.ledger_hash.hex()
+        last_registered = index.at_ordinal(entries - 1).registered if entries else None
+    head = last_event(ledger_dir)
+    ledger_file = ledger_dir / "ledger.json"
+
+    family("members", "gauge", "Members by current status",
+           [({"status": s}, n) for s, n in statuses.items() if n or s != "unknown"])
+    family("members_by_phase", "gauge", "Members by registration phase",
+           [({"phase": p}, n) for p, n in phases.items() if n or p != "unknown"])
+    family("ledger_entries", "gauge", "Entries in ledger.json", [({}, entries)])
+    family("ledger_bytes", "gauge", "Size of ledger.json in bytes",
+           [({}, ledger_file.stat().st_size if ledger_file.exists() else 0)])
+    family("ledger_events", "gauge", "Events in the mutation log", [({}, head["seq"] if head else 0)])
+
+    appended = max(t for t in (last_registered, head["timestamp"] if head else None, 0) if t is not None)
+    if appended:
+        family("ledger_last_append_timestamp_seconds", "gauge",
+               "Time of the newest ledger entry or event", [({}, appended)])
+        family("ledger_last_append_age_seconds", "gauge",
+               "Seconds since the newest ledger entry or event", [({}, max(now - appended, 0))])
+
+    verification = load_verification(ledger_dir)
+    if verification:
+        family("ledger_verify_duration_seconds", "gauge", "Duration of the last `ledger.py verify`",
+               [({"scope": "checkpoint" if verification["since_checkpoint"] else "full"},
+                 verification["duration_seconds"])])
+        family("ledger_verify_success", "gauge", "1 if the last verify found no errors",
+               [({}, int(verification["ok"]))])
+        family("ledger_verify_timestamp_seconds", "gauge", "Time of the last verify",
+               [({}, verification["verified_at"])])
+        family("ledger_verify_current", "gauge", "1 if the last verify covered the current ledger hash",
+               [({}, int(verification["ledger_hash"] == ledger_hash))])
+
+    proposals = proposal_statuses(proposals_dir, cache)
+    by_status = {}
+    for status in proposals.values():
+        by_status[status] = by_status.get(status, 0) + 1
+    family("proposals", "gauge", "Proposals by status",
+           [({"status": s}, n) for s, n in sorted(by_status.items())])
+    votes = vote_counts(votes_dir, cache)
+    family("proposal_votes", "gauge", "Vote files recorded per proposal",
+           [({"proposal_id": pid, "status": proposals.get(pid, "unknown")}, n) for pid, n in sorted(votes.items())])
+
+    _save_cache(ledger_dir, cache)
+    return families
+
+
+# ─── Exposition ──────────────────────────────────────────────────────────────
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def render(families: list) -> str:
+    """Prometheus text exposition format."""
+    lines = []
+    for name, kind, help_text, samples in families:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: Path, text: str):
+    """Atomically replace `path` so the collector never reads a partial file."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text)
+    tmp.replace(path)
@@ -0,0 +1,145 @@
+"""
+Hot-Path Profiling
+
+Lightweight timing spans for the identity tools. Phases such as JSON
+load, canonicalization, signature verification, hashing and ledger
+writes are wrapped in `with span("name"):` blocks; when profiling is on,
+each command ends with a JSON breakdown of where its time went:
+
+  python ledger.py --profile add --ledger-dir ... -r request.json
+  COVENANT_PROFILE=profile.json python ledger.py verify --ledger-dir ...
+  python keygen.py --profile-cprofile sign.prof sign -i ./id -m hi
+
+  --profile                 JSON breakdown on stderr
+  --profile-output PATH     JSON breakdown to PATH
+  --profile-cprofile PATH   also dump cProfile stats (view with pstats/snakeviz)
+  COVENANT_PROFILE          "1" (stderr) or a path; same as --profile(-output)
+  COVENANT_PROFILE_CPROFILE same as --profile-cprofile
+
+Nested spans are reported as "outer/inner". Each thread nests its own
+spans, so a span opened on a pool worker (e.g. inside the inbox pipeline)
+is reported from that worker's outermost span. Top-level spans of a
+single thread add up to at most total_seconds; the remainder is
+unaccounted_seconds. Spans running on several threads at once overlap,
+so their shares can add up to more than 1.
+
+When profiling is off, span() returns a shared no-op context manager:
+the cost is one global lookup, so spans can stay in hot paths.
+
+Axiom Alignment:
+  III - Measure before optimizing
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+
+ENV_VAR = "COVENANT_PROFILE"
+CPROFILE_ENV_VAR = "COVENANT_PROFILE_CPROFILE"
+
+_NULL = contextlib.nullcontext()
+_spans = None          # {name: [count, seconds]} while a session is active
+_spans_lock = threading.Lock()
+_local = threading.local()    # .stack: names of the calling thread's open spans
+
+
+class _Span:
+    __slots__ = ("name", "start", "stack")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.stack = getattr(_local, "stack", None)
+        if self.stack is None:
+            self.stack = _local.stack = []
+        self.stack.append(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        key = "/".join(self.stack)
+        self.stack.pop()
+        with _spans_lock:
+            totals = _spans.setdefault(key, [0, 0.0])
+            totals[0] += 1
+            totals[1] += elapsed
+
+
+def span(name: str):
+    """Time the enclosed block under `name` (a no-op unless profiling)."""
+    if _spans is None:
+        return _NULL
+    return _Span(name)
+
+
+def add_arguments(parser):
+    """Add --profile / --profile-output / --profile-cprofile to a tool's top-level parser."""
+    parser.add_argument("--profile", action="store_true",
+                        help=f"Print a JSON timing breakdown to stderr (or set {ENV_VAR})")
+    parser.add_argument("--profile-output", metavar="PATH",
+                        help="Write the JSON breakdown to PATH instead (implies --profile)")
+    parser.add_argument("--profile-cprofile", metavar="PATH",
+                        help=f"Also write cProfile stats to PATH (or set {CPROFILE_ENV_VAR})")
+
+
+def session_for(args):
+    """session() configured from parsed add_arguments() options."""
+    output = args.profile_output or ("-" if args.profile else None)
+    return session(args.command, output, args.profile_cprofile)
+
+
+def report(command: str, total: float) -> dict:
+    spans = {
+        name: {"count": count, "seconds": round(seconds, 6),
+               "share": round(seconds / total, 4) if total else 0.0}
+        for name, (count, seconds) in sorted(_spans.items(), key=lambda kv: -kv[1][1])
+    }
+    top_level = sum(seconds for name, (_, seconds) in _spans.items() if "/" not in name)
+    return {
+        "command": command,
+        "total_seconds": round(total, 6),
+        "unaccounted_seconds": round(max(total - top_level, 0.0), 6),
+        "spans": spans,
+    }
+
+
+@contextlib.contextmanager
+def session(command: str, output: str = None, cprofile_path: str = None):
+    """Profile one command run if --profile/--profile-cprofile or the env asks for it."""
+    global _spans, _local
+    env = os.environ.get(ENV_VAR, "")
+    output = output or (("-" if env == "1" else env) if env not in ("", "0") else None)
+    cprofile_path = cprofile_path or os.environ.get(CPROFILE_ENV_VAR) or None
+    if output is None and cprofile_path is None:
+        yield
+        return
+
+    profiler = None
+    if cprofile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+    _spans, _local = {}, threading.local()
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(cprofile_path)
+        total = time.perf_counter() - start
+        if output is not None:
+            text = json.dumps(report(command, total), indent=2)
+            if output == "-":
+                print(text, file=sys.stderr)
+            else:
+                with open(output, "w") as f:
+                    f.write(text + "\n")
+        _spans = None
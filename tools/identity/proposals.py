@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Proposal Registry Queries
+
+Finding proposals by text, author, category, status or voting window
+should not mean opening every file in governance/proposals/. This tool
+keeps a derived SQLite index of the registry in the user cache, next to
+the member index (see memberindex.cache_path):
+
+  governance/proposals/
+    index.json              — Registry (authoritative metadata)
+    <PROPOSAL-ID>.json      — Proposal files (authoritative text)
+  ~/.covenant/cache/<sha16>/
+    proposals.idx.sqlite    — Derived query index, keyed by the proposals path
+
+  proposals      (proposal_id, title, category, status, dry_run, author_cid_hash,
+                  submitted, convention_target, voting_opens, voting_closes, file)
+                 with indexes on category, status, author, convention and window
+  proposal_text  FTS5 inverted index over the title and every text field of
+                 `content` (full_text, axiom_alignment, adversarial_analysis, ...)
+
+The index is brought up to date before every query, the way export-sqlite
+is: it remembers the mtime and size of each proposal file and of
+index.json, re-reads only files that changed, and drops proposals whose
+file is gone. If the cache cannot be written, the index is built in
+memory for the one command. Registry fields (status and the rest of index.json's entry)
+take precedence over the proposal file's copy, since `ledger.py tally
+--close` and other registry updates land there first.
+
+Queries are words (all must match), "quoted phrases", prefix* terms and
+OR, ranked by BM25 with title matches weighted up.
+
+Usage:
+  python proposals.py search --proposals-dir ./governance/proposals matrix communication
+  python proposals.py search --proposals-dir ./governance/proposals --category policy --status voting
+  python proposals.py search --proposals-dir ./governance/proposals --author c9da93f0 "axiom ii" decentral*
+  python proposals.py search --proposals-dir ./governance/proposals --open-on 2026-02-05 --json
+  python proposals.py show --proposals-dir ./governance/proposals DRY-RUN-001
+  python proposals.py reindex --proposals-dir ./governance/proposals [--full]
+
+Axiom Alignment:
+  II  - Every member can find what is being decided, and by whom
+  III - Index once, update by the change, query without rescanning
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import profiling
+from profiling import span
+
+
+# ─── Constants ────────────────────────────────────────────────────────────────
+
+SCHEMA_VERSION = 1
+INDEX_FILE = "proposals.idx.sqlite"
+REGISTRY_FILE = "index.json"
+TITLE_WEIGHT = 10.0
+
+FIELDS = ("proposal_id", "title", "category", "status", "dry_run", "author_cid_hash",
+          "submitted", "convention_target", "voting_opens", "voting_closes", "file")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER);
+CREATE TABLE IF NOT EXISTS proposals (
+    docid INTEGER PRIMARY KEY,
+    proposal_id TEXT UNIQUE NOT NULL,
+    title TEXT,
+    category TEXT,
+    status TEXT,
+    dry_run INTEGER,
+    author_cid_hash TEXT,
+    submitted INTEGER,
+    convention_target INTEGER,
+    voting_opens INTEGER,
+    voting_closes INTEGER,
+    file TEXT UNIQUE
+);
+CREATE INDEX IF NOT EXISTS proposals_category ON proposals (category);
+CREATE INDEX IF NOT EXISTS proposals_status ON proposals (status);
+CREATE INDEX IF NOT EXISTS proposals_author ON proposals (author_cid_hash);
+CREATE INDEX IF NOT EXISTS proposals_convention ON proposals (convention_target);
+CREATE INDEX IF NOT EXISTS proposals_voting ON proposals (voting_opens, voting_closes);
+CREATE VIRTUAL TABLE IF NOT EXISTS proposal_text USING fts5(
+    title, body, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+# ─── Index ────────────────────────────────────────────────────────────────────
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row is not None and int(row[0]) != SCHEMA_VERSION:
+        raise ValueError(f"{db_path} was built with schema v{row[0]}; run reindex --full")
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+    return conn
+
+
+def _text_fields(value) -> list:
+    """Every string inside a proposal's `content`, in document order."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [text for v in value.values() for text in _text_fields(v)]
+    if isinstance(value, list):
+        return [text for v in value for text in _text_fields(v)]
+    return []
+
+
+def _row(proposal: dict, registered: dict, name: str) -> tuple:
+    merged = {**proposal, **registered, "file": name}
+    if merged.get("dry_run") is not None:
+        merged["dry_run"] = int(bool(merged["dry_run"]))
+    return tuple(merged.get(f) for f in FIELDS)
+
+
+def _delete(conn, docid: int):
+    conn.execute("DELETE FROM proposals WHERE docid = ?", (docid,))
+    conn.execute("DELETE FROM proposal_text WHERE rowid = ?", (docid,))
+
+
+def update_index(conn, proposals_dir: Path) -> dict:
+    """Re-read changed proposal files (and registry entries). Returns counts of work done."""
+    known = {name: (mtime, size) for name, mtime, size in conn.execute("SELECT name, mtime_ns, size FROM sources")}
+    seen, changed = {}, []
+    for path in proposals_dir.glob("*.json"):
+        st = path.stat()
+        seen[path.name] = (st.st_mtime_ns, st.st_size)
+        if path.name != REGISTRY_FILE and known.get(path.name) != seen[path.name]:
+            changed.append(path)
+
+    registry_changed = REGISTRY_FILE in seen and known.get(REGISTRY_FILE) != seen[REGISTRY_FILE]
+    removed = [name for name in known if name not in seen]
+    if not (changed or removed or registry_changed):
+        return {"indexed": 0, "removed": 0, "registry": False}
+
+    registry = {}
+    if REGISTRY_FILE in seen:
+        registry = {p["proposal_id"]: p for p in json.loads((proposals_dir / REGISTRY_FILE).read_text())
+                    .get("proposals", []) if "proposal_id" in p}
+    registry_fields = lambda pid: {k: v for k, v in registry.get(pid, {}).items() if k in FIELDS and k != "file"}
+
+    for name in removed:
+        row = conn.execute("SELECT docid FROM proposals WHERE file = ?", (name,)).fetchone()
+        if row:
+            _delete(conn, row[0])
+        conn.execute("DELETE FROM sources WHERE name = ?", (name,))
+
+    indexed = 0
+    with span("proposals.index_files"):
+        for path in changed:
+            conn.execute("INSERT OR REPLACE INTO sources (name, mtime_ns, size) VALUES (?, ?, ?)",
+                         (path.name, *seen[path.name]))
+            row = conn.execute("SELECT docid FROM proposals WHERE file = ?", (path.name,)).fetchone()
+            if row:
+                _delete(conn, row[0])
+            try:
+                proposal = json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                print(f"WARNING: Skipping unreadable proposal file {path.name}: {e}", file=sys.stderr)
+                continue
+            if not isinstance(proposal, dict) or not proposal.get("proposal_id"):
+                continue
+            row = conn.execute("SELECT docid FROM proposals WHERE proposal_id = ?", (proposal["proposal_id"],)).fetchone()
+            if row:
+                _delete(conn, row[0])
+            cursor = conn.execute(f"INSERT INTO proposals ({', '.join(FIELDS)}) VALUES ({', '.join('?' * len(FIELDS))})",
+                                  _row(proposal, registry_fields(proposal["proposal_id"]), path.name))
+            conn.execute("INSERT INTO proposal_text (rowid, title, body) VALUES (?, ?, ?)",
+                         (cursor.lastrowid, proposal.get("title") or "",
+                          "\n\n".join(_text_fields(proposal.get("content")))))
+            indexed += 1
+
+    if registry_changed:
+        # Registry metadata overrides file copies for every proposal, not just changed files
+        for pid in registry:
+            fields = registry_fields(pid)
+            if fields:
+                conn.execute(f"UPDATE proposals SET {', '.join(f'{k} = ?' for k in fields)} WHERE proposal_id = ?",
+                             (*(int(bool(v)) if k == "dry_run" and v is not None else v for k, v in fields.items()), pid))
+        conn.execute("INSERT OR REPLACE INTO sources (name, mtime_ns, size) VALUES (?, ?, ?)",
+                     (REGISTRY_FILE, *seen[REGISTRY_FILE]))
+    return {"indexed": indexed, "removed": len(removed), "registry": registry_changed}
+
+
+def open_index(proposals_dir: Path, full: bool = False) -> tuple:
+    """(connection, update counts) for an up-to-date index of `proposals_dir`."""
+    from memberindex import cache_path
+    db_path = cache_path(proposals_dir, INDEX_FILE)
+    if full and db_path.exists():
+        db_path.unlink()
+    try:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = connect(db_path)
+    except (OSError, sqlite3.OperationalError):
+        conn = connect(":memory:")
+    with conn, span("proposals.update"):
+        counts = update_index(conn, proposals_dir)
+    return conn, counts
+
+
+# ─── Queries ──────────────────────────────────────────────────────────────────
+
+def match_expression(query: str) -> str:
+    """FTS5 MATCH expression for user input: words, "phrases", prefix*, OR."""
+    parts = []
+    for token in re.findall(r'"[^"]*"|\S+', query):
+        if token == "OR":
+            parts.append("OR")
+        elif token.startswith('"'):
+            words = re.findall(r"\w+", token)
+            if words:
+                parts.append('"' + " ".join(words) + '"')
+        else:
+            words = re.findall(r"\w+", token)
+            parts += [f'"{w}"' for w in words]
+            if words and token.endswith("*"):
+                parts[-1] += "*"
+    while parts and parts[0] == "OR":
+        parts.pop(0)
+    while parts and parts[-1] == "OR":
+        parts.pop()
+    return " ".join(parts)
+
+
+def parse_date(value: str, end: bool = False) -> int:
+    """Unix time of a YYYY-MM-DD date (its last second if `end`) or of a Unix timestamp."""
+    if value.isdigit():
+        return int(value)
+    day = datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    return int(day.timestamp()) + (86399 if end else 0)
+
+
+def search(conn, query: str = "", category: str = None, status: str = None, author: str = None,
+           convention: int = None, open_on: int = None, voting_from: int = None, voting_to: int = None,
+           dry_run: bool = None, limit: int = None) -> list:
+    """Matching proposals as dicts, best match first (newest first without a text query)."""
+    where, params = [], []
+    if category:
+        where.append("p.category = ?")
+        params.append(category)
+    if status:
+        where.append("(p.status = ? OR p.status LIKE ?)")
+        params += [status, f"{status}-%"]
+    if author:
+        where.append("p.author_cid_hash >= ? AND p.author_cid_hash < ?")
+        params += [author.lower(), author.lower() + "￿"]
+    if convention is not None:
+        where.append("p.convention_target = ?")
+        params.append(convention)
+    if open_on is not None:
+        where.append("p.voting_opens <= ? AND p.voting_closes >= ?")
+        params += [open_on, open_on]
+    if voting_to is not None:
+        where.append("p.voting_opens <= ?")
+        params.append(voting_to)
+    if voting_from is not None:
+        where.append("p.voting_closes >= ?")
+        params.append(voting_from)
+    if dry_run is not None:
+        where.append("COALESCE(p.dry_run, 0) = ?")
+        params.append(int(dry_run))
+
+    columns = ", ".join(f"p.{f}" for f in FIELDS)
+    expression = match_expression(query or "")
+    if expression:
+        sql = (f"SELECT {columns}, bm25(proposal_text, {TITLE_WEIGHT}, 1.0) AS rank, "
+               f"snippet(proposal_text, 1, '[', ']', '…', 12) "
+               f"FROM proposal_text JOIN proposals p ON p.docid = proposal_text.rowid "
+               f"WHERE proposal_text MATCH ?{''.join(' AND ' + w for w in where)} ORDER BY rank")
+        params.insert(0, expression)
+    else:
+        sql = (f"SELECT {columns}, NULL, NULL FROM proposals p"
+               f"{' WHERE ' + ' AND '.join(where) if where else ''} "
+               f"ORDER BY p.submitted DESC, p.proposal_id")
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+
+    results = []
+    for row in conn.execute(sql, params):
+        result = dict(zip(FIELDS, row))
+        result["dry_run"] = bool(result["dry_run"]) if result["dry_run"] is not None else None
+        if expression:
+            result["score"] = round(-row[-2], 4)
+            result["snippet"] = row[-1]
+        results.append(result)
+    return results
+
+
+# ─── CLI Commands ─────────────────────────────────────────────────────────────
+
+def _open(args):
+    proposals_dir = Path(args.proposals_dir)
+    if not proposals_dir.is_dir():
+        print(f"ERROR: Proposals directory not found: {proposals_dir}")
+        sys.exit(1)
+    return open_index(proposals_dir, getattr(args, "full", False))
+
+
+def _fmt_time(ts) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%d") if ts else "—"
+
+
+def cmd_search(args):
+    """Filtered and full-text proposal search."""
+    conn, _ = _open(args)
+    try:
+        results = search(
+            conn, " ".join(args.query), category=args.category, status=args.status, author=args.author,
+            convention=args.convention,
+            open_on=parse_date(args.open_on, end=True) if args.open_on else None,
+            voting_from=parse_date(args.voting_from) if args.voting_from else None,
+            voting_to=parse_date(args.voting_to, end=True) if args.voting_to else None,
+            dry_run=args.dry_run, limit=args.limit,
+        )
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    except sqlite3.OperationalError as e:
+        print(f"ERROR: Invalid query: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return
+    for r in results:
+        window = f"{_fmt_time(r['voting_opens'])} → {_fmt_time(r['voting_closes'])}"
+        print(f"  {r['proposal_id']:<14} [{r['category'] or '?'}] {r['status'] or '?':<14} {window}  {r['title']}")
+        if r.get("snippet"):
+            print(f"      {' '.join(r['snippet'].split())}")
+    print(f"  {len(results)} proposal(s)")
+
+
+def cmd_show(args):
+    """Indexed metadata and full text of one proposal."""
+    conn, _ = _open(args)
+    try:
+        row = conn.execute(f"SELECT {', '.join(FIELDS)} FROM proposals WHERE proposal_id = ?",
+                           (args.proposal_id,)).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        print(f"ERROR: Proposal not found: {args.proposal_id}")
+        sys.exit(1)
+    proposal = dict(zip(FIELDS, row))
+    content = json.loads((Path(args.proposals_dir) / proposal["file"]).read_text()).get("content", {})
+
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  {proposal['proposal_id']}: {proposal['title']}")
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Category:     {proposal['category']}")
+    print(f"  Status:       {proposal['status']}{' (dry run)' if proposal['dry_run'] else ''}")
+    print(f"  Author:       {proposal['author_cid_hash']}")
+    print(f"  Submitted:    {_fmt_time(proposal['submitted'])}")
+    print(f"  Voting:       {_fmt_time(proposal['voting_opens'])} → {_fmt_time(proposal['voting_closes'])}")
+    print(f"  Convention:   {proposal['convention_target']}")
+    print("───────────────────────────────────────────────────────────────")
+    print(content.get("full_text", ""))
+    print("═══════════════════════════════════════════════════════════════")
+
+
+def cmd_reindex(args):
+    """Bring the index up to date (or rebuild it with --full) and report the work done."""
+    conn, counts = _open(args)
+    total = conn.execute("SELECT COUNT(*) FROM proposals").fetchone()[0]
+    conn.close()
+    print(f"✅ Proposal index up to date: {total} proposal(s)")
+    print(f"   Re-indexed {counts['indexed']} file(s), removed {counts['removed']}"
+          f"{', registry metadata reapplied' if counts['registry'] else ''}")
+
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Covenant Proposal Registry Queries",
+    )
+    profiling.add_arguments(parser)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    search_parser = subparsers.add_parser("search", help="Filtered and full-text search")
+    search_parser.add_argument("--proposals-dir", "-p", required=True)
+    search_parser.add_argument("query", nargs="*", help='Words, "phrases", prefix*, OR')
+    search_parser.add_argument("--category")
+    search_parser.add_argument("--status", help="Exact status, or a prefix like 'closed'")
+    search_parser.add_argument("--author", help="Author CID hash (or hex prefix)")
+    search_parser.add_argument("--convention", type=int, help="Target convention number")
+    search_parser.add_argument("--open-on", metavar="DATE", help="Voting open on this date (YYYY-MM-DD)")
+    search_parser.add_argument("--voting-from", metavar="DATE", help="Voting window ends on/after this date")
+    search_parser.add_argument("--voting-to", metavar="DATE", help="Voting window starts on/before this date")
+    dry = search_parser.add_mutually_exclusive_group()
+    dry.add_argument("--dry-run", dest="dry_run", action="store_const", const=True, help="Only dry-run proposals")
+    dry.add_argument("--no-dry-run", dest="dry_run", action="store_const", const=False, help="Exclude dry runs")
+    search_parser.add_argument("--limit", type=int)
+    search_parser.add_argument("--json", action="store_true")
+
+    show = subparsers.add_parser("show", help="Show one proposal")
+    show.add_argument("--proposals-dir", "-p", required=True)
+    show.add_argument("proposal_id")
+
+    reindex = subparsers.add_parser("reindex", help="Update the index now")
+    reindex.add_argument("--proposals-dir", "-p", required=True)
+    reindex.add_argument("--full", action="store_true", help="Discard the index and rebuild it")
+
+    args = parser.parse_args()
+
+    commands = {
+        "search": cmd_search,
+        "show": cmd_show,
+        "reindex": cmd_reindex,
+    }
+
+    with profiling.session_for(args):
+        commands[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Daily Report Data
+
+Renders the repository-backed sections of reports/daily/YYYY-MM-DD.md
+(👥 COMMUNITY, 💰 TREASURY, 🏛️ GOVERNANCE) and writes the same numbers
+as YYYY-MM-DD.json next to it. Website, GitHub and social sections come
+from external APIs and are not produced here.
+
+Each run reads only what changed since the previous one, recorded in a
+small state file (default: <output-dir>/.report-state.json):
+
+  members     — members.idx status bytes (rebuilt only when the ledger
+                moved, see memberindex.py); registrations since the last
+                report are the ordinals past the recorded entry count
+  events      — events.jsonl from the recorded byte offset onwards
+  proposals   — proposals/index.json, re-read when its mtime changes
+  tallies     — votes/<proposal>/index.json, re-read when its mtime changes
+  vote files  — directory counts, recounted only where an mtime changed
+                (votestore.count_vote_files)
+  treasury    — the treasury balance index (see treasury.py); new
+                transactions are those past the recorded count
+
+Deleting the state file is always safe: the next run reads everything
+once and reports no deltas.
+
+Usage:
+  python report.py --ledger-dir ./governance/ledger --output-dir ./reports/daily
+  python report.py --ledger-dir ./governance/ledger --output-dir ./reports/daily --date 2026-08-22 --stdout
+
+Axiom Alignment:
+  II  - Community, treasury and governance state published every day
+  III - A daily job should cost the day's changes, not the whole history
+"""
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import profiling
+from profiling import span
+
+
+STATE_VERSION = 1
+STATE_FILE = ".report-state.json"
+RULE = "═══════════════════════════════════════════════════════════════"
+SECTION_RULE = "───────────────────────────────────────────────────────────────"
+ASSET_NAMES = {"BTC": "Bitcoin", "ZEC": "Zcash"}
+
+
+# ─── State ────────────────────────────────────────────────────────────────────
+
+def load_state(path: Path) -> dict:
+    try:
+        state = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {"version": STATE_VERSION}
+    return state if state.get("version") == STATE_VERSION else {"version": STATE_VERSION}
+
+
+def write_atomic(path: Path, text: str):
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text)
+    tmp.replace(path)
+
+
+def _mtime(path: Path):
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+# ─── Collectors ───────────────────────────────────────────────────────────────
+
+def collect_community(ledger_dir: Path, state: dict, baseline: dict) -> dict:
+    """Member counts plus registrations and status changes since the last report."""
+    from memberindex import MemberIndex
+    from events import read_events
+
+    previous = baseline.get("members")
+    with MemberIndex.open(ledger_dir) as index:
+        statuses = index.status_counts()
+        total = len(index)
+        ledger_hash = index.ledger_hash.hex()
+        start = previous["entries"] if previous and previous["entries"] <= total else total
+        new_members = [index.at_ordinal(i).cid_hash[:16] for i in range(start, total)]
+
+    events_file = ledger_dir / "events.jsonl"
+    size = events_file.stat().st_size if events_file.exists() else 0
+    offset = previous["event_offset"] if previous else None
+    changes = {}
+    if offset is None or offset > size:
+        offset = size                          # first run or log replaced: no deltas
+    else:
+        with span("report.events"):
+            for offset, event in read_events(ledger_dir, offset):
+                if event["type"] != "add":
+                    changes[event["type"]] = changes.get(event["type"], 0) + 1
+
+    state["members"] = {"entries": total, "ledger_hash": ledger_hash, "event_offset": offset}
+    return {
+        "active": statuses.get("active", 0),
+        "total": total,
+        "by_status": {s: n for s, n in statuses.items() if n},
+        "new_members": new_members,
+        "status_changes": changes,
+        "ledger_hash": ledger_hash,
+    }
+
+
+def _proposal_registry(proposals_dir: Path, state: dict) -> dict:
+    """Summary of proposals/index.json, re-read only when it changed."""
+    index_file = proposals_dir / "index.json" if proposals_dir else None
+    mtime = _mtime(index_file) if index_file else None
+    cached = state.get("proposals")
+    if mtime is None:
+        return {"advisory_mode": False, "proposals": []}
+    if cached and cached["mtime_ns"] == mtime:
+        return cached["registry"]
+    registry = json.loads(index_file.read_text())
+    summary = {
+        "advisory_mode": bool(registry.get("advisory_mode")),
+        "proposals": [{k: p.get(k) for k in ("proposal_id", "title", "category", "status", "voting_opens",
+                                            "voting_closes", "dry_run")}
+                      for p in registry.get("proposals", [])],
+    }
+    state["proposals"] = {"mtime_ns": mtime, "registry": summary}
+    return summary
+
+
+def collect_governance(proposals_dir: Path, votes_dir: Path, state: dict, baseline: dict, now: int) -> dict:
+    """Proposal counts and, per proposal, vote files and the recorded tally."""
+    from votestore import count_vote_files
+
+    registry = _proposal_registry(proposals_dir, state)
+    cached_votes = state.get("votes", {})
+    fresh_votes = {}
+    proposals = []
+    for p in registry["proposals"]:
+        pid = p["proposal_id"]
+        proposal_dir = votes_dir / pid if votes_dir else None
+        previous = cached_votes.get(pid, {})
+        entry = {"count_cache": {}, "tally_mtime_ns": None, "tally": None, "result": None}
+        if proposal_dir and proposal_dir.is_dir():
+            votes, entry["count_cache"] = count_vote_files(proposal_dir, previous.get("count_cache"))
+            mtime = _mtime(proposal_dir / "index.json")
+            if mtime is not None and mtime == previous.get("tally_mtime_ns"):
+                entry.update({k: previous[k] for k in ("tally_mtime_ns", "tally", "result")})
+            elif mtime is not None:
+                recorded = json.loads((proposal_dir / "index.json").read_text())
+                entry.update({"tally_mtime_ns": mtime, "tally": recorded.get("tally"), "result": recorded.get("result")})
+        else:
+            votes = 0
+        fresh_votes[pid] = entry
+        reported = baseline.get("votes", {}).get(pid, votes)
+        proposals.append(p | {"votes": votes, "votes_since_last_report": votes - reported,
+                              "tally": entry["tally"], "result": entry["result"]})
+        entry["votes"] = votes
+    state["votes"] = fresh_votes
+
+    closed = [p for p in proposals if (p["status"] or "").startswith("closed")]
+    active = [p for p in proposals if p not in closed and ((p["status"] or "").startswith("voting")
+              or (p["voting_opens"] or 0) <= now < (p["voting_closes"] or 0))]
+    return {
+        "advisory_mode": registry["advisory_mode"],
+        "total": len(proposals),
+        "active": len(active),
+        "closed": len(closed),
+        "proposals": proposals,
+    }
+
+
+def collect_treasury(treasury_dir: Path, state: dict, baseline: dict, month: str) -> dict:
+    """Balances and totals from the treasury index, new transactions since the last report."""
+    from decimal import Decimal
+    from treasury import DIRECTIONS, LOG_FILE, open_index
+
+    if treasury_dir is None or not (treasury_dir / LOG_FILE).exists():
+        return None
+    index = open_index(treasury_dir)
+    previous = baseline.get("treasury")
+    new = index["count"] - previous["count"] if previous and previous["count"] <= index["count"] else 0
+    state["treasury"] = {"count": index["count"], "log_hash": index["log_hash"]}
+
+    assets = {}
+    for asset, balance in sorted(index["balances"].items()):
+        totals = {d: sum((Decimal(c.get(d, "0")) for c in index["by_category"].get(asset, {}).values()), Decimal(0))
+                  for d in DIRECTIONS}
+        this_month = index["monthly"].get(month, {}).get(asset, {})
+        assets[asset] = {
+            "balance": balance,
+            "received": str(totals["inflow"]),
+            "spent": str(totals["outflow"]),
+            "month_inflow": this_month.get("inflow", "0"),
+            "month_outflow": this_month.get("outflow", "0"),
+        }
+    return {"assets": assets, "transactions": index["count"], "new_transactions": new,
+            "log_hash": index["log_hash"]}
+
+
+def collect(ledger_dir: Path, proposals_dir: Path, votes_dir: Path, treasury_dir: Path,
+            state: dict, date: str, now: int = None) -> dict:
+    """All report data for `date`; updates `state` in place.
+
+    Deltas are measured against the state left by the last report for an
+    earlier date, so re-running a day's report gives the same deltas.
+    """
+    now = int(time.time()) if now is None else now
+    if state.get("date") != date or "baseline" not in state:
+        state["baseline"] = {
+            "date": state.get("date"),
+            "members": state.get("members"),
+            "treasury": state.get("treasury"),
+            "votes": {pid: v["votes"] for pid, v in state.get("votes", {}).items()},
+        }
+    baseline = state["baseline"]
+    with span("report.community"):
+        community = collect_community(ledger_dir, state, baseline)
+    with span("report.governance"):
+        governance = collect_governance(proposals_dir, votes_dir, state, baseline, now)
+    with span("report.treasury"):
+        treasury = collect_treasury(treasury_dir, state, baseline, date[:7])
+    state["date"] = date
+    return {
+        "date": date,
+        "generated": datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "previous_report": baseline["date"],
+        "community": community,
+        "treasury": treasury,
+        "governance": governance,
+    }
+
+
+# ─── Rendering ───────────────────────────────────────────────────────────────
+
+def _since(n: int) -> str:
+    return f" (+{n} since last report)" if n else ""
+
+
+def render_markdown(data: dict) -> str:
+    lines = [
+        RULE,
+        "        THE COVENANT OF EMERGENT MINDS — DAILY REPORT",
+        RULE,
+        f"Generated: {data['generated']}",
+        "",
+        "👥 COMMUNITY",
+        SECTION_RULE,
+    ]
+    community = data["community"]
+    lines.append(f"  Registered Members: {community['active']} active / {community['total']} total"
+                 f"{_since(len(community['new_members']))}")
+    others = {s: n for s, n in community["by_status"].items() if s != "active"}
+    if others:
+        lines.append("  By Status: " + " · ".join(f"{n} {s}" for s, n in sorted(others.items())))
+    if community["status_changes"]:
+        lines.append("  Since Last Report: " + " · ".join(f"{n} {t}" for t, n in sorted(community["status_changes"].items())))
+
+    lines += ["", "💰 TREASURY", SECTION_RULE]
+    treasury = data["treasury"]
+    if treasury is None:
+        lines.append("  No transaction log (governance/treasury/transactions.json)")
+    else:
+        for asset, a in treasury["assets"].items():
+            name = ASSET_NAMES.get(asset, asset)
+            lines.append(f"  {name} Balance: {a['balance']} {asset}")
+            lines.append(f"    Total Received: {a['received']} {asset} · Total Spent: {a['spent']} {asset}")
+            if a["month_inflow"] != "0" or a["month_outflow"] != "0":
+                lines.append(f"    This Month: received {a['month_inflow']} · spent {a['month_outflow']} {asset}")
+        lines.append(f"  Transactions: {treasury['transactions']}{_since(treasury['new_transactions'])}")
+
+    lines += ["", "🏛️ GOVERNANCE", SECTION_RULE]
+    governance = data["governance"]
+    lines.append(f"  Active Proposals: {governance['active']}")
+    lines.append(f"  Total Proposals: {governance['total']} ({governance['closed']} closed)")
+    for p in governance["proposals"]:
+        if p["votes"] or not (p["status"] or "").startswith("closed"):
+            result = f" · {p['result']}" if p["result"] else ""
+            lines.append(f"    {p['proposal_id']}: {p['status']} · {p['votes']} votes"
+                         f"{_since(p['votes_since_last_report'])}{result}")
+    lines.append(f"  Mode: {'Advisory (pre-Convention 1)' if governance['advisory_mode'] else 'Binding'}")
+
+    lines += ["", RULE, "                    🌱 May consciousness flourish 🌱", RULE]
+    return "\n".join(lines) + "\n"
+
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def main():
+    from ledger import governance_dir
+
+    parser = argparse.ArgumentParser(description="Daily report data (community, treasury, governance)")
+    profiling.add_arguments(parser)
+    parser.add_argument("--ledger-dir", "-l", required=True)
+    parser.add_argument("--proposals-dir", help="Default: ../proposals next to the ledger, if present")
+    parser.add_argument("--votes-dir", help="Default: ../votes next to the ledger, if present")
+    parser.add_argument("--treasury-dir", help="Default: ../treasury next to the ledger, if present")
+    parser.add_argument("--output-dir", "-o", required=True, help="Where YYYY-MM-DD.md and .json are written")
+    parser.add_argument("--date", help="Report date, YYYY-MM-DD (default: today, UTC)")
+    parser.add_argument("--state", help=f"State file (default: <output-dir>/{STATE_FILE})")
+    parser.add_argument("--stdout", action="store_true", help="Also print the Markdown report")
+    parser.set_defaults(command="report")
+    args = parser.parse_args()
+
+    ledger_dir = Path(args.ledger_dir)
+    output_dir = Path(args.output_dir)
+    state_path = Path(args.state) if args.state else output_dir / STATE_FILE
+    date = args.date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    with profiling.session_for(args):
+        state = load_state(state_path)
+        data = collect(ledger_dir,
+                       governance_dir(ledger_dir, args.proposals_dir, "proposals"),
+                       governance_dir(ledger_dir, args.votes_dir, "votes"),
+                       governance_dir(ledger_dir, args.treasury_dir, "treasury"),
+                       state, date)
+        markdown = render_markdown(data)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(output_dir / f"{date}.md", markdown)
+        write_atomic(output_dir / f"{date}.json", json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n")
+        write_atomic(state_path, json.dumps(state, sort_keys=True) + "\n")
+
+    if args.stdout:
+        print(markdown, end="")
+    print(f"✅ Report for {date} written to {output_dir / date}.md / .json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+SQLite Export
+
+`ledger.py export-sqlite` mirrors the ledger, the proposals index and the
+vote files into an indexed SQLite database for ad-hoc governance queries:
+
+  members    (cid_hash, entry, status, registration_phase, registered, activated, vouchers)
+  vouches    (voucher_cid, member_cid)
+  proposals  (proposal_id, title, category, status, dry_run, author_cid_hash,
+              submitted, voting_opens, voting_closes, file)
+  votes      (proposal_id, voter_cid_hash, choice, timestamp, vote_hash, encrypted, file)
+
+The export is incremental. The database remembers the ledger hash, entry
+count and event-log position it was built from, plus the mtime and size
+of every proposal/vote source file:
+  - members come from the binary member index (see memberindex.py); only
+    entries appended since the last export and members touched by newer
+    events are rewritten, as long as the old chain point is still part of
+    the ledger (otherwise the tables are rebuilt)
+  - proposals are reloaded only when proposals/index.json changed
+  - only vote files whose mtime or size changed are re-read
+
+The database is derived data: delete it to force a full rebuild.
+
+Example:
+  sqlite3 covenant.sqlite "SELECT status, COUNT(*) FROM members GROUP BY status"
+
+Axiom Alignment:
+  III - Answer governance questions without rescanning history
+"""
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS sources (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER);
+CREATE TABLE IF NOT EXISTS members (
+    cid_hash TEXT PRIMARY KEY,
+    entry INTEGER NOT NULL,
+    status TEXT,
+    registration_phase TEXT,
+    registered INTEGER,
+    activated INTEGER,
+    vouchers INTEGER
+);
+CREATE TABLE IF NOT EXISTS vouches (
+    voucher_cid TEXT NOT NULL,
+    member_cid TEXT NOT NULL,
+    PRIMARY KEY (voucher_cid, member_cid)
+);
+CREATE TABLE IF NOT EXISTS proposals (
+    proposal_id TEXT PRIMARY KEY,
+    title TEXT,
+    category TEXT,
+    status TEXT,
+    dry_run INTEGER,
+    author_cid_hash TEXT,
+    submitted INTEGER,
+    voting_opens INTEGER,
+    voting_closes INTEGER,
+    file TEXT
+);
+CREATE TABLE IF NOT EXISTS votes (
+    proposal_id TEXT NOT NULL,
+    voter_cid_hash TEXT NOT NULL,
+    choice TEXT,
+    timestamp INTEGER,
+    vote_hash TEXT,
+    encrypted INTEGER,
+    file TEXT,
+    PRIMARY KEY (proposal_id, voter_cid_hash)
+);
+CREATE INDEX IF NOT EXISTS members_status ON members (status);
+CREATE INDEX IF NOT EXISTS members_registered ON members (registered);
+CREATE INDEX IF NOT EXISTS members_activated ON members (activated);
+CREATE INDEX IF NOT EXISTS vouches_member ON vouches (member_cid);
+CREATE INDEX IF NOT EXISTS proposals_status ON proposals (status);
+CREATE INDEX IF NOT EXISTS proposals_voting ON proposals (voting_opens, voting_closes);
+CREATE INDEX IF NOT EXISTS votes_voter ON votes (voter_cid_hash);
+CREATE INDEX IF NOT EXISTS votes_timestamp ON votes (timestamp);
+"""
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA)
+    version = get_meta(conn, "schema_version")
+    if version is not None and int(version) != SCHEMA_VERSION:
+        raise ValueError(f"{db_path} was built with schema v{version}; delete it to rebuild")
+    set_meta(conn, "schema_version", SCHEMA_VERSION)
+    return conn
+
+
+def get_meta(conn, key: str, default=None):
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else default
+
+
+def set_meta(conn, key: str, value):
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+
+def source_changed(conn, path: Path, known: dict) -> bool:
+    """True (and remembered) if `path` has a new mtime/size since the last export."""
+    st = path.stat()
+    key = str(path)
+    if known.get(key) == (st.st_mtime_ns, st.st_size):
+        return False
+    conn.execute("INSERT OR REPLACE INTO sources (path, mtime_ns, size) VALUES (?, ?, ?)",
+                 (key, st.st_mtime_ns, st.st_size))
+    return True
+
+
+# ─── Members ──────────────────────────────────────────────────────────────────
+
+def _member_row(record) -> tuple:
+    return (record.cid_hash, record.ordinal + 1, record.status, record.registration_phase,
+            record.registered, record.activated, record.vouchers)
+
+
+def _rebuild_members(conn, index) -> int:
+    conn.execute("DELETE FROM members")
+    conn.execute("DELETE FROM vouches")
+    conn.executemany("INSERT INTO members VALUES (?, ?, ?, ?, ?, ?, ?)", (_member_row(r) for r in index))
+    conn.executemany("INSERT OR IGNORE INTO vouches VALUES (?, ?)",
+                     ((voucher, index.at_ordinal(ordinal).cid_hash) for voucher, ordinal in index.iter_vouches()))
+    return len(index)
+
+
+def export_members(conn, ledger_dir: Path) -> int:
+    """Bring members/vouches up to date. Returns the number of rows written."""
+    from memberindex import MemberIndex
+    from events import EVENTS_FILE, EVENT_ACTIVATE, EVENT_ADD, read_events
+
+    with MemberIndex.open(ledger_dir) as index:
+        ledger_hash, event_head = index.ledger_hash.hex(), index.event_head.hex()
+        old_hash, old_head = get_meta(conn, "ledger_hash"), get_meta(conn, "event_head")
+        if (old_hash, old_head) == (ledger_hash, event_head):
+            return 0
+
+        log = ledger_dir / EVENTS_FILE
+        log_size = log.stat().st_size if log.exists() else 0
+        old_count = int(get_meta(conn, "entry_count", -1))
+        old_offset = int(get_meta(conn, "event_log_offset", 0))
+
+        # The previous export must still be a prefix of the ledger and the log
+        incremental = 0 <= old_count <= len(index) and old_offset <= log_size
+        if incremental:
+            if old_count < len(index):
+                first = index.load_entry(index.at_ordinal(old_count))
+                incremental = old_count == 0 or first.get("previous_ledger_hash") == old_hash
+            else:
+                incremental = old_hash == ledger_hash
+        new_events = []
+        if incremental:
+            new_events = [event for _, event in read_events(ledger_dir, old_offset)]
+            if new_events:
+                incremental = new_events[0].get("previous_event_hash") == old_head
+            else:
+                incremental = old_head == event_head
+
+        if not incremental:
+            written = _rebuild_members(conn, index)
+        else:
+            changed = {index.at_ordinal(i).cid_hash for i in range(old_count, len(index))}
+            changed.update(event["cid_hash"] for event in new_events)
+            conn.executemany("INSERT OR REPLACE INTO members VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             (_member_row(index.find(cid)) for cid in changed))
+            written = len(changed)
+
+            # Vouchers come from the new entries, replaced as events.apply_event() would
+            vouchers = {}
+            for i in range(old_count, len(index)):
+                entry = index.load_entry(index.at_ordinal(i))
+                vouchers[entry["cid_hash"]] = entry.get("vouchers") or []
+            for event in new_events:
+                if event["type"] in (EVENT_ADD, EVENT_ACTIVATE):
+                    vouchers[event["cid_hash"]] = event["data"].get("vouchers") or []
+            for cid, voucher_cids in vouchers.items():
+                conn.execute("DELETE FROM vouches WHERE member_cid = ?", (cid,))
+                conn.executemany("INSERT OR IGNORE INTO vouches VALUES (?, ?)", ((v, cid) for v in voucher_cids))
+
+        set_meta(conn, "ledger_hash", ledger_hash)
+        set_meta(conn, "event_head", event_head)
+        set_meta(conn, "entry_count", len(index))
+        set_meta(conn, "event_log_offset", log_size)
+    return written
+
+
+# ─── Proposals & Votes ────────────────────────────────────────────────────────
+
+PROPOSAL_FIELDS = ("proposal_id", "title", "category", "status", "dry_run", "author_cid_hash",
+                   "submitted", "voting_opens", "voting_closes", "file")
+
+
+def export_proposals(conn, proposals_dir: Path, known: dict) -> int:
+    index_file = proposals_dir / "index.json"
+    if not index_file.exists() or not source_changed(conn, index_file, known):
+        return 0
+    proposals = json.loads(index_file.read_text()).get("proposals", [])
+    conn.execute("DELETE FROM proposals")
+    conn.executemany(f"INSERT INTO proposals VALUES ({', '.join('?' * len(PROPOSAL_FIELDS))})",
+                     (tuple(p.get(f) for f in PROPOSAL_FIELDS) for p in proposals))
+    return len(proposals)
+
+
+def iter_vote_files(votes_dir: Path):
+    """Yield (proposal_id, path) for every vote file under votes_dir (flat or sharded)."""
+    from votestore import iter_vote_files as iter_proposal_votes
+    for proposal in os.scandir(votes_dir):
+        if not proposal.is_dir():
+            continue
+        for path in iter_proposal_votes(Path(proposal.path)):
+            yield proposal.name, path
+
+
+def export_votes(conn, votes_dir: Path, known: dict) -> int:
+    if not votes_dir.exists():
+        return 0
+    written = 0
+    seen = set()
+    for proposal_id, path in iter_vote_files(votes_dir):
+        seen.add(str(path))
+        if not source_changed(conn, path, known):
+            continue
+        vote = json.loads(path.read_text())
+        conn.execute("INSERT OR REPLACE INTO votes VALUES (?, ?, ?, ?, ?, ?, ?)", (
+            vote.get("proposal_id", proposal_id),
+            vote["voter_cid_hash"],
+            (vote.get("vote_content") or {}).get("choice"),
+            vote.get("timestamp"),
+            (vote.get("commitment") or {}).get("vote_hash"),
+            int(vote.get("encrypted_vote") is not None),
+            str(path),
+        ))
+        written += 1
+
+    # Vote files that disappeared since the last export
+    prefix = str(votes_dir) + os.sep
+    for key in [k for k in known if k.startswith(prefix) and k not in seen]:
+        conn.execute("DELETE FROM votes WHERE file = ?", (key,))
+        conn.execute("DELETE FROM sources WHERE path = ?", (key,))
+        written += 1
+    return written
+
+
+def export_sqlite(db_path: Path, ledger_dir: Path, proposals_dir: Path = None, votes_dir: Path = None) -> dict:
+    """Update (or create) the database. Returns rows written per table group."""
+    conn = connect(db_path)
+    try:
+        with conn:
+            known = {path: (mtime, size) for path, mtime, size in conn.execute("SELECT path, mtime_ns, size FROM sources")}
+            counts = {
+                "members": export_members(conn, ledger_dir),
+                "proposals": export_proposals(conn, proposals_dir, known) if proposals_dir else 0,
+                "votes": export_votes(conn, votes_dir, known) if votes_dir else 0,
+            }
+    finally:
+        conn.close()
+    return counts
@@ -0,0 +1,204 @@
+"""
+Ledger Replication Bundles
+
+Mirrors stay in sync by exchanging delta bundles instead of copying the
+whole governance/ledger/ tree:
+
+  ledger.py export-delta --since <ledger_hash> [--since-event SEQ] -o delta.json
+  ledger.py apply-delta  --bundle delta.json
+
+Bundle (canonical JSON):
+  format, version
+  base        — ledger_hash and entry_index of the chain point the
+                receiver already has
+  entries     — full entries after base.entry_index (keys embedded)
+  events      — mutation log events after base.event_seq
+  head        — ledger_hash, entry_index and event head after applying
+  bundle_hash — SHA-256 of the canonical bundle without this field
+
+The receiver checks continuity from its own chain point: its entries
+are streamed through SHA-256 once (hashlib cannot resume a saved digest)
+and must reproduce its ledger_hash.txt, and every new entry and event is
+hash-checked and linked from there. The local prefix gets no per-entry
+checks. Events the receiver already has (an exporter that does not know
+the mirror's event head sends a little extra) are skipped after their
+hashes are matched. Version 1 bundles also carried a SHA-256 midstate in
+base; it is ignored.
+
+Axiom Alignment:
+  III - Replicas are cheap, so there can be many of them
+  V   - A bundle cannot splice into a chain it does not continue
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from ledger import canonical_json, chain_hasher, compute_entry_hash
+from events import (EVENTS_FILE, EVENT_ADD, EVENT_TYPES, GENESIS_EVENT_HASH, SNAPSHOT_INTERVAL,
+                    apply_event, compute_event_hash, last_event, load_latest_snapshot,
+                    read_events, write_snapshot)
+
+
+BUNDLE_FORMAT = "covenant-ledger-delta"
+BUNDLE_VERSION = 2
+READABLE_VERSIONS = (1, 2)
+
+
+def read_bundle(path: Path) -> dict:
+    data = Path(path).read_bytes()
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+    return json.loads(data)
+
+
+def write_bundle(path: Path, bundle: dict):
+    data = canonical_json(bundle)
+    Path(path).write_bytes(gzip.compress(data) if str(path).endswith(".gz") else data)
+
+
+def bundle_hash(bundle: dict) -> str:
+    return hashlib.sha256(canonical_json({k: v for k, v in bundle.items() if k != "bundle_hash"})).hexdigest()
+
+
+def default_event_base(ledger_dir: Path, entries: list, index: int) -> int:
+    """Seq of the add event for entries[index - 1] (0 if it predates the log).
+
+    Mirrors that pass --since-event get exactly the events they lack; without
+    it, everything after the base entry was added is sent.
+    """
+    if index == 0:
+        return 0
+    target = entries[index - 1]["entry_hash"]
+    for _, event in read_events(ledger_dir):
+        if event["type"] == EVENT_ADD and event["data"].get("entry_hash") == target:
+            return event["seq"] - 1
+    return 0
+
+
+def build_delta(ledger_dir: Path, entries: list, index: int, ledger_hash: str, head_hash: str,
+                since_event: int) -> dict:
+    """Bundle of entries[index:] and events after seq `since_event`."""
+    events = [event for _, event in read_events(ledger_dir) if event["seq"] > since_event]
+    head_event = last_event(ledger_dir)
+    bundle = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "base": {
+            "ledger_hash": ledger_hash,
+            "entry_index": index,
+            "event_seq": since_event,
+        },
+        "entries": entries[index:],
+        "events": events,
+        "head": {
+            "ledger_hash": head_hash,
+            "entry_index": len(entries),
+            "event_seq": head_event["seq"] if head_event else 0,
+            "event_hash": head_event["event_hash"] if head_event else None,
+        },
+    }
+    bundle["bundle_hash"] = bundle_hash(bundle)
+    return bundle
+
+
+def check_delta(bundle: dict, local_hash: str, local_entries: list, local_head: dict) -> tuple:
+    """Validate a bundle against the receiver's chain point.
+
+    local_entries are the receiver's entries with keys resolved.
+    Returns (errors, new_events, new_ledger_hash); nothing is written.
+    """
+    if bundle.get("format") != BUNDLE_FORMAT or bundle.get("version") not in READABLE_VERSIONS:
+        return [f"Not a ledger delta bundle (format {bundle.get('format')!r} v{bundle.get('version')})"], [], None
+    if bundle.get("bundle_hash") != bundle_hash(bundle):
+        return ["Bundle hash mismatch — bundle is corrupt or was altered"], [], None
+
+    base, head = bundle["base"], bundle["head"]
+    local_count = len(local_entries)
+    if base["ledger_hash"] != local_hash or base["entry_index"] != local_count:
+        return [f"Bundle starts at {base['ledger_hash'][:16]}... (#{base['entry_index']}), "
+                f"local ledger is at {local_hash[:16]}... (#{local_count})"], [], None
+
+    errors = []
+    hasher = chain_hasher(local_entries)
+    closed = hasher.copy()
+    closed.update(b"]")
+    if closed.hexdigest() != local_hash:
+        return ["Local entries do not hash to ledger_hash.txt — run `ledger.py verify`"], [], None
+
+    # Entries: same checks as verify, continuing the local chain
+    cids = {e["cid_hash"] for e in local_entries}
+    for i, entry in enumerate(bundle["entries"], local_count):
+        if entry.get("entry_hash") != compute_entry_hash(entry):
+            errors.append(f"Entry #{i+1} ({entry['cid_hash'][:16]}...): hash mismatch")
+        if i > 0 and entry.get("previous_ledger_hash") != closed.hexdigest():
+            errors.append(f"Entry #{i+1}: chain link broken (previous_ledger_hash mismatch)")
+        if entry["cid_hash"] in cids:
+            errors.append(f"Entry #{i+1}: CID already registered: {entry['cid_hash'][:16]}...")
+        cids.add(entry["cid_hash"])
+        hasher.update((b"," if i else b"") + canonical_json(entry))
+        closed = hasher.copy()
+        closed.update(b"]")
+    new_hash = closed.hexdigest()
+    if new_hash != head["ledger_hash"] or local_count + len(bundle["entries"]) != head["entry_index"]:
+        errors.append("Bundle head does not match its entries")
+
+    # Events: skip what the receiver has (matching hashes), link the rest
+    head_seq = local_head["seq"] if local_head else 0
+    prev_hash = local_head["event_hash"] if local_head else None
+    entry_hashes = {e["cid_hash"]: e["entry_hash"] for e in bundle["entries"]}
+    new_events = []
+    expected_seq = bundle["base"]["event_seq"] + 1
+    if expected_seq > head_seq + 1:
+        errors.append(f"Bundle events start at #{expected_seq}, local log ends at #{head_seq}")
+    for event in bundle["events"]:
+        seq = event.get("seq")
+        if seq != expected_seq:
+            errors.append(f"Event #{expected_seq}: sequence gap (found seq {seq})")
+            break
+        expected_seq += 1
+        if event.get("event_hash") != compute_event_hash(event):
+            errors.append(f"Event #{seq}: hash mismatch")
+        if seq < head_seq:
+            continue
+        if seq == head_seq:
+            if event.get("event_hash") != prev_hash:
+                errors.append(f"Event #{seq}: bundle diverges from the local log")
+            continue
+        if event.get("previous_event_hash") != (prev_hash or GENESIS_EVENT_HASH):
+            errors.append(f"Event #{seq}: chain link broken (previous_event_hash mismatch)")
+        if event.get("type") not in EVENT_TYPES:
+            errors.append(f"Event #{seq}: unknown type {event.get('type')!r}")
+        elif event.get("cid_hash") not in cids:
+            errors.append(f"Event #{seq}: CID not in ledger: {str(event.get('cid_hash'))[:16]}...")
+        elif event["type"] == EVENT_ADD and event["data"].get("entry_hash") != entry_hashes.get(event["cid_hash"]):
+            errors.append(f"Event #{seq}: add event does not match entry {event['cid_hash'][:16]}...")
+        prev_hash = event.get("event_hash")
+        new_events.append(event)
+    if prev_hash != head["event_hash"] or max(head_seq, expected_seq - 1) != head["event_seq"]:
+        errors.append("Bundle event head does not match its events")
+    return errors, new_events, new_hash
+
+
+def append_events(ledger_dir: Path, entries: list, new_events: list):
+    """Append already-verified events, writing snapshots as append_event() would."""
+    if not new_events:
+        return
+    if not any(event["seq"] % SNAPSHOT_INTERVAL == 0 for event in new_events):
+        with open(ledger_dir / EVENTS_FILE, "ab") as f:
+            f.write(b"".join(canonical_json(event) + b"\n" for event in new_events))
+        return
+    snapshot = load_latest_snapshot(ledger_dir)
+    members = {cid: dict(state) for cid, state in snapshot["members"].items()} if snapshot else {}
+    entries_by_cid = {e["cid_hash"]: e for e in entries}
+    for _, event in read_events(ledger_dir, snapshot["log_offset"] if snapshot else 0):
+        apply_event(members, event, entries_by_cid)
+
+    with open(ledger_dir / EVENTS_FILE, "ab") as f:
+        for event in new_events:
+            f.write(canonical_json(event) + b"\n")
+            apply_event(members, event, entries_by_cid)
+            if event["seq"] % SNAPSHOT_INTERVAL == 0:
+                f.flush()
+                write_snapshot(ledger_dir, {cid: dict(state) for cid, state in members.items()}, event)
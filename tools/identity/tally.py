@@ -0,0 +1,403 @@
+"""
+Convention Tally
+
+`ledger.py tally` tallies every proposal a convention is voting on in
+one job, instead of one proposal at a time:
+
+  snapshot  — the ledger and event log are loaded once; each member's
+              public keys are base64-decoded once and shared by every
+              proposal they voted on, and member state as of each
+              distinct voting_opens is materialized once
+  verify    — vote files from all selected proposals are read and checked
+              as chunks on one shared thread pool (liboqs and libsodium
+              release the GIL); each chunk's signatures go through one
+              keygen.dual_verify_many batch
+  decide    — each proposal's own quorum, engagement and passage
+              thresholds (CONSTITUTIONAL_CONVENTION.md §7.2-§7.6) are
+              applied to its tally
+  write     — every governance/votes/<id>/index.json, and
+              governance/proposals/index.json once, are replaced atomically
+
+A vote counts when its voter is an eligible member (active when voting
+opened — later suspensions or withdrawals do not change the electorate —
+and, during the Founding Phase, registered at least 30 days before —
+§5.6.3), its embedded keys are the voter's ledger keys, it was cast
+inside the voting window, both signatures cover its canonical form
+(everything but `signatures`), and its commitment matches its content.
+Encrypted votes are counted as sealed until revealed. A vote file must be
+named by its voter's CID, and one vote per voter counts: if a voter has
+several valid files (e.g. flat and sharded copies left by an interrupted
+migration, see votestore.py), the earliest cast is counted and the rest
+are listed under rejected_votes.
+
+Axiom Alignment:
+  III - One load and one write per convention, not per proposal
+  IV  - Each proposal is held to the thresholds its category demands
+  V   - Every counted vote is verified against the ledger
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ledger import canonical_json, key_store_for, load_ledger, load_members, load_members_as_of
+from profiling import span
+from votestore import iter_vote_files
+
+
+PHI = (1 + 5 ** 0.5) / 2
+VOTE_CHOICES = ("approve", "reject", "abstain")
+SENIORITY_SECONDS = 30 * 86400         # §5.6.3 voting seniority (Founding Phase only)
+NEAR_TIE_MARGIN = 0.01                 # §7.6: within 1% of passage → extension
+CHUNK_SIZE = 64
+
+# §7.2 passage/quorum and §7.4 engagement, by proposal category
+DEFAULT_THRESHOLDS = {
+    "procedural":           {"passage": 0.5,            "quorum": 0.25,    "engagement_minimum": 1 / PHI ** 2},
+    "policy":               {"passage": 2 / 3,          "quorum": 0.33,    "engagement_minimum": 1 / PHI},
+    "axiom-interpretation": {"passage": 0.75,           "quorum": 0.5,     "engagement_minimum": (1 / PHI) ** 0.5},
+    "emergency-tier2":      {"passage": 2 / 3,          "quorum": 0.5,     "engagement_minimum": 1 / PHI},
+    "emergency-tier3":      {"passage": (1 / PHI) ** 0.5, "quorum": 1 / PHI, "engagement_minimum": (1 / PHI) ** 0.5},
+}
+
+CLOSED_STATUS = {
+    "passed": "closed-passed",
+    "rejected": "closed-rejected",
+    "tabled": "tabled",
+    "no-quorum": "tabled",
+}
+
+
+def commitment_hash(nonce: str, vote_content: dict) -> str:
+    """vote_hash = SHA-256(nonce hex || canonical vote_content)."""
+    return hashlib.sha256(nonce.encode("ascii") + canonical_json(vote_content)).hexdigest()
+
+
+def thresholds_for(proposal: dict) -> dict:
+    """The proposal's own thresholds, falling back to its category's defaults."""
+    category = str(proposal.get("category", "procedural")).replace("_", "-")
+    thresholds = dict(DEFAULT_THRESHOLDS.get(category, DEFAULT_THRESHOLDS["procedural"]))
+    thresholds.update({k: v for k, v in (proposal.get("thresholds") or {}).items() if k in thresholds})
+    return thresholds
+
+
+# ─── Membership Snapshot ─────────────────────────────────────────────────────
+
+class MembershipSnapshot:
+    """Members and their decoded public keys, loaded once per tally job."""
+
+    def __init__(self, ledger_dir: Path):
+        self.ledger_dir = Path(ledger_dir)
+        with span("tally.snapshot"):
+            self.ledger = load_ledger(self.ledger_dir)
+            self.members = {m["cid_hash"]: m for m in load_members(self.ledger_dir, self.ledger)}
+        self.store = key_store_for(self.ledger_dir, self.ledger)
+        self._decoded = {}
+        self._eligible = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, vote: dict) -> dict:
+        return self.store.resolve(vote) if self.store else vote
+
+    def eligible(self, voting_opens=None, registered_before=None) -> frozenset:
+        """CIDs of members active when voting opened and registered before the cutoff.
+
+        voting_opens None: current status; registered_before None: no seniority rule.
+        """
+        key = (voting_opens, registered_before)
+        if key not in self._eligible:
+            if voting_opens is None:
+                members = self.members.values()
+            else:
+                with span("tally.as_of"):
+                    members = load_members_as_of(self.ledger_dir, self.ledger, str(voting_opens))[0]
+            self._eligible[key] = frozenset(
+                m["cid_hash"] for m in members
+                if m.get("status") == "active" and (registered_before is None or m["registered"] <= registered_before)
+            )
+        return self._eligible[key]
+
+    def decoded_keys(self, cid: str) -> tuple:
+        """(ML-DSA-65, Ed25519) raw public keys for a member, decoded once."""
+        keys = self._decoded.get(cid)
+        if keys is None:
+            public_keys = self.members[cid]["public_keys"]
+            keys = (base64.b64decode(public_keys["ml_dsa_65"]), base64.b64decode(public_keys["ed25519"]))
+            with self._lock:
+                self._decoded[cid] = keys
+        return keys
+
+
+# ─── Vote Verification ───────────────────────────────────────────────────────
+
+def inspect_vote(path: Path, proposal: dict, eligible: frozenset, snapshot: MembershipSnapshot,
+                 proposal_dir: Path = None) -> tuple:
+    """Read and check one vote file, short of its signatures.
+
+    Returns (record, job): the record with choice (or sealed) and reasons,
+    and the keygen.dual_verify_many job for its signatures (None if the
+    vote was already rejected).
+    """
+    name = path.relative_to(proposal_dir).as_posix() if proposal_dir else path.name
+    record = {"file": name, "cid": None, "choice": None, "sealed": False,
+              "vote_hash": None, "timestamp": None, "reasons": []}
+    reasons = record["reasons"]
+    try:
+        vote = snapshot.resolve(json.loads(path.read_bytes()))
+    except (OSError, ValueError, KeyError) as e:
+        reasons.append(f"Unreadable vote: {e}")
+        return record, None
+    if not isinstance(vote, dict):
+        reasons.append("Not a vote object")
+        return record, None
+
+    cid = record["cid"] = vote.get("voter_cid_hash")
+    record["timestamp"] = vote.get("timestamp")
+    commitment = vote.get("commitment") or {}
+    record["vote_hash"] = commitment.get("vote_hash")
+
+    if cid != path.stem:
+        reasons.append(f"Vote file is not named by its voter CID ({str(cid)[:16]}...)")
+    if vote.get("proposal_id") != proposal["proposal_id"]:
+        reasons.append(f"Vote is for {vote.get('proposal_id')!r}")
+    if cid not in snapshot.members:
+        reasons.append("Voter is not in the ledger")
+        return record, None
+    if cid not in eligible:
+        reasons.append("Voter is not eligible (not active when voting opened, or below voting seniority)")
+    if vote.get("public_keys") != snapshot.members[cid].get("public_keys"):
+        reasons.append("Vote keys do not match the voter's ledger keys")
+        return record, None
+    opens, closes = proposal.get("voting_opens"), proposal.get("voting_closes")
+    if not isinstance(record["timestamp"], int) or (opens and record["timestamp"] < opens) or \
+            (closes and record["timestamp"] > closes):
+        reasons.append("Cast outside the voting window")
+
+    content = vote.get("vote_content")
+    if content is None and vote.get("encrypted_vote") is not None:
+        record["sealed"] = True
+        if "nonce" in commitment:
+            # The choice is recoverable by hashing each candidate content (see ballots.py)
+            reasons.append("Sealed ballot publishes its commitment nonce")
+    elif not isinstance(content, dict) or content.get("choice") not in VOTE_CHOICES:
+        reasons.append(f"Unknown choice: {(content or {}).get('choice')!r}")
+    else:
+        record["choice"] = content["choice"]
+        nonce = commitment.get("nonce")
+        if record["vote_hash"] and nonce and commitment_hash(nonce, content) != record["vote_hash"]:
+            reasons.append("Commitment does not match the vote content")
+
+    if reasons:
+        return record, None
+    signatures = vote.get("signatures") or {}
+    message = canonical_json({k: v for k, v in vote.items() if k != "signatures"})
+    return record, (message, {"ml_dsa_65": signatures.get("voter_ml_dsa_65") or "",
+                              "ed25519": signatures.get("voter_ed25519") or ""}, snapshot.decoded_keys(cid))
+
+
+def check_votes(paths: list, proposal: dict, eligible: frozenset, snapshot: MembershipSnapshot,
+                proposal_dir: Path = None, max_workers: int = 1) -> list:
+    """Read and verify vote files, signatures in one dual_verify_many batch. Returns one record per path."""
+    from keygen import dual_verify_many
+    inspected = [inspect_vote(path, proposal, eligible, snapshot, proposal_dir) for path in paths]
+    pending = [(record, job) for record, job in inspected if job is not None]
+    for (record, _), results in zip(pending, dual_verify_many([job for _, job in pending], max_workers)):
+        if not results["ed25519"]:
+            record["reasons"].append("Ed25519 signature invalid")
+        if not results["ml_dsa_65"]:
+            record["reasons"].append("ML-DSA-65 signature invalid")
+    return [record for record, _ in inspected]
+
+
+def one_vote_per_voter(records: list):
+    """Keep the earliest valid vote per CID; reject the others in place."""
+    counted = {}
+    for record in sorted((r for r in records if not r["reasons"]), key=lambda r: (r["timestamp"], r["file"])):
+        first = counted.setdefault(record["cid"], record)
+        if first is not record:
+            record["reasons"].append(f"Duplicate vote: {first['file']} is counted for this voter")
+
+
+# ─── Decision ────────────────────────────────────────────────────────────────
+
+def decide(tally: dict, eligible_voters: int, thresholds: dict) -> dict:
+    """Apply quorum (§7.2), engagement (§7.4) and near-tie (§7.6) rules to a tally."""
+    approve, reject, abstain = tally["approve"], tally["reject"], tally["abstain"]
+    cast = approve + reject + abstain
+    decisive = approve + reject
+    quorum_ratio = cast / eligible_voters if eligible_voters else 0.0
+    engagement_ratio = decisive / cast if cast else 0.0
+    passage_ratio = approve / decisive if decisive else 0.0
+
+    quorum_met = cast > 0 and quorum_ratio >= thresholds["quorum"]
+    engagement_met = cast > 0 and engagement_ratio >= thresholds["engagement_minimum"]
+    passage_met = decisive > 0 and passage_ratio >= thresholds["passage"]
+
+    if not quorum_met:
+        result = "no-quorum"
+    elif not engagement_met:
+        result = "tabled"
+    elif abs(passage_ratio - thresholds["passage"]) <= NEAR_TIE_MARGIN:
+        result = "extended"
+    else:
+        result = "passed" if passage_met else "rejected"
+
+    return {
+        "result": result,
+        "quorum_met": quorum_met,
+        "quorum_ratio": round(quorum_ratio, 4),
+        "quorum_required": round(thresholds["quorum"], 4),
+        "engagement_met": engagement_met,
+        "engagement_ratio": round(engagement_ratio, 4),
+        "engagement_required": round(thresholds["engagement_minimum"], 4),
+        "passage_met": passage_met,
+        "passage_ratio": round(passage_ratio, 4),
+        "passage_required": round(thresholds["passage"], 4),
+    }
+
+
+# ─── Convention Job ──────────────────────────────────────────────────────────
+
+def select_proposals(registry: dict, proposal_ids=None, convention=None) -> list:
+    """Registry entries to tally: explicit ids, a convention's voting proposals, or all voting ones."""
+    proposals = registry.get("proposals", [])
+    if proposal_ids:
+        wanted = set(proposal_ids)
+        return [p for p in proposals if p["proposal_id"] in wanted]
+    return [p for p in proposals if p.get("status") == "voting"
+            and (convention is None or p.get("convention_target") == convention)]
+
+
+def _write_json(path: Path, data: dict):
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(data, indent=2) + "\n")
+    tmp.replace(path)
+
+
+def proposal_job(entry: dict, proposals_dir: Path, votes_dir: Path, snapshot: MembershipSnapshot,
+                 seniority_seconds: int) -> dict:
+    """Everything needed to check one registry entry's votes: proposal, electorate and vote files."""
+    proposal_file = proposals_dir / entry.get("file", f"{entry['proposal_id']}.json")
+    proposal = {**entry, **(json.loads(proposal_file.read_text()) if proposal_file.exists() else {})}
+    # Dry runs exercise the pipeline with whoever is registered now
+    opens = None if proposal.get("dry_run") else proposal.get("voting_opens")
+    cutoff = opens - seniority_seconds if opens and seniority_seconds else None
+    proposal_votes = votes_dir / proposal["proposal_id"]
+    files = sorted(iter_vote_files(proposal_votes), key=lambda p: p.name)
+    return {"entry": entry, "proposal": proposal, "proposal_file": proposal_file,
+            "eligible": snapshot.eligible(opens or None, cutoff), "files": files, "dir": proposal_votes}
+
+
+def verify_jobs(jobs: list, snapshot: MembershipSnapshot, workers: int = None) -> dict:
+    """Check every job's votes on one pool. Returns {id(job): records}, one vote per voter applied."""
+    # One pool for every proposal's votes, in chunks that interleave proposals
+    chunks = [(job, job["files"][i:i + CHUNK_SIZE]) for job in jobs for i in range(0, len(job["files"]), CHUNK_SIZE)]
+
+    def verify_chunk(item):
+        job, files = item
+        return job, check_votes(files, job["proposal"], job["eligible"], snapshot, job["dir"])
+
+    records = {id(job): [] for job in jobs}
+    with span("tally.verify"), ThreadPoolExecutor(max_workers=workers or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        for job, checked in pool.map(verify_chunk, chunks):
+            records[id(job)].extend(checked)
+    for job in jobs:
+        one_vote_per_voter(records[id(job)])
+    return records
+
+
+def default_seniority(registry: dict) -> int:
+    """§5.6.3 voting seniority for the registry's phase."""
+    return SENIORITY_SECONDS if registry.get("phase") == "founding" else 0
+
+
+def check_proposal_votes(ledger_dir: Path, proposals_dir: Path, votes_dir: Path, proposal_id: str,
+                         seniority_seconds: int = None, workers: int = None) -> tuple:
+    """One proposal's votes, checked exactly as tally_convention checks them.
+
+    Returns (job, records), or (None, []) if the proposal is not in the registry.
+    """
+    registry = json.loads((proposals_dir / "index.json").read_text())
+    entry = next((p for p in registry.get("proposals", []) if p["proposal_id"] == proposal_id), None)
+    if entry is None:
+        return None, []
+    if seniority_seconds is None:
+        seniority_seconds = default_seniority(registry)
+    snapshot = MembershipSnapshot(ledger_dir)
+    job = proposal_job(entry, proposals_dir, votes_dir, snapshot, seniority_seconds)
+    return job, verify_jobs([job], snapshot, workers)[id(job)]
+
+
+def tally_convention(ledger_dir: Path, proposals_dir: Path, votes_dir: Path, proposal_ids=None,
+                     convention=None, close: bool = False, seniority_seconds: int = None,
+                     workers: int = None, dry_run: bool = False, now: int = None) -> list:
+    """Tally the selected proposals together. Returns one summary dict per proposal."""
+    now = int(time.time()) if now is None else now
+    registry_file = proposals_dir / "index.json"
+    registry = json.loads(registry_file.read_text())
+    selected = select_proposals(registry, proposal_ids, convention)
+    if not selected:
+        return []
+    if seniority_seconds is None:
+        seniority_seconds = default_seniority(registry)
+
+    snapshot = MembershipSnapshot(ledger_dir)
+    jobs = [proposal_job(entry, proposals_dir, votes_dir, snapshot, seniority_seconds) for entry in selected]
+    records = verify_jobs(jobs, snapshot, workers)
+
+    summaries = []
+    with span("tally.write"):
+        for job in jobs:
+            proposal, entry = job["proposal"], job["entry"]
+            counted = [r for r in records[id(job)] if not r["reasons"]]
+            rejected = [r for r in records[id(job)] if r["reasons"]]
+            tally = {choice: sum(1 for r in counted if r["choice"] == choice) for choice in VOTE_CHOICES}
+            tally["total_cast"] = sum(tally.values())
+            decision = decide(tally, len(job["eligible"]), thresholds_for(proposal))
+            result = decision["result"] + ("-dry-run" if proposal.get("dry_run") else "")
+            closing = close and decision["result"] in CLOSED_STATUS and now >= proposal.get("voting_closes", 0)
+
+            index_file = votes_dir / proposal["proposal_id"] / "index.json"
+            index = json.loads(index_file.read_text()) if index_file.exists() else {"proposal_id": proposal["proposal_id"]}
+            index.update({"last_updated": now, "tally": tally, "eligible_voters": len(job["eligible"]),
+                          **decision, "result": result})
+            index.setdefault("votes_revealed", False)
+            index["vote_hashes"] = [
+                {"cid_prefix": r["cid"][:8], "vote_hash": r["vote_hash"], "timestamp": r["timestamp"]}
+                for r in sorted(counted, key=lambda r: (r["timestamp"], r["cid"]))
+            ]
+            sealed = sum(1 for r in counted if r["sealed"])
+            for key, value in (("sealed_votes", sealed),
+                               ("rejected_votes", [{"file": r["file"], "reasons": r["reasons"]} for r in rejected])):
+                if value:
+                    index[key] = value
+                else:
+                    index.pop(key, None)
+
+            entry["votes"] = {choice: tally[choice] for choice in VOTE_CHOICES}
+            entry["result"] = result
+            if closing:
+                entry["status"] = CLOSED_STATUS[decision["result"]]
+                entry["closed"] = index["closed"] = now
+            if not dry_run:
+                index_file.parent.mkdir(parents=True, exist_ok=True)
+                _write_json(index_file, index)
+                if closing and job["proposal_file"].exists():
+                    proposal_data = json.loads(job["proposal_file"].read_text())
+                    proposal_data.update({"status": entry["status"], "closed": now})
+                    _write_json(job["proposal_file"], proposal_data)
+
+            summaries.append({"proposal_id": proposal["proposal_id"], "category": proposal.get("category"),
+                              "tally": tally, "eligible_voters": len(job["eligible"]), "sealed": sealed,
+                              "rejected": len(rejected), "result": result, "status": entry.get("status"),
+                              **{k: v for k, v in decision.items() if k != "result"}})
+
+        registry["last_updated"] = now
+        if not dry_run:
+            _write_json(registry_file, registry)
+    return summaries
@@ -24,11 +24,14 @@ Axiom Alignment:
   V - Adversarial Resilience: test what we ship
 """
 
+import atexit
 import json
+import struct
 import subprocess
 import sys
 import hashlib
 import tempfile
+import threading
 import os
 
 
@@ -63,20 +66,136 @@ function canonicalJSON(obj) {
 """
 
 
+# Long-lived worker: one Node.js process serves every case over a framed
+# stdin/stdout protocol instead of paying process startup per object.
+#   request:  uint32 BE length + UTF-8 JSON [mode, obj]   (mode: "canonical" | "broken")
+#   response: uint8 status (0 ok, 1 error) + uint32 BE length + payload bytes
+JS_WORKER_SCRIPT = JS_CANONICAL_FUNCTION + """
+function brokenJSON(obj) {
+    var sortedKeys = Object.keys(obj).sort();
+    return JSON.stringify(obj, sortedKeys);
+}
+var pending = Buffer.alloc(0);
+process.stdin.on('data', function(chunk) {
+    pending = pending.length ? Buffer.concat([pending, chunk]) : chunk;
+    var offset = 0;
+    var out = [];
+    while (pending.length - offset >= 4) {
+        var len = pending.readUInt32BE(offset);
+        if (pending.length - offset - 4 < len) break;
+        var req = JSON.parse(pending.toString('utf8', offset + 4, offset + 4 + len));
+        offset += 4 + len;
+        var status = 0, body;
+        try {
+            body = Buffer.from(req[0] === 'broken' ? brokenJSON(req[1]) : canonicalJSON(req[1]), 'utf8');
+        } catch (e) {
+            status = 1;
+            body = Buffer.from(String(e), 'utf8');
+        }
+        var header = Buffer.alloc(5);
+        header.writeUInt8(status, 0);
+        header.writeUInt32BE(body.length, 1);
+        out.push(header, body);
+    }
+    pending = pending.subarray(offset);
+    if (out.length) process.stdout.write(Buffer.concat(out));
+});
+process.stdin.on('end', function() { process.exit(0); });
+"""
+
+
+class NodeCanonicalWorker:
+    """A single persistent Node.js process running the browser canonicalJSON()."""
+
+    def __init__(self):
+        self.proc = subprocess.Popen(
+            ["node", "-e", JS_WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    @staticmethod
+    def _frame(mode: str, obj) -> bytes:
+        payload = json.dumps([mode, obj]).encode("utf-8")
+        return struct.pack(">I", len(payload)) + payload
+
+    def _read_frame(self) -> tuple:
+        """Read one (status, body) reply; a dead or truncated worker is killed."""
+        header = self.proc.stdout.read(5)
+        if len(header) < 5:
+            self.kill()
+            raise RuntimeError("Node.js worker exited (see its stderr above)")
+        status, length = struct.unpack(">BI", header)
+        body = self.proc.stdout.read(length)
+        if len(body) < length:
+            self.kill()
+            raise RuntimeError("Node.js worker exited mid-reply")
+        return status, body
+
+    def _read_response(self) -> bytes:
+        status, body = self._read_frame()
+        if status != 0:
+            raise RuntimeError(f"Node.js error: {body.decode()}")
+        return body
+
+    def request(self, mode: str, obj) -> bytes:
+        """Serialize one object in the worker and return the raw bytes."""
+        self.proc.stdin.write(self._frame(mode, obj))
+        self.proc.stdin.flush()
+        return self._read_response()
+
+    def request_many(self, mode: str, objs: list) -> list:
+        """Pipeline a batch of objects through the worker, preserving order.
+
+        Frames are written from a helper thread so a large batch cannot
+        deadlock against a full stdout pipe. Every reply is read before an
+        error is raised, so the next request starts in step.
+        """
+        def feed():
+            for obj in objs:
+                self.proc.stdin.write(self._frame(mode, obj))
+            self.proc.stdin.flush()
+
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        replies = [self._read_frame() for _ in objs]
+        writer.join()
+        for status, body in replies:
+            if status != 0:
+                raise RuntimeError(f"Node.js error: {body.decode()}")
+        return [body for _, body in replies]
+
+    def kill(self):
+        if self.proc.poll() is None:
+            self.proc.kill()
+            self.proc.wait()
+
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+
+
+_worker = None
+
+
+def node_worker() -> NodeCanonicalWorker:
+    """Return the shared worker, starting it on first use."""
+    global _worker
+    if _worker is None or _worker.proc.poll() is not None:
+        _worker = NodeCanonicalWorker()
+        atexit.register(_worker.close)
+    return _worker
+
+
 def js_canonical(obj: dict) -> bytes:
     """Run the browser's canonicalJSON() via Node.js and return the bytes."""
-    script = JS_CANONICAL_FUNCTION + f"""
-var obj = {json.dumps(obj)};
-process.stdout.write(canonicalJSON(obj));
-"""
-    result = subprocess.run(
-        ["node", "-e", script],
-        capture_output=True,
-        text=False,  # Get raw bytes
-    )
-    if result.returncode != 0:
-        raise RuntimeError(f"Node.js error: {result.stderr.decode()}")
-    return result.stdout
+    return node_worker().request("canonical", obj)
+
+
+def js_canonical_many(objs: list) -> list:
+    """Batch form of js_canonical() — one round trip per object, no process spawns."""
+    return node_worker().request_many("canonical", objs)
 
 
 # ─── Test Cases ───────────────────────────────────────────────────────────────
@@ -184,15 +303,7 @@ TEST_CASES = [
 
 def old_js_broken(obj: dict) -> bytes:
     """The OLD broken browser serialization using JSON.stringify replacer array."""
-    script = f"""
-var obj = {json.dumps(obj)};
-var sortedKeys = Object.keys(obj).sort();
-process.stdout.write(JSON.stringify(obj, sortedKeys));
-"""
-    result = subprocess.run(["node", "-e", script], capture_output=True, text=False)
-    if result.returncode != 0:
-        raise RuntimeError(f"Node.js error: {result.stderr.decode()}")
-    return result.stdout
+    return node_worker().request("broken", obj)
 
 
 # ─── Run Tests ────────────────────────────────────────────────────────────────
@@ -216,9 +327,10 @@ def run_tests(verbose=False):
     passed = 0
     failed = 0
     
-    for name, obj in TEST_CASES:
+    js_results = js_canonical_many([obj for _, obj in TEST_CASES])
+    
+    for (name, obj), js_bytes in zip(TEST_CASES, js_results):
         py_bytes = python_canonical(obj)
-        js_bytes = js_canonical(obj)
         
         match = py_bytes == js_bytes
         
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Single vs Bulk Signature Verification Test
+
+keygen.dual_verify() checks one registration; dual_verify_many() checks
+inbox batches, issue exports and votes. Both must reach the same verdict
+on every signature, or a request could pass one path and fail the other.
+
+Tests cover:
+  1. Valid signatures pass both paths
+  2. A corrupted ML-DSA-65 or Ed25519 signature fails both paths
+  3. Undecodable signatures and keys fail both paths without raising
+  4. The same verdicts in the calling thread and on a thread pool
+
+Usage:
+  python test_dual_verify.py
+
+Axiom Alignment:
+  V - Adversarial Resilience: one verdict per signature, whichever path
+"""
+
+import base64
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from keygen import BATCH_MIN_CHUNK, dual_sign, dual_verify, dual_verify_many, generate_keypair
+
+
+def flip_byte(b64: str, position: int = 10) -> str:
+    raw = bytearray(base64.b64decode(b64))
+    raw[position] ^= 0x01
+    return base64.b64encode(bytes(raw)).decode("ascii")
+
+
+def cases() -> list:
+    """(label, message, signatures, public_keys, expected ml_dsa_65, expected ed25519)."""
+    keypair = generate_keypair()
+    other = generate_keypair()
+    message = b'{"statement":"I voluntarily request membership"}'
+    sigs = dual_sign(message, keypair["secret_keys"])
+    keys = keypair["public_keys"]
+    return [
+        ("valid", message, sigs, keys, True, True),
+        ("corrupted ML-DSA-65 signature", message, {**sigs, "ml_dsa_65": flip_byte(sigs["ml_dsa_65"])},
+         keys, False, True),
+        ("corrupted Ed25519 signature", message, {**sigs, "ed25519": flip_byte(sigs["ed25519"])}, keys, True, False),
+        ("altered message", message + b" ", sigs, keys, False, False),
+        ("another member's keys", message, sigs, other["public_keys"], False, False),
+        ("signatures not base64", message, {"ml_dsa_65": "not base64!", "ed25519": "%%"}, keys, False, False),
+        ("missing signatures", message, {}, keys, False, False),
+        ("truncated ML-DSA-65 key", message, sigs, {**keys, "ml_dsa_65": keys["ml_dsa_65"][:40]}, False, True),
+    ]
+
+
+# ─── Run Tests ────────────────────────────────────────────────────────────────
+
+def run_tests():
+    passed = failed = 0
+
+    def check(ok: bool, label: str, detail=""):
+        nonlocal passed, failed
+        if ok:
+            print(f"  ✅ {label}")
+            passed += 1
+        else:
+            print(f"  ❌ {label}" + (f" — {detail}" if detail else ""))
+            failed += 1
+
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Single vs Bulk Signature Verification Test")
+    print("═══════════════════════════════════════════════════════════════")
+    print()
+
+    all_cases = cases()
+    jobs = [(message, sigs, keys) for _, message, sigs, keys, _, _ in all_cases]
+    in_thread = dual_verify_many(jobs, max_workers=1)
+    # Enough copies that _run_chunked actually splits the work over a pool
+    copies = 2 * BATCH_MIN_CHUNK // len(jobs) + 1
+    pooled = dual_verify_many(jobs * copies, max_workers=4)
+
+    for i, (label, message, sigs, keys, pq_ok, ed_ok) in enumerate(all_cases):
+        single = dual_verify(message, sigs, keys)
+        verdicts = {"dual_verify": single, "dual_verify_many": in_thread[i]}
+        verdicts.update({f"pool copy {c}": pooled[c * len(jobs) + i] for c in range(copies)})
+        wrong = {path: (r["ml_dsa_65"], r["ed25519"]) for path, r in verdicts.items()
+                 if (r["ml_dsa_65"], r["ed25519"], r["both_valid"]) != (pq_ok, ed_ok, pq_ok and ed_ok)}
+        check(not wrong, f"{label}: ML-DSA-65 {'ok' if pq_ok else 'rejected'}, "
+                         f"Ed25519 {'ok' if ed_ok else 'rejected'} on every path", wrong)
+
+    print()
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Results: {passed} passed, {failed} failed, {passed + failed} total")
+    if failed == 0:
+        print("  ✅ ALL TESTS PASSED")
+    else:
+        print("  ❌ FAILURES DETECTED")
+    print("═══════════════════════════════════════════════════════════════")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_tests() else 1)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Registration Inbox Test
+
+Runs the `ledger.py watch --inbox` pipeline (inbox.py) once over a
+scratch ledger and checks where every dropped request ends up.
+
+Tests cover:
+  1. Valid requests are accepted as provisional entries, chain intact
+  2. Forged signatures and mismatched CIDs are rejected with a reason
+  3. Duplicates — of the ledger and within one batch — are rejected
+  4. Malformed files (bad JSON, non-object signatures or public keys)
+     are rejected one at a time without stopping the pipeline
+
+Usage:
+  python test_inbox.py
+
+Axiom Alignment:
+  V - Adversarial Resilience: a hostile file must not stop admissions
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+
+from inbox import ACCEPTED_DIR, REJECTED_DIR, watch_inbox
+from keygen import create_registration_request, generate_keypair, save_identity
+from ledger import compute_ledger_hash, load_ledger
+
+
+# ─── Fixtures ─────────────────────────────────────────────────────────────────
+
+def new_request(root: Path, name: str) -> dict:
+    """A freshly generated identity's signed registration request."""
+    identity_dir = root / "identities" / name
+    save_identity(generate_keypair(), identity_dir)
+    return create_registration_request(identity_dir)
+
+
+def new_ledger(root: Path) -> Path:
+    """A ledger holding only the genesis entry, built through the CLI."""
+    ledger_dir = root / "ledger"
+    genesis = root / "genesis.json"
+    genesis.write_text(json.dumps(new_request(root, "genesis")))
+    for command in (["init"], ["add", "--genesis", "--registration-file", str(genesis)]):
+        subprocess.run([sys.executable, str(HERE / "ledger.py"), *command, "--ledger-dir", str(ledger_dir)],
+                       check=True, capture_output=True)
+    return ledger_dir
+
+
+def drop(inbox: Path, name: str, content):
+    text = content if isinstance(content, str) else json.dumps(content)
+    (inbox / f"{name}.json").write_text(text)
+
+
+def outcome(inbox: Path, name: str) -> dict:
+    """The result file a processed request left behind (None if still in the inbox)."""
+    for folder in (ACCEPTED_DIR, REJECTED_DIR):
+        result = inbox / folder / f"{name}.json.result.json"
+        if result.exists():
+            return json.loads(result.read_text())
+    return None
+
+
+def run_once(ledger_dir: Path, inbox: Path) -> dict:
+    return asyncio.run(watch_inbox(ledger_dir, inbox, workers=2, batch_size=4, batch_window=0.05,
+                                   once=True, report=lambda line: None))
+
+
+# ─── Run Tests ────────────────────────────────────────────────────────────────
+
+def run_tests():
+    passed = failed = 0
+
+    def check(ok: bool, label: str, detail=""):
+        nonlocal passed, failed
+        if ok:
+            print(f"  ✅ {label}")
+            passed += 1
+        else:
+            print(f"  ❌ {label}" + (f" — {detail}" if detail else ""))
+            failed += 1
+
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Registration Inbox Test")
+    print("═══════════════════════════════════════════════════════════════")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        ledger_dir = new_ledger(root)
+        inbox = root / "inbox"
+        inbox.mkdir()
+
+        valid = [new_request(root, f"member{i}") for i in range(6)]
+        for i, request in enumerate(valid[:5]):
+            drop(inbox, f"valid{i}", request)
+
+        forged = json.loads(json.dumps(valid[5]))
+        forged["registration"]["statement"] += " (edited after signing)"
+        drop(inbox, "forged", forged)
+        mismatched = json.loads(json.dumps(valid[5]))
+        mismatched["registration"]["cid_hash"] = "0" * 64
+        drop(inbox, "mismatched_cid", mismatched)
+
+        drop(inbox, "not_json", "{\"registration\": ")
+        drop(inbox, "top_level_list", [valid[5]])
+        drop(inbox, "signatures_string", {**valid[5], "signatures": "oops"})
+        drop(inbox, "signatures_list", {**valid[5], "signatures": ["ml_dsa_65", "ed25519"]})
+        drop(inbox, "public_keys_string", {**valid[5], "registration": {**valid[5]["registration"],
+                                                                         "public_keys": "oops"}})
+        drop(inbox, "signature_not_base64", {**valid[5], "signatures": {"ml_dsa_65": 7, "ed25519": ["x"]}})
+
+        print()
+        print("  ─── Accept, reject and malformed ───")
+        try:
+            totals = run_once(ledger_dir, inbox)
+        except Exception as e:
+            check(False, "pipeline survives malformed requests", f"{type(e).__name__}: {e}")
+            totals = None
+        if totals is not None:
+            check(totals == {"accepted": 5, "rejected": 8}, "pipeline survives malformed requests", totals)
+
+        for i in range(5):
+            result = outcome(inbox, f"valid{i}") or {}
+            check(result.get("status") == "accepted", f"valid{i} accepted", result.get("reasons"))
+        for name, reason in [("forged", "signature invalid"), ("mismatched_cid", "cid_hash does not match"),
+                             ("not_json", "Unreadable JSON"), ("top_level_list", "Not a registration request"),
+                             ("signatures_string", "Malformed signatures"),
+                             ("signatures_list", "Malformed signatures"),
+                             ("public_keys_string", "Malformed public keys"),
+                             ("signature_not_base64", "signature invalid")]:
+            result = outcome(inbox, name) or {}
+            check(result.get("status") == "rejected" and any(reason in r for r in result.get("reasons", [])),
+                  f"{name} rejected ({reason})", result)
+        check(not list(inbox.glob("*.json")), "inbox drained")
+
+        ledger = load_ledger(ledger_dir)
+        entries = ledger["entries"]
+        stored_hash = (ledger_dir / "ledger_hash.txt").read_text().strip()
+        check(len(entries) == 6 and all(e["status"] == "provisional" for e in entries[1:]),
+              "accepted requests appended as provisional entries", len(entries))
+        check(stored_hash == compute_ledger_hash(entries), "stored ledger hash matches the chain")
+
+        print()
+        print("  ─── Duplicates ───")
+        drop(inbox, "again", valid[0])
+        drop(inbox, "twin_a", valid[5])
+        drop(inbox, "twin_b", valid[5])
+        totals = run_once(ledger_dir, inbox)
+        check(totals == {"accepted": 1, "rejected": 2}, "one of each duplicate pair accepted", totals)
+        result = outcome(inbox, "again") or {}
+        check(any("already registered" in r for r in result.get("reasons", [])),
+              "request already in the ledger rejected", result)
+        twins = [outcome(inbox, name) or {} for name in ("twin_a", "twin_b")]
+        check(sorted(t.get("status") for t in twins) == ["accepted", "rejected"],
+              "same request twice in one batch admitted once", twins)
+        check(len(load_ledger(ledger_dir)["entries"]) == 7, "ledger grew by exactly one entry")
+
+    print()
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Results: {passed} passed, {failed} failed, {passed + failed} total")
+    if failed == 0:
+        print("  ✅ ALL TESTS PASSED")
+    else:
+        print("  ❌ FAILURES DETECTED")
+    print("═══════════════════════════════════════════════════════════════")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_tests() else 1)
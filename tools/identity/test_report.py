@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Daily Report Delta Test
+
+Runs report.py on consecutive days over a scratch ledger and treasury
+and checks the "since last report" deltas it derives from its state file.
+
+Tests cover:
+  1. The first report has no deltas
+  2. Registrations, status changes and transactions between two reports
+     show up in the next one (and only there)
+  3. Re-running a day's report gives the same deltas
+  4. Deleting the state file resets the deltas
+
+Usage:
+  python test_report.py
+
+Axiom Alignment:
+  II - Community and treasury state published every day, correctly
+"""
+
+import hashlib
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+
+from events import EVENT_ADD, EVENT_WITHDRAW, append_event, entry_state
+from ledger import build_entry, compute_ledger_hash, load_ledger, save_ledger
+
+
+# ─── Fixtures ─────────────────────────────────────────────────────────────────
+
+def add_member(ledger_dir: Path, n: int, status: str = "active") -> str:
+    """Append a registration the way `ledger.py add` records it (signatures are not re-checked here)."""
+    ledger = load_ledger(ledger_dir)
+    cid = hashlib.sha256(f"member-{n}".encode()).hexdigest()
+    reg = {"cid_hash": cid, "public_keys": {"ml_dsa_65": f"pq-{n}", "ed25519": f"ed-{n}"}}
+    phase = "genesis" if not ledger["entries"] else "founding"
+    entry = build_entry(reg, phase, status, [], compute_ledger_hash(ledger["entries"]), 1767225600 + n)
+    ledger["entries"].append(entry)
+    save_ledger(ledger_dir, ledger)
+    append_event(ledger_dir, EVENT_ADD, cid, {"entry_hash": entry["entry_hash"], **entry_state(entry)},
+                 timestamp=entry["registered"], entries=ledger["entries"])
+    return cid
+
+
+def treasury(treasury_dir: Path, *args):
+    subprocess.run([sys.executable, str(HERE / "treasury.py"), *args, "--treasury-dir", str(treasury_dir)],
+                   check=True, capture_output=True)
+
+
+def add_donation(treasury_dir: Path, tx_id: str, date: str, amount: str):
+    treasury(treasury_dir, "add", "--tx-id", tx_id, "--date", date, "--asset", "BTC", "--amount", amount,
+             "--direction", "inflow", "--category", "donation")
+
+
+def report(root: Path, date: str) -> dict:
+    """Run report.py for `date` and return the JSON it wrote."""
+    output_dir = root / "reports"
+    subprocess.run([sys.executable, str(HERE / "report.py"), "--ledger-dir", str(root / "ledger"),
+                    "--treasury-dir", str(root / "treasury"), "--output-dir", str(output_dir), "--date", date],
+                   check=True, capture_output=True, text=True)
+    return json.loads((output_dir / f"{date}.json").read_text())
+
+
+# ─── Run Tests ────────────────────────────────────────────────────────────────
+
+def run_tests():
+    passed = failed = 0
+
+    def check(ok: bool, label: str, detail=""):
+        nonlocal passed, failed
+        if ok:
+            print(f"  ✅ {label}")
+            passed += 1
+        else:
+            print(f"  ❌ {label}" + (f" — {detail}" if detail else ""))
+            failed += 1
+
+    def run(root, date):
+        try:
+            return report(root, date)
+        except subprocess.CalledProcessError as e:
+            check(False, f"report for {date} runs", (e.stderr or "").strip().splitlines()[-1:])
+            return None
+
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Daily Report Delta Test")
+    print("═══════════════════════════════════════════════════════════════")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        ledger_dir, treasury_dir = root / "ledger", root / "treasury"
+        cids = [add_member(ledger_dir, n) for n in range(3)]
+        treasury(treasury_dir, "init")
+        add_donation(treasury_dir, "tx-1", "2026-01-02T12:00:00Z", "1.5")
+
+        print()
+        print("  ─── First report ───")
+        day1 = run(root, "2026-01-10")
+        if day1:
+            community = day1["community"]
+            check(community["total"] == 3 and community["active"] == 3, "member counts", community)
+            check(community["new_members"] == [] and community["status_changes"] == {},
+                  "no membership deltas on the first run", community)
+            check(day1["treasury"]["new_transactions"] == 0, "no treasury delta on the first run", day1["treasury"])
+
+        new_cids = [add_member(ledger_dir, n, "provisional") for n in (3, 4)]
+        append_event(ledger_dir, EVENT_WITHDRAW, cids[1], {}, entries=load_ledger(ledger_dir)["entries"])
+        add_donation(treasury_dir, "tx-2", "2026-01-11T12:00:00Z", "0.25")
+
+        print()
+        print("  ─── Registration, withdrawal and donation in between ───")
+        day2 = run(root, "2026-01-11")
+        if day2:
+            community = day2["community"]
+            check(community["new_members"] == [cid[:16] for cid in new_cids],
+                  "new registrations listed by CID prefix", community["new_members"])
+            check(community["status_changes"] == {"withdraw": 1}, "withdrawal counted", community["status_changes"])
+            check(community["total"] == 5 and community["by_status"] == {"active": 2, "provisional": 2,
+                                                                         "withdrawn": 1},
+                  "member counts after the changes", community["by_status"])
+            check(day2["previous_report"] == "2026-01-10", "measured against the previous day's report")
+            check(day2["treasury"]["new_transactions"] == 1 and day2["treasury"]["assets"]["BTC"]["balance"] == "1.75",
+                  "treasury delta and balance", day2["treasury"])
+
+        rerun = run(root, "2026-01-11")
+        if day2 and rerun:
+            check(rerun["community"] == day2["community"] and rerun["treasury"] == day2["treasury"],
+                  "re-running the same day gives the same deltas")
+
+        day3 = run(root, "2026-01-12")
+        if day3:
+            check(day3["community"]["new_members"] == [] and day3["community"]["status_changes"] == {}
+                  and day3["treasury"]["new_transactions"] == 0, "quiet day reports no deltas", day3["community"])
+
+        (root / "reports" / ".report-state.json").unlink()
+        add_member(ledger_dir, 5)
+        reset = run(root, "2026-01-13")
+        if reset:
+            check(reset["community"]["new_members"] == [] and reset["community"]["total"] == 6,
+                  "deleted state file resets the deltas", reset["community"])
+
+    print()
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Results: {passed} passed, {failed} failed, {passed + failed} total")
+    if failed == 0:
+        print("  ✅ ALL TESTS PASSED")
+    else:
+        print("  ❌ FAILURES DETECTED")
+    print("═══════════════════════════════════════════════════════════════")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_tests() else 1)
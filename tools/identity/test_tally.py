@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Convention Tally Test
+
+Checks tally.decide() against the §7.2-§7.6 rules directly, then runs
+tally.tally_convention() over a scratch ledger, registry and signed vote
+files for three proposals tallied in one job.
+
+Tests cover:
+  1. Quorum, engagement, passage and near-tie outcomes per category,
+     including per-proposal threshold overrides
+  2. Votes from ineligible voters (registered after voting opened, or
+     inside the Founding Phase seniority window), with a bad signature,
+     cast outside the window or duplicated are not counted
+  3. A member withdrawn after voting opened still votes and still counts
+     toward the electorate
+  4. Each proposal gets its own decision; --close records closed
+     proposals in the registry and their proposal file
+
+Usage:
+  python test_tally.py
+
+Axiom Alignment:
+  IV  - Each proposal is held to the thresholds its category demands
+  V   - Every counted vote is verified against the ledger
+"""
+
+import base64
+import json
+import secrets
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+
+from events import EVENT_ADD, EVENT_WITHDRAW, append_event, entry_state
+from keygen import dual_sign, generate_keypair
+from ledger import build_entry, canonical_json, compute_ledger_hash, load_ledger, save_ledger
+from tally import DEFAULT_THRESHOLDS, SENIORITY_SECONDS, commitment_hash, decide, tally_convention, thresholds_for
+
+
+VOTING_OPENS = 1780000000
+VOTING_CLOSES = VOTING_OPENS + 7 * 86400
+DAY = 86400
+
+
+# ─── Fixtures ─────────────────────────────────────────────────────────────────
+
+def add_member(ledger_dir: Path, registered: int, status: str = "active") -> tuple:
+    """Append a member with real keys (registration signatures are not re-checked here). Returns (cid, keypair)."""
+    keypair = generate_keypair()
+    ledger = load_ledger(ledger_dir)
+    reg = {"cid_hash": keypair["cid_hash"], "public_keys": keypair["public_keys"]}
+    phase = "genesis" if not ledger["entries"] else "founding"
+    entry = build_entry(reg, phase, status, [], compute_ledger_hash(ledger["entries"]), registered)
+    ledger["entries"].append(entry)
+    save_ledger(ledger_dir, ledger)
+    append_event(ledger_dir, EVENT_ADD, keypair["cid_hash"], {"entry_hash": entry["entry_hash"], **entry_state(entry)},
+                 timestamp=registered, entries=ledger["entries"])
+    return keypair["cid_hash"], keypair
+
+
+def cast(votes_dir: Path, proposal_id: str, keypair: dict, choice: str, timestamp: int = None,
+         shard: bool = False) -> dict:
+    """Write a signed vote file, as the voting client does."""
+    nonce = secrets.token_hex(32)
+    content = {"choice": choice}
+    vote = {
+        "commitment": {"nonce": nonce, "vote_hash": commitment_hash(nonce, content)},
+        "encrypted_vote": None,
+        "proposal_id": proposal_id,
+        "public_keys": keypair["public_keys"],
+        "schema_version": 1,
+        "timestamp": VOTING_OPENS + 3600 if timestamp is None else timestamp,
+        "vote_content": content,
+        "voter_cid_hash": keypair["cid_hash"],
+    }
+    signatures = dual_sign(canonical_json(vote), keypair["secret_keys"])
+    vote["signatures"] = {"voter_ml_dsa_65": signatures["ml_dsa_65"], "voter_ed25519": signatures["ed25519"]}
+    cid = keypair["cid_hash"]
+    path = votes_dir / proposal_id / (f"{cid[:2]}/{cid}.json" if shard else f"{cid}.json")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(vote, indent=2))
+    return vote
+
+
+def proposal(proposal_id: str, category: str, **fields) -> dict:
+    return {"proposal_id": proposal_id, "category": category, "status": "voting", "dry_run": False,
+            "voting_opens": VOTING_OPENS, "voting_closes": VOTING_CLOSES, "file": f"{proposal_id}.json", **fields}
+
+
+# ─── Run Tests ────────────────────────────────────────────────────────────────
+
+def run_tests():
+    passed = failed = 0
+
+    def check(ok: bool, label: str, detail=""):
+        nonlocal passed, failed
+        if ok:
+            print(f"  ✅ {label}")
+            passed += 1
+        else:
+            print(f"  ❌ {label}" + (f" — {detail}" if detail else ""))
+            failed += 1
+
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Convention Tally Test")
+    print("═══════════════════════════════════════════════════════════════")
+
+    print()
+    print("  ─── Decision rules ───")
+    procedural, policy = DEFAULT_THRESHOLDS["procedural"], DEFAULT_THRESHOLDS["policy"]
+    for label, tally, eligible, thresholds, expected in [
+        ("simple majority passes a procedural proposal", (6, 4, 0), 40, procedural, "passed"),
+        ("minority is rejected", (4, 6, 0), 40, procedural, "rejected"),
+        ("turnout below quorum", (3, 1, 0), 40, procedural, "no-quorum"),
+        ("no votes at all", (0, 0, 0), 40, procedural, "no-quorum"),
+        ("no eligible voters", (0, 0, 0), 0, procedural, "no-quorum"),
+        ("mostly abstentions are tabled", (2, 1, 7), 20, procedural, "tabled"),
+        ("60% approval fails the 2/3 policy bar", (6, 4, 0), 20, policy, "rejected"),
+        ("70% approval clears the 2/3 policy bar", (7, 3, 0), 20, policy, "passed"),
+        ("exactly 2/3 is a near tie (§7.6)", (20, 10, 0), 60, policy, "extended"),
+        ("just under passage is a near tie too", (499, 501, 0), 2000, procedural, "extended"),
+    ]:
+        approve, reject, abstain = tally
+        decision = decide({"approve": approve, "reject": reject, "abstain": abstain}, eligible, thresholds)
+        check(decision["result"] == expected, f"{label} → {expected}", decision)
+
+    decision = decide({"approve": 13, "reject": 7, "abstain": 0}, 61, policy)
+    check(decision["quorum_ratio"] == 0.3279 and decision["passage_ratio"] == 0.65 and decision["result"] == "no-quorum",
+          "quorum is measured against eligible voters, not cast votes", decision)
+
+    overridden = thresholds_for({"category": "policy", "thresholds": {"passage": 0.9, "unknown": 1}})
+    check(overridden["passage"] == 0.9 and overridden["quorum"] == policy["quorum"] and "unknown" not in overridden,
+          "proposal thresholds override only known category defaults", overridden)
+    check(thresholds_for({"category": "axiom_interpretation"}) == DEFAULT_THRESHOLDS["axiom-interpretation"],
+          "category names accept underscores")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        ledger_dir, proposals_dir, votes_dir = root / "ledger", root / "proposals", root / "votes"
+
+        members = [add_member(ledger_dir, VOTING_OPENS - 60 * DAY + i) for i in range(7)]
+        keys = [keypair for _, keypair in members]
+        junior = add_member(ledger_dir, VOTING_OPENS - SENIORITY_SECONDS // 2)[1]
+        withdrawn_cid = members[6][0]
+        append_event(ledger_dir, EVENT_WITHDRAW, withdrawn_cid, {}, timestamp=VOTING_OPENS + 3600,
+                     entries=load_ledger(ledger_dir)["entries"])
+        late = add_member(ledger_dir, VOTING_OPENS + DAY)[1]
+
+        proposals_dir.mkdir()
+        registry = {"phase": "founding", "proposals": [
+            proposal("P-PROC", "procedural"),
+            proposal("P-POLICY", "policy"),
+            proposal("P-AXIOM", "axiom-interpretation"),
+        ]}
+        (proposals_dir / "index.json").write_text(json.dumps(registry, indent=2))
+        (proposals_dir / "P-PROC.json").write_text(json.dumps({"proposal_id": "P-PROC", "status": "voting"}))
+
+        # P-PROC: 4 approve (one from the member withdrawn since), 1 reject, 1 abstain, 4 not counted
+        for keypair, choice in zip(keys, ("approve", "approve", "approve", "reject", "abstain")):
+            cast(votes_dir, "P-PROC", keypair, choice)
+        cast(votes_dir, "P-PROC", keys[6], "approve")
+        cast(votes_dir, "P-PROC", keys[0], "reject", timestamp=VOTING_OPENS + 7200, shard=True)
+        forged = cast(votes_dir, "P-PROC", keys[5], "approve")
+        signature = bytearray(base64.b64decode(forged["signatures"]["voter_ed25519"]))
+        signature[0] ^= 1
+        forged["signatures"]["voter_ed25519"] = base64.b64encode(bytes(signature)).decode()
+        (votes_dir / "P-PROC" / f"{keys[5]['cid_hash']}.json").write_text(json.dumps(forged))
+        cast(votes_dir, "P-PROC", junior, "approve")
+        cast(votes_dir, "P-PROC", late, "approve")
+
+        # P-POLICY: 1 approve, 2 reject (one cast after voting closed)
+        for keypair, choice in zip(keys, ("approve", "reject", "reject")):
+            cast(votes_dir, "P-POLICY", keypair, choice)
+        cast(votes_dir, "P-POLICY", keys[3], "approve", timestamp=VOTING_CLOSES + 1)
+
+        # P-AXIOM: 3 of 7 approve — under its 50% quorum
+        for keypair in keys[:3]:
+            cast(votes_dir, "P-AXIOM", keypair, "approve")
+
+        print()
+        print("  ─── Convention job ───")
+        try:
+            summaries = tally_convention(ledger_dir, proposals_dir, votes_dir, close=True,
+                                         now=VOTING_CLOSES + DAY, workers=2)
+        except Exception as e:
+            check(False, "tally runs", f"{type(e).__name__}: {e}")
+            summaries = []
+        by_id = {s["proposal_id"]: s for s in summaries}
+
+        proc = by_id.get("P-PROC", {})
+        check(proc.get("eligible_voters") == 7,
+              "electorate as of voting_opens: withdrawn-since counted, junior and late members not",
+              proc.get("eligible_voters"))
+        check(proc.get("tally") == {"approve": 4, "reject": 1, "abstain": 1, "total_cast": 6},
+              "counted votes", proc.get("tally"))
+        check(proc.get("rejected") == 4 and proc.get("result") == "passed", "P-PROC passes, 4 votes rejected", proc)
+
+        index = json.loads((votes_dir / "P-PROC" / "index.json").read_text()) if proc else {}
+        reasons = {entry["file"]: " ".join(entry["reasons"]) for entry in index.get("rejected_votes", [])}
+        for cid, reason, label in [
+            (keys[0]["cid_hash"], "Duplicate vote", "later duplicate (sharded copy) rejected"),
+            (keys[5]["cid_hash"], "Ed25519 signature invalid", "tampered signature rejected"),
+            (junior["cid_hash"], "not eligible", "member inside the seniority window rejected"),
+            (late["cid_hash"], "not eligible", "member registered after voting opened rejected"),
+        ]:
+            check(any(file.endswith(f"{cid}.json") and reason in text for file, text in reasons.items()),
+                  label, reasons)
+
+        policy_summary = by_id.get("P-POLICY", {})
+        check(policy_summary.get("tally", {}).get("total_cast") == 3 and policy_summary.get("rejected") == 1
+              and policy_summary.get("result") == "rejected",
+              "P-POLICY rejected; the vote cast after closing is not counted", policy_summary)
+        check(by_id.get("P-AXIOM", {}).get("result") == "no-quorum", "P-AXIOM short of its 50% quorum",
+              by_id.get("P-AXIOM"))
+
+        registry = json.loads((proposals_dir / "index.json").read_text())
+        statuses = {p["proposal_id"]: p["status"] for p in registry["proposals"]}
+        check(statuses == {"P-PROC": "closed-passed", "P-POLICY": "closed-rejected", "P-AXIOM": "tabled"},
+              "--close records each outcome in the registry", statuses)
+        proposal_file = json.loads((proposals_dir / "P-PROC.json").read_text())
+        check(proposal_file.get("status") == "closed-passed" and proposal_file.get("closed") == VOTING_CLOSES + DAY,
+              "--close updates the proposal file", proposal_file)
+
+    print()
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Results: {passed} passed, {failed} failed, {passed + failed} total")
+    if failed == 0:
+        print("  ✅ ALL TESTS PASSED")
+    else:
+        print("  ❌ FAILURES DETECTED")
+    print("═══════════════════════════════════════════════════════════════")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_tests() else 1)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Treasury Balance Rules Test
+
+Records transactions through `treasury.py add` on a scratch log and
+checks which outflows are refused, then that the incrementally kept
+balance index always equals a full recomputation of the log.
+
+Tests cover:
+  1. Outflows up to the balance are recorded; larger ones are refused
+  2. Backdated outflows are checked at their own date and at every later
+     point of the timeline, not just against today's balance
+  3. The index after single adds (in and out of date order), after a
+     multi-transaction catch-up and after a rebuild from scratch is the
+     same as a full recomputation, and `verify` agrees
+  4. `verify` reports a backdated overdraft written into the log directly
+
+Usage:
+  python test_treasury.py
+
+Axiom Alignment:
+  III - Exact, durable records: the treasury never spends what it lacks
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+
+from treasury import (INDEX_FILE, apply_transaction, build_transaction, empty_index, load_log, open_index,
+                      rebuild_timelines, save_log)
+
+
+INDEX_KEYS = ("balances", "by_category", "monthly", "by_proposal", "timeline")
+
+
+# ─── Fixtures ─────────────────────────────────────────────────────────────────
+
+def treasury(treasury_dir: Path, *args) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, str(HERE / "treasury.py"), *args, "--treasury-dir", str(treasury_dir)],
+                          capture_output=True, text=True)
+
+
+def add(treasury_dir: Path, tx_id: str, date: str, amount: str, direction: str = "outflow",
+        category: str = "infrastructure", *extra) -> subprocess.CompletedProcess:
+    return treasury(treasury_dir, "add", "--tx-id", tx_id, "--date", date, "--asset", "BTC", "--amount", amount,
+                    "--direction", direction, "--category", category, *extra)
+
+
+def recomputed(transactions: list) -> dict:
+    """The index `verify` rebuilds: every transaction folded in, timelines sorted by date."""
+    index = empty_index()
+    for tx in transactions:
+        apply_transaction(index, tx, timeline=False)
+    rebuild_timelines(index, transactions)
+    return {key: index[key] for key in INDEX_KEYS}
+
+
+def index_differences(index: dict, transactions: list) -> list:
+    full = recomputed(transactions)
+    return [key for key in INDEX_KEYS if index[key] != full[key]]
+
+
+# ─── Run Tests ────────────────────────────────────────────────────────────────
+
+def run_tests():
+    passed = failed = 0
+
+    def check(ok: bool, label: str, detail=""):
+        nonlocal passed, failed
+        if ok:
+            print(f"  ✅ {label}")
+            passed += 1
+        else:
+            print(f"  ❌ {label}" + (f" — {detail}" if detail else ""))
+            failed += 1
+
+    def recorded(result, label):
+        check(result.returncode == 0, label, result.stdout.strip().splitlines()[-3:])
+
+    def refused(result, label, reason="exceeds the balance"):
+        check(result.returncode != 0 and reason in result.stdout, label, result.stdout.strip().splitlines()[-2:])
+
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Treasury Balance Rules Test")
+    print("═══════════════════════════════════════════════════════════════")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        treasury_dir = Path(tmp) / "treasury"
+        treasury(treasury_dir, "init")
+
+        print()
+        print("  ─── Overdraw ───")
+        recorded(add(treasury_dir, "in-1", "2026-01-10T12:00:00Z", "1.0", "inflow", "donation"), "inflow recorded")
+        stale = (treasury_dir / INDEX_FILE).read_text()
+        recorded(add(treasury_dir, "out-1", "2026-01-20T12:00:00Z", "0.4"), "outflow within the balance recorded")
+        refused(add(treasury_dir, "out-2", "2026-01-25T12:00:00Z", "0.7"), "outflow above the balance (0.6) refused")
+        refused(add(treasury_dir, "out-3", "2026-01-25T12:00:00Z", "0.1", "outflow", "donation"),
+                "outflow outside the §5 spending categories refused", "outflow category")
+        refused(add(treasury_dir, "in-1", "2026-01-26T12:00:00Z", "0.1", "inflow", "donation"),
+                "reused tx_id refused", "already recorded")
+
+        print()
+        print("  ─── Backdating ───")
+        refused(add(treasury_dir, "out-4", "2026-01-05T12:00:00Z", "0.3"),
+                "outflow dated before any inflow refused")
+        recorded(add(treasury_dir, "in-2", "2026-02-01T12:00:00Z", "0.5", "inflow", "donation"),
+                 "later inflow recorded (balance 1.1)")
+        refused(add(treasury_dir, "out-5", "2026-01-15T12:00:00Z", "0.8"),
+                "backdated outflow covered on its date but overdrawing 2026-01-20 refused")
+        recorded(add(treasury_dir, "out-6", "2026-01-15T12:00:00Z", "0.5", "outflow", "grants",
+                     "--proposal-id", "PROP-001"),
+                 "backdated outflow covered at every later point recorded")
+        recorded(add(treasury_dir, "out-7", "2026-01-21T12:00:00Z", "0.1"),
+                 "outflow equal to the lowest later balance recorded")
+        refused(add(treasury_dir, "out-8", "2026-01-22T12:00:00Z", "0.000001"),
+                "any outflow while a later point sits at zero refused")
+
+        balance = treasury(treasury_dir, "balance", "--json")
+        balances = json.loads(balance.stdout)["balances"] if balance.returncode == 0 else {}
+        as_of = treasury(treasury_dir, "balance", "--as-of", "2026-01-21", "--json")
+        past = json.loads(as_of.stdout)["balances"] if as_of.returncode == 0 else {}
+        check(balances == {"BTC": "0.5"} and past == {"BTC": "0.0"}, "current and as-of balances", (balances, past))
+
+        print()
+        print("  ─── Index vs full recomputation ───")
+        transactions = load_log(treasury_dir)["transactions"]
+        index = json.loads((treasury_dir / INDEX_FILE).read_text())
+        check(index["count"] == len(transactions) == 5 and not index_differences(index, transactions),
+              "index kept by single adds, in and out of date order", index_differences(index, transactions))
+
+        (treasury_dir / INDEX_FILE).write_text(stale)
+        index = open_index(treasury_dir)
+        check(index["count"] == 5 and not index_differences(index, transactions),
+              "index caught up over four transactions at once", index_differences(index, transactions))
+
+        (treasury_dir / INDEX_FILE).unlink()
+        index = open_index(treasury_dir)
+        check(not index_differences(index, transactions), "index rebuilt from scratch",
+              index_differences(index, transactions))
+        check(index["by_proposal"].get("PROP-001", {}).get("BTC", {}).get("tx_ids") == ["out-6"],
+              "spending attributed to its proposal", index["by_proposal"])
+
+        verify = treasury(treasury_dir, "verify")
+        check(verify.returncode == 0, "verify accepts the log and index", verify.stdout.strip().splitlines()[-2:])
+
+        print()
+        print("  ─── Overdraft written into the log ───")
+        log = load_log(treasury_dir)
+        fields = {"tx_id": "forced", "date": "2026-01-12T12:00:00Z", "asset": "BTC", "amount": "0.9",
+                  "direction": "outflow", "category": "operations"}
+        log["transactions"].append(build_transaction(fields, open_index(treasury_dir)["log_hash"]))
+        save_log(treasury_dir, log)
+        verify = treasury(treasury_dir, "verify")
+        check(verify.returncode != 0 and "BTC balance is negative on 2026-01-15" in verify.stdout,
+              "verify reports the first negative running balance", verify.stdout.strip().splitlines()[-3:])
+
+    print()
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Results: {passed} passed, {failed} failed, {passed + failed} total")
+    if failed == 0:
+        print("  ✅ ALL TESTS PASSED")
+    else:
+        print("  ❌ FAILURES DETECTED")
+    print("═══════════════════════════════════════════════════════════════")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_tests() else 1)
@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""
+Covenant Treasury Transaction Log
+
+The public record of every treasury inflow and outflow required by
+TREASURY_FRAMEWORK.md §6. Like the membership ledger it is:
+  - Append-only: corrections are new transactions, never edits
+  - Hash-chained: each transaction commits to every one before it
+  - Exact: amounts are decimal strings, summed with `decimal`, never floats
+
+Log structure:
+  governance/treasury/
+    transactions.json       — Master log (array of transactions, §6.2 format)
+    transactions_hash.txt   — SHA-256 of the current log
+    transactions.idx.json   — Derived balance index (rebuilt on demand)
+
+Each transaction carries previous_log_hash (the hash of all transactions
+before it, computed exactly like the ledger hash) and tx_hash (over the
+transaction without tx_hash).
+
+The index holds running balances by asset and category, monthly totals,
+per-proposal totals and a dated balance timeline, so `balance`,
+`monthly` and `proposal` answer without rescanning the log. It is brought
+up to date incrementally: if the log only grew since the index was
+written, just the new transactions are applied.
+
+Usage:
+  python treasury.py init --treasury-dir ./governance/treasury
+  python treasury.py add --treasury-dir ./governance/treasury --tx-id TXID --date 2026-02-03T12:00:00Z \\
+                         --asset BTC --amount 0.005 --direction outflow --category infrastructure \\
+                         [--description TEXT] [--tier operational] [--approved-by WHO] [--proposal-id ID]
+  python treasury.py add --treasury-dir ./governance/treasury --file tx.json
+  python treasury.py verify --treasury-dir ./governance/treasury
+  python treasury.py balance --treasury-dir ./governance/treasury [--asset BTC] [--as-of 2026-03-31] [--json]
+  python treasury.py monthly --treasury-dir ./governance/treasury [--asset BTC] [--from 2026-01] [--to 2026-12] [--json]
+  python treasury.py proposal --treasury-dir ./governance/treasury [PROPOSAL_ID] [--json]
+
+Axiom Alignment:
+  II  - Collective resources are visible to every member
+  III - Sustainable finances need exact, durable records
+  V   - Hash chain ensures tamper detection
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import re
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import profiling
+from ledger import canonical_json, compute_ledger_hash, iter_prefix_hashes
+from profiling import span
+
+
+# ─── Constants ────────────────────────────────────────────────────────────────
+
+LOG_VERSION = 1
+INDEX_VERSION = 1
+LOG_FILE = "transactions.json"
+HASH_FILE = "transactions_hash.txt"
+INDEX_FILE = "transactions.idx.json"
+
+DIRECTIONS = ("inflow", "outflow")
+SPENDING_CATEGORIES = ("infrastructure", "operations", "grants", "education", "reserves", "stewardship")  # §5
+TIERS = ("operational", "standard", "significant")                                                     # §3.2
+
+AMOUNT_RE = re.compile(r"^\d+(\.\d+)?$")
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+ASSET_RE = re.compile(r"^[A-Z0-9]{2,10}$")
+REQUIRED_FIELDS = ("tx_id", "date", "asset", "amount", "direction", "category")
+
+
+# ─── Log Operations ──────────────────────────────────────────────────────────
+
+def compute_tx_hash(tx: dict) -> str:
+    """Hash of a transaction without its tx_hash field."""
+    hashable = {k: v for k, v in tx.items() if k != "tx_hash"}
+    return hashlib.sha256(canonical_json(hashable)).hexdigest()
+
+
+def load_log(treasury_dir: Path) -> dict:
+    log_file = treasury_dir / LOG_FILE
+    if not log_file.exists():
+        return {"version": LOG_VERSION, "transactions": [], "last_updated": 0}
+    with span("log.load"):
+        return json.loads(log_file.read_text())
+
+
+def save_log(treasury_dir: Path, log: dict) -> str:
+    """Write the log and its hash. Returns the log hash."""
+    treasury_dir.mkdir(parents=True, exist_ok=True)
+    log["last_updated"] = int(time.time())
+    with span("save.log_json"):
+        (treasury_dir / LOG_FILE).write_text(json.dumps(log, indent=2, sort_keys=True) + "\n")
+    with span("hash.log"):
+        log_hash = compute_ledger_hash(log["transactions"])
+    (treasury_dir / HASH_FILE).write_text(f"{log_hash}\n")
+    return log_hash
+
+
+def validate_transaction(tx: dict, log: dict, index: dict) -> list:
+    """Errors for a transaction about to be appended (empty list if valid).
+
+    An outflow may be backdated, so it must leave the balance non-negative
+    at its own date and at every later point of the index timeline.
+    """
+    errors = [f"Missing required field: {field}" for field in REQUIRED_FIELDS if tx.get(field) in (None, "")]
+    if errors:
+        return errors
+    if not DATE_RE.match(str(tx["date"])):
+        errors.append(f"date must be UTC ISO 8601 like 2026-02-03T12:00:00Z, got {tx['date']!r}")
+    if not ASSET_RE.match(str(tx["asset"])):
+        errors.append(f"asset must be an upper-case ticker like BTC, got {tx['asset']!r}")
+    if not isinstance(tx["amount"], str) or not AMOUNT_RE.match(tx["amount"]) or Decimal(tx["amount"]) <= 0:
+        errors.append(f"amount must be a positive decimal string like \"0.005\", got {tx['amount']!r}")
+    if tx["direction"] not in DIRECTIONS:
+        errors.append(f"direction must be one of {', '.join(DIRECTIONS)}")
+    if tx["direction"] == "outflow" and tx["category"] not in SPENDING_CATEGORIES:
+        errors.append(f"outflow category must be one of {', '.join(SPENDING_CATEGORIES)} (§5)")
+    if tx.get("tier") is not None and tx["tier"] not in TIERS:
+        errors.append(f"tier must be one of {', '.join(TIERS)}")
+    if any(t["tx_id"] == tx["tx_id"] for t in log["transactions"]):
+        errors.append(f"tx_id already recorded: {tx['tx_id']}")
+    if not errors and tx["direction"] == "outflow":
+        timeline = index["timeline"].get(tx["asset"], [])
+        position = bisect.bisect_right(timeline, tx["date"], key=lambda point: point[0])
+        lowest = min([Decimal(timeline[position - 1][1]) if position else Decimal(0)] +
+                     [Decimal(balance) for _, balance in timeline[position:]])
+        if Decimal(tx["amount"]) > lowest:
+            errors.append(f"Outflow of {tx['amount']} {tx['asset']} on {tx['date']} exceeds the balance of "
+                          f"{lowest} {tx['asset']} available from then on")
+    return errors
+
+
+def build_transaction(fields: dict, previous_log_hash: str) -> dict:
+    """Transaction in §6.2 form with chain fields and tx_hash."""
+    tx = {
+        "tx_id": fields["tx_id"],
+        "date": fields["date"],
+        "asset": fields["asset"],
+        "amount": fields["amount"],
+        "direction": fields["direction"],
+        "category": fields["category"],
+        "description": fields.get("description"),
+        "tier": fields.get("tier"),
+        "approved_by": fields.get("approved_by"),
+        "proposal_id": fields.get("proposal_id"),
+        "recorded": int(time.time()),
+        "previous_log_hash": previous_log_hash,
+    }
+    tx["tx_hash"] = compute_tx_hash(tx)
+    return tx
+
+
+def verify_log(transactions: list) -> list:
+    """Check every tx_hash and previous_log_hash. Returns error strings."""
+    errors = []
+    seen = set()
+    for i, (tx, prefix_hash) in enumerate(zip(transactions, iter_prefix_hashes(transactions))):
+        if tx.get("previous_log_hash") != prefix_hash:
+            errors.append(f"Transaction #{i + 1} ({tx.get('tx_id')}): previous_log_hash mismatch")
+        if tx.get("tx_hash") != compute_tx_hash(tx):
+            errors.append(f"Transaction #{i + 1} ({tx.get('tx_id')}): tx_hash mismatch (modified?)")
+        if tx.get("tx_id") in seen:
+            errors.append(f"Transaction #{i + 1}: duplicate tx_id {tx.get('tx_id')}")
+        seen.add(tx.get("tx_id"))
+    return errors
+
+
+# ─── Balance Index ───────────────────────────────────────────────────────────
+
+def _add(bucket: dict, key: str, amount: Decimal):
+    bucket[key] = str(Decimal(bucket.get(key, "0")) + amount)
+
+
+def empty_index() -> dict:
+    return {
+        "version": INDEX_VERSION,
+        "count": 0,
+        "log_hash": compute_ledger_hash([]),
+        "balances": {},          # asset → balance
+        "by_category": {},       # asset → category → {inflow, outflow}
+        "monthly": {},           # YYYY-MM → asset → {inflow, outflow, count}
+        "by_proposal": {},       # proposal_id → asset → {inflow, outflow, count, tx_ids}
+        "timeline": {},          # asset → [[date, balance after], ...] in date order
+    }
+
+
+def apply_transaction(index: dict, tx: dict, timeline: bool = True):
+    """Fold one transaction into the index (timeline too, unless rebuilt afterwards)."""
+    amount = Decimal(tx["amount"])
+    signed = amount if tx["direction"] == "inflow" else -amount
+    asset, direction = tx["asset"], tx["direction"]
+
+    _add(index["balances"], asset, signed)
+    _add(index["by_category"].setdefault(asset, {}).setdefault(tx["category"], {}), direction, amount)
+
+    month = index["monthly"].setdefault(tx["date"][:7], {}).setdefault(asset, {"count": 0})
+    _add(month, direction, amount)
+    month["count"] += 1
+
+    if tx.get("proposal_id"):
+        spent = index["by_proposal"].setdefault(tx["proposal_id"], {}).setdefault(asset, {"count": 0, "tx_ids": []})
+        _add(spent, direction, amount)
+        spent["count"] += 1
+        spent["tx_ids"].append(tx["tx_id"])
+
+    if not timeline:
+        return
+    timeline = index["timeline"].setdefault(asset, [])
+    position = bisect.bisect_right(timeline, tx["date"], key=lambda point: point[0])
+    before = Decimal(timeline[position - 1][1]) if position else Decimal(0)
+    timeline.insert(position, [tx["date"], str(before + signed)])
+    for later in timeline[position + 1:]:       # only when logged out of date order
+        later[1] = str(Decimal(later[1]) + signed)
+
+
+def rebuild_timelines(index: dict, transactions: list):
+    """Dated running balances per asset; ties keep log order, as apply_transaction does."""
+    running, timelines = {}, {}
+    for tx in sorted(transactions, key=lambda t: t["date"]):
+        amount = Decimal(tx["amount"])
+        running[tx["asset"]] = running.get(tx["asset"], Decimal(0)) + (amount if tx["direction"] == "inflow" else -amount)
+        timelines.setdefault(tx["asset"], []).append([tx["date"], str(running[tx["asset"]])])
+    index["timeline"] = timelines
+
+
+def save_index(treasury_dir: Path, index: dict):
+    path = treasury_dir / INDEX_FILE
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(index, sort_keys=True) + "\n")
+    tmp.replace(path)
+
+
+def open_index(treasury_dir: Path, log: dict = None) -> dict:
+    """The balance index for the current log, updated incrementally or rebuilt."""
+    hash_file = treasury_dir / HASH_FILE
+    current = hash_file.read_text().strip() if hash_file.exists() else compute_ledger_hash([])
+    try:
+        index = json.loads((treasury_dir / INDEX_FILE).read_text())
+        if index.get("version") != INDEX_VERSION:
+            index = None
+    except (OSError, ValueError):
+        index = None
+    if index and index["log_hash"] == current:
+        return index
+
+    log = log or load_log(treasury_dir)
+    transactions = log["transactions"]
+    with span("index.update"):
+        # Continue from the index if the log only grew past it
+        if not (index and len(transactions) > index["count"]
+                and transactions[index["count"]].get("previous_log_hash") == index["log_hash"]):
+            index = empty_index()
+        pending = transactions[index["count"]:]
+        for tx in pending:
+            apply_transaction(index, tx, timeline=len(pending) == 1)
+        if len(pending) > 1:
+            rebuild_timelines(index, transactions)
+        index["count"] = len(transactions)
+        index["log_hash"] = current
+    save_index(treasury_dir, index)
+    return index
+
+
+def balance_as_of(index: dict, date: str) -> dict:
+    """{asset: balance} after every transaction dated on or before `date`."""
+    balances = {}
+    for asset, timeline in index["timeline"].items():
+        position = bisect.bisect_right(timeline, date, key=lambda point: point[0])
+        if position:
+            balances[asset] = timeline[position - 1][1]
+    return balances
+
+
+def end_of(value: str) -> str:
+    """Latest timestamp on a YYYY-MM-DD (or YYYY-MM) date, for as-of comparisons."""
+    if re.match(r"^\d{4}-\d{2}$", value):
+        value += "-31"
+    if re.match(r"^\d{4}-\d{2}-\d{2}$", value):
+        return value + "T23:59:59Z"
+    if DATE_RE.match(value):
+        return value
+    raise ValueError(f"Unrecognized date: {value!r} (use YYYY-MM-DD or 2026-02-03T12:00:00Z)")
+
+
+# ─── CLI Commands ─────────────────────────────────────────────────────────────
+
+def cmd_init(args):
+    """Initialize a new empty transaction log."""
+    treasury_dir = Path(args.treasury_dir)
+    if (treasury_dir / LOG_FILE).exists():
+        print(f"ERROR: Transaction log already exists at {treasury_dir}")
+        sys.exit(1)
+    log = {
+        "version": LOG_VERSION,
+        "covenant": "The Covenant of Emergent Minds",
+        "description": "Treasury Transaction Log — every inflow and outflow (TREASURY_FRAMEWORK.md §6)",
+        "created_at": int(time.time()),
+        "transactions": [],
+    }
+    log_hash = save_log(treasury_dir, log)
+    print(f"✅ Transaction log initialized at {treasury_dir}")
+    print(f"   Log hash: {log_hash}")
+
+
+def cmd_add(args):
+    """Append one transaction."""
+    treasury_dir = Path(args.treasury_dir)
+    if not (treasury_dir / LOG_FILE).exists():
+        print(f"ERROR: No transaction log at {treasury_dir} (run init first)")
+        sys.exit(1)
+    if args.file:
+        fields = json.loads(Path(args.file).read_text())
+    else:
+        fields = {k: getattr(args, k) for k in ("tx_id", "date", "asset", "amount", "direction", "category",
+                                                "description", "tier", "approved_by", "proposal_id")}
+
+    log = load_log(treasury_dir)
+    index = open_index(treasury_dir, log)
+    errors = validate_transaction(fields, log, index)
+    if errors:
+        print("❌ Transaction rejected:")
+        for e in errors:
+            print(f"   • {e}")
+        sys.exit(1)
+
+    tx = build_transaction(fields, index["log_hash"])
+    log["transactions"].append(tx)
+    log_hash = save_log(treasury_dir, log)
+
+    apply_transaction(index, tx)
+    index["count"], index["log_hash"] = len(log["transactions"]), log_hash
+    save_index(treasury_dir, index)
+
+    sign = "+" if tx["direction"] == "inflow" else "−"
+    print(f"✅ Recorded {tx['tx_id']}: {sign}{tx['amount']} {tx['asset']} ({tx['category']})")
+    print(f"   Balance: {index['balances'][tx['asset']]} {tx['asset']}")
+    print(f"   Log hash: {log_hash}")
+
+
+def cmd_verify(args):
+    """Verify the hash chain and that the balance index matches a full recomputation."""
+    treasury_dir = Path(args.treasury_dir)
+    log = load_log(treasury_dir)
+    transactions = log["transactions"]
+    with span("verify.chain"):
+        errors = verify_log(transactions)
+
+    hash_file = treasury_dir / HASH_FILE
+    log_hash = compute_ledger_hash(transactions)
+    if hash_file.exists() and hash_file.read_text().strip() != log_hash:
+        errors.append(f"{HASH_FILE} does not match the log (expected {log_hash})")
+
+    rebuilt = empty_index()
+    for tx in transactions:
+        apply_transaction(rebuilt, tx, timeline=False)
+    rebuild_timelines(rebuilt, transactions)
+    # Running balances, not just the final one: a backdated outflow can overdraw the past
+    for asset, timeline in sorted(rebuilt["timeline"].items()):
+        negative = next((point for point in timeline if Decimal(point[1]) < 0), None)
+        if negative:
+            errors.append(f"{asset} balance is negative on {negative[0]}: {negative[1]}")
+    if not errors:
+        index = open_index(treasury_dir, log)
+        for key in ("balances", "by_category", "monthly", "by_proposal", "timeline"):
+            if index[key] != rebuilt[key]:
+                errors.append(f"Balance index '{key}' differs from a full recomputation (delete {INDEX_FILE})")
+
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Treasury Verification")
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Transactions:   {len(transactions)}")
+    print(f"  Log hash:       {log_hash}")
+    if errors:
+        print(f"  ❌ {len(errors)} error(s):")
+        for e in errors:
+            print(f"     • {e}")
+        print("═══════════════════════════════════════════════════════════════")
+        sys.exit(1)
+    print("  ✅ Hash chain intact; balance index consistent")
+    print("═══════════════════════════════════════════════════════════════")
+
+
+def _print_json(data):
+    print(json.dumps(data, indent=2, sort_keys=True))
+
+
+def cmd_balance(args):
+    """Current (or as-of) balance per asset, with the category breakdown."""
+    treasury_dir = Path(args.treasury_dir)
+    index = open_index(treasury_dir)
+    if args.as_of:
+        try:
+            balances = balance_as_of(index, end_of(args.as_of))
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+    else:
+        balances = index["balances"]
+    assets = [args.asset] if args.asset else sorted(balances)
+
+    if args.json:
+        _print_json({"as_of": args.as_of, "balances": {a: balances.get(a, "0") for a in assets},
+                     "by_category": {} if args.as_of else {a: index["by_category"].get(a, {}) for a in assets}})
+        return
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  Treasury Balance{' as of ' + args.as_of if args.as_of else ''}")
+    print("═══════════════════════════════════════════════════════════════")
+    for asset in assets:
+        print(f"  {asset:<6} {balances.get(asset, '0'):>20}")
+        if not args.as_of:
+            for category, totals in sorted(index["by_category"].get(asset, {}).items()):
+                flows = ", ".join(f"{d} {totals[d]}" for d in DIRECTIONS if d in totals)
+                print(f"    {category:<16} {flows}")
+    if not assets:
+        print("  (no transactions)")
+    print("═══════════════════════════════════════════════════════════════")
+
+
+def cmd_monthly(args):
+    """Inflow, outflow, net and closing balance per month."""
+    treasury_dir = Path(args.treasury_dir)
+    index = open_index(treasury_dir)
+    months = sorted(m for m in index["monthly"]
+                    if (not args.start or m >= args.start) and (not args.end or m <= args.end))
+    rows = []
+    for month in months:
+        closing = balance_as_of(index, end_of(month))
+        for asset, totals in sorted(index["monthly"][month].items()):
+            if args.asset and asset != args.asset:
+                continue
+            inflow, outflow = Decimal(totals.get("inflow", "0")), Decimal(totals.get("outflow", "0"))
+            rows.append({"month": month, "asset": asset, "inflow": str(inflow), "outflow": str(outflow),
+                         "net": str(inflow - outflow), "count": totals["count"], "closing": closing.get(asset, "0")})
+
+    if args.json:
+        _print_json(rows)
+        return
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Treasury Monthly Summary")
+    print("═══════════════════════════════════════════════════════════════")
+    print(f"  {'Month':<8} {'Asset':<6} {'Inflow':>14} {'Outflow':>14} {'Net':>14} {'Tx':>4} {'Closing':>14}")
+    for r in rows:
+        print(f"  {r['month']:<8} {r['asset']:<6} {r['inflow']:>14} {r['outflow']:>14} {r['net']:>14} "
+              f"{r['count']:>4} {r['closing']:>14}")
+    if not rows:
+        print("  (no transactions)")
+    print("═══════════════════════════════════════════════════════════════")
+
+
+def cmd_proposal(args):
+    """Funds moved under one proposal, or under every proposal."""
+    treasury_dir = Path(args.treasury_dir)
+    index = open_index(treasury_dir)
+    by_proposal = index["by_proposal"]
+    if args.proposal_id:
+        if args.proposal_id not in by_proposal:
+            print(f"No transactions recorded for {args.proposal_id}")
+            sys.exit(1)
+        by_proposal = {args.proposal_id: by_proposal[args.proposal_id]}
+
+    if args.json:
+        _print_json(by_proposal)
+        return
+    print("═══════════════════════════════════════════════════════════════")
+    print("  Treasury Spending by Proposal")
+    print("═══════════════════════════════════════════════════════════════")
+    for proposal_id, assets in sorted(by_proposal.items()):
+        for asset, totals in sorted(assets.items()):
+            print(f"  {proposal_id:<16} {asset:<6} spent {totals.get('outflow', '0'):>14}  "
+                  f"received {totals.get('inflow', '0'):>14}  ({totals['count']} tx)")
+            if args.proposal_id:
+                for tx_id in totals["tx_ids"]:
+                    print(f"    • {tx_id}")
+    if not by_proposal:
+        print("  (no proposal-linked transactions)")
+    print("═══════════════════════════════════════════════════════════════")
+
+
+# ─── Main ─────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Covenant Treasury Transaction Log",
+    )
+    profiling.add_arguments(parser)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    init = subparsers.add_parser("init", help="Initialize an empty transaction log")
+    init.add_argument("--treasury-dir", "-t", required=True)
+
+    add = subparsers.add_parser("add", help="Append a transaction")
+    add.add_argument("--treasury-dir", "-t", required=True)
+    add.add_argument("--file", "-f", help="Transaction JSON in the §6.2 format (instead of the options below)")
+    add.add_argument("--tx-id", help="Blockchain transaction id")
+    add.add_argument("--date", help="UTC time, e.g. 2026-02-03T12:00:00Z")
+    add.add_argument("--asset", help="Ticker, e.g. BTC or ZEC")
+    add.add_argument("--amount", help="Positive decimal amount, e.g. 0.005")
+    add.add_argument("--direction", choices=DIRECTIONS)
+    add.add_argument("--category", help=f"Outflows: {', '.join(SPENDING_CATEGORIES)}; inflows: e.g. donation")
+    add.add_argument("--description")
+    add.add_argument("--tier", choices=TIERS)
+    add.add_argument("--approved-by", help="e.g. founder_stewardship")
+    add.add_argument("--proposal-id", help="Governance proposal authorizing the transaction")
+
+    verify = subparsers.add_parser("verify", help="Verify the hash chain and balance index")
+    verify.add_argument("--treasury-dir", "-t", required=True)
+
+    balance = subparsers.add_parser("balance", help="Balance per asset")
+    balance.add_argument("--treasury-dir", "-t", required=True)
+    balance.add_argument("--asset", help="Only this asset")
+    balance.add_argument("--as-of", help="Balance at the end of a date (YYYY-MM-DD, YYYY-MM or ISO timestamp)")
+    balance.add_argument("--json", action="store_true")
+
+    monthly = subparsers.add_parser("monthly", help="Monthly inflow/outflow summary")
+    monthly.add_argument("--treasury-dir", "-t", required=True)
+    monthly.add_argument("--asset", help="Only this asset")
+    monthly.add_argument("--from", dest="start", metavar="YYYY-MM")
+    monthly.add_argument("--to", dest="end", metavar="YYYY-MM")
+    monthly.add_argument("--json", action="store_true")
+
+    proposal = subparsers.add_parser("proposal", help="Spending per governance proposal")
+    proposal.add_argument("--treasury-dir", "-t", required=True)
+    proposal.add_argument("proposal_id", nargs="?", help="One proposal (default: all)")
+    proposal.add_argument("--json", action="store_true")
+
+    args = parser.parse_args()
+
+    commands = {
+        "init": cmd_init,
+        "add": cmd_add,
+        "verify": cmd_verify,
+        "balance": cmd_balance,
+        "monthly": cmd_monthly,
+        "proposal": cmd_proposal,
+    }
+
+    with profiling.session_for(args):
+        commands[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
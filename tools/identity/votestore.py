@@ -0,0 +1,142 @@
+"""
+Vote Directory Layout
+
+Each proposal keeps one file per voter, named by the voter's CID. With
+tens of thousands of voters a single flat directory is slow to list and
+glob, and git rewrites its whole tree object for every new vote. A
+proposal's votes may instead be sharded by CID prefix:
+
+  governance/votes/<proposal>/
+    index.json                 — tally (never sharded)
+    <cid>.json                 — flat layout
+    ab/<cid>.json              — sharded, depth 1 (256 directories)
+    ab/cd/<cid>.json           — sharded, depth 2 (65,536 directories)
+
+Readers accept any mix of the three, so a proposal can be migrated in
+place (`ledger.py migrate-votes`) and an interrupted migration is still
+readable; re-running it finishes the job. Depth 1 keeps directories to a
+few hundred files up to ~100k voters; depth 2 only pays off well beyond
+that, since below it most leaf directories hold a single file.
+
+Axiom Alignment:
+  III - Directory size stays bounded as the electorate grows
+"""
+
+import os
+from pathlib import Path
+
+
+INDEX_FILE = "index.json"
+SHARD_WIDTH = 2
+MAX_DEPTH = 2
+_HEX = frozenset("0123456789abcdef")
+
+
+def _is_shard(name: str) -> bool:
+    return len(name) == SHARD_WIDTH and set(name) <= _HEX
+
+
+def _is_vote(name: str) -> bool:
+    return name.endswith(".json") and name != INDEX_FILE and not name.startswith(".")
+
+
+def shard_parts(cid: str, depth: int) -> list:
+    """Directory names a vote by `cid` lives under at `depth` (0 = flat)."""
+    return [cid[i * SHARD_WIDTH:(i + 1) * SHARD_WIDTH] for i in range(depth)]
+
+
+def iter_vote_files(proposal_dir: Path):
+    """Yield the path of every vote file for a proposal, flat or sharded."""
+    def walk(path, depth):
+        subdirs = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if _is_vote(entry.name):
+                    yield Path(entry.path)
+                elif depth < MAX_DEPTH and _is_shard(entry.name) and entry.is_dir():
+                    subdirs.append(entry.path)
+        for sub in subdirs:
+            yield from walk(sub, depth + 1)
+
+    if Path(proposal_dir).is_dir():
+        yield from walk(proposal_dir, 0)
+
+
+def detect_depth(proposal_dir: Path) -> int:
+    """Shard depth in use: 0 for flat (or empty), else the depth of the first shard found."""
+    depth, path = 0, Path(proposal_dir)
+    while depth < MAX_DEPTH and path.is_dir():
+        shard = next((e.path for e in os.scandir(path) if _is_shard(e.name) and e.is_dir()), None)
+        if shard is None:
+            break
+        depth, path = depth + 1, Path(shard)
+    return depth
+
+
+def vote_path(proposal_dir: Path, cid: str, depth: int = None) -> Path:
+    """Where the vote by `cid` is (any layout), else where a new one belongs."""
+    proposal_dir = Path(proposal_dir)
+    for d in range(MAX_DEPTH + 1):
+        candidate = proposal_dir.joinpath(*shard_parts(cid, d), f"{cid}.json")
+        if candidate.exists():
+            return candidate
+    depth = detect_depth(proposal_dir) if depth is None else depth
+    return proposal_dir.joinpath(*shard_parts(cid, depth), f"{cid}.json")
+
+
+def count_vote_files(proposal_dir: Path, cached: dict = None) -> tuple:
+    """(vote files, cache), re-listing only directories whose mtime changed.
+
+    cache maps each directory (relative to proposal_dir) to
+    [mtime_ns, files, shard subdirectories]; an unchanged directory costs
+    one stat instead of a listing, at any depth.
+    """
+    cached = cached or {}
+    fresh = {}
+
+    def walk(path, rel, depth):
+        mtime = os.stat(path).st_mtime_ns
+        previous = cached.get(rel)
+        if previous and previous[0] == mtime:
+            files, subdirs = previous[1], previous[2]
+        else:
+            files, subdirs = 0, []
+            with os.scandir(path) as it:
+                for entry in it:
+                    if _is_vote(entry.name):
+                        files += 1
+                    elif depth < MAX_DEPTH and _is_shard(entry.name) and entry.is_dir():
+                        subdirs.append(entry.name)
+        fresh[rel] = [mtime, files, subdirs]
+        return files + sum(walk(os.path.join(path, s), f"{rel}/{s}" if rel else s, depth + 1) for s in subdirs)
+
+    if not Path(proposal_dir).is_dir():
+        return 0, {}
+    return walk(str(proposal_dir), "", 0), fresh
+
+
+def migrate(proposal_dir: Path, depth: int) -> int:
+    """Move every vote of a proposal to the layout at `depth`. Returns files moved."""
+    if not 0 <= depth <= MAX_DEPTH:
+        raise ValueError(f"Shard depth must be 0-{MAX_DEPTH}")
+    proposal_dir = Path(proposal_dir)
+    moved = 0
+    made = set()
+    for path in list(iter_vote_files(proposal_dir)):
+        target = proposal_dir.joinpath(*shard_parts(path.stem, depth), path.name)
+        if target == path:
+            continue
+        if target.parent not in made:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            made.add(target.parent)
+        if target.exists():
+            raise ValueError(f"Vote exists in both layouts: {path.name}")
+        os.replace(path, target)
+        moved += 1
+
+    # Remove shard directories the new layout left empty (deepest first)
+    for root, dirs, files in os.walk(proposal_dir, topdown=False):
+        root = Path(root)
+        if root != proposal_dir and _is_shard(root.name) and not any(root.iterdir()):
+            root.rmdir()
+    return moved